@@ -42,13 +42,14 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, pool=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        pool: Optional office_pool.OfficePool to validate on a warm soffice instance
 
     Returns:
         bool: True if successful, False if validation failed
@@ -80,15 +81,25 @@ def pack_document(input_dir, output_file, validate=False):
 
         # Validate if requested
         if validate:
-            if not validate_document(output_file):
+            if not validate_document(output_file, pool=pool):
                 output_file.unlink()  # Delete the corrupt file
                 return False
 
     return True
 
 
-def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+def validate_document(doc_path, pool=None, timeout=10):
+    """Validate document by converting to HTML with soffice.
+
+    Args:
+        doc_path: Path to the Office file
+        pool: Optional office_pool.OfficePool; if given, the conversion runs on a warm
+              instance instead of spawning a new soffice process
+        timeout: Seconds the conversion may take (default: 10)
+
+    Returns:
+        bool: True if the document converted successfully
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -99,6 +110,14 @@ def validate_document(doc_path):
             filter_name = "html:HTML (StarCalc)"
 
     with tempfile.TemporaryDirectory() as temp_dir:
+        if pool is not None:
+            try:
+                pool.convert(doc_path, temp_dir, filter_name, timeout=timeout)
+                return True
+            except RuntimeError as e:
+                print(f"Validation error: {e}", file=sys.stderr)
+                return False
+
         try:
             result = subprocess.run(
                 [
@@ -111,7 +130,7 @@ def validate_document(doc_path):
                     str(doc_path),
                 ],
                 capture_output=True,
-                timeout=10,
+                timeout=timeout,
                 text=True,
             )
             if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Apply the same edits to many Word documents across a pool of worker processes.
+
+Each input document gets its own Document session (with copy-on-write setup), the
+edits, one validation and a save. Workers compile the XSD schemas once at startup and
+keep them for every document they process, so per-document cost is dominated by the
+edits themselves rather than by schema loading.
+
+The edit script is either:
+    - a JSON file holding a list of edits for Document.apply_edits(), or
+    - a Python file defining `edit(doc, name)`, called with the Document session and
+      the document name
+
+Inputs are the .docx files and unpacked directories (containing word/document.xml)
+directly inside the input directory. Packed inputs are written to
+<output_dir>/<name>.docx, unpacked ones to <output_dir>/<name>/. Documents that fail
+validation are not written.
+
+One JSON result per document is printed as a line on stdout (and appended to
+--results if given) as soon as the document is done:
+    {"document": "nda-001.docx", "status": "ok", "validation": "passed",
+     "output": "out/nda-001.docx", "error": null, "messages": [],
+     "timings": {"unpack": 0.01, "setup": 0.01, "edit": 0.05, "validate": 0.21,
+                 "save": 0.0, "pack": 0.02, "total": 0.31}, "worker": 4242}
+
+Usage:
+    PYTHONPATH=/mnt/skills/docx python -m scripts.batch contracts/ edits.json out/ --jobs 8
+
+    # From Python
+    from scripts.batch import run_batch
+    for result in run_batch("contracts", "edits.py", "out", jobs=8):
+        print(result["document"], result["status"])
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from ooxml.scripts.pack import pack_document
+from ooxml.scripts.unpack import unpack_document
+from ooxml.scripts.validation.base import warm_schema_cache
+
+from .document import Document
+
+# Parts pretty-printed when unpacking a .docx input (as unpack.py would lay them out
+# for line-based anchors); the rest are extracted verbatim, which is much faster for
+# large parts such as styles.xml
+PRETTY_PARTS = ["word/document.xml"]
+
+# Per-process state set up by _init_worker()
+_worker = {}
+
+
+def find_documents(input_dir):
+    """List the .docx files and unpacked documents directly inside input_dir.
+
+    Returns:
+        list: Sorted paths of the documents found
+    """
+    documents = []
+    for path in sorted(Path(input_dir).iterdir()):
+        if path.is_file() and path.suffix.lower() == ".docx":
+            documents.append(path)
+        elif path.is_dir() and (path / "word" / "document.xml").is_file():
+            documents.append(path)
+    return documents
+
+
+def load_edit_script(edit_script):
+    """Load an edit script into a callable(doc, name).
+
+    Args:
+        edit_script: Path to a JSON list of apply_edits() edits, or to a Python file
+                     defining edit(doc, name)
+
+    Returns:
+        callable: Function applying the edits to a Document session
+
+    Raises:
+        ValueError: If the script is neither a JSON edit list nor defines edit()
+    """
+    edit_script = Path(edit_script)
+    if edit_script.suffix.lower() == ".json":
+        edits = json.loads(edit_script.read_text(encoding="utf-8"))
+        if not isinstance(edits, list):
+            raise ValueError(f"{edit_script} must contain a list of edits")
+
+        def apply(doc, name):
+            # Validation is run (and timed) separately by the runner
+            doc.apply_edits(edits, validate=False)
+
+        return apply
+
+    spec = importlib.util.spec_from_file_location("batch_edit_script", edit_script)
+    if spec is None:
+        raise ValueError(f"Edit script must be a .json or .py file: {edit_script}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not callable(getattr(module, "edit", None)):
+        raise ValueError(f"{edit_script} must define edit(doc, name)")
+    return module.edit
+
+
+def run_batch(
+    input_dir, edit_script, output_dir, jobs=None, validate=True, document_kwargs=None
+):
+    """Apply an edit script to every document in input_dir using a process pool.
+
+    Args:
+        input_dir: Directory containing .docx files and/or unpacked documents
+        edit_script: JSON edit list or Python file defining edit(doc, name)
+        output_dir: Directory for the edited documents (created if missing)
+        jobs: Number of worker processes (default: os.cpu_count())
+        validate: If True, validate each document before writing it (default: True)
+        document_kwargs: Extra keyword arguments for Document (author, engine, ...)
+
+    Yields:
+        dict: One result per document, in completion order
+    """
+    documents = find_documents(input_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    options = {"validate": validate, "document_kwargs": document_kwargs or {}}
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(str(edit_script), options),
+    ) as executor:
+        futures = {
+            executor.submit(_process_document, str(path), str(output_dir)): path
+            for path in documents
+        }
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _init_worker(edit_script, options):
+    """Load the edit script and compile the schemas once per worker process."""
+    _worker["edit"] = load_edit_script(edit_script)
+    _worker["options"] = options
+    warm_schema_cache()
+
+
+def _process_document(input_path, output_dir):
+    """Run one Document session; never raises, failures are reported in the result."""
+    input_path = Path(input_path)
+    packed = input_path.is_file()
+    options = _worker["options"]
+    timings = {}
+    result = {
+        "document": input_path.name,
+        "input": str(input_path),
+        "output": None,
+        "status": "ok",
+        "validation": "skipped",
+        "error": None,
+        "messages": [],
+        "timings": timings,
+        "worker": os.getpid(),
+    }
+
+    def instrument(event, info):
+        timings[event] = timings.get(event, 0) + info["seconds"]
+        if event == "validate":
+            result["validation"] = "passed" if info["passed"] else "failed"
+
+    start = time.perf_counter()
+    work_dir = tempfile.mkdtemp(prefix="docx_batch_")
+    log = io.StringIO()
+    doc = None
+    try:
+        with contextlib.redirect_stdout(log):
+            if packed:
+                step = time.perf_counter()
+                unpacked = Path(work_dir) / "unpacked"
+                unpack_document(input_path, unpacked, pretty=PRETTY_PARTS)
+                timings["unpack"] = time.perf_counter() - step
+                # Saved back into the scratch copy, then packed to the output
+                destination = unpacked
+            else:
+                unpacked = input_path
+                destination = Path(output_dir) / input_path.name
+
+            doc = Document(
+                unpacked,
+                copy_on_write=True,
+                instrument=instrument,
+                baseline=input_path if packed else None,
+                **options["document_kwargs"],
+            )
+
+            step = time.perf_counter()
+            _worker["edit"](doc, input_path.name)
+            timings["edit"] = time.perf_counter() - step
+
+            doc.save(destination, validate=options["validate"])
+            # The "save" event covers validation and baseline packing too
+            timings["save"] -= timings.get("validate", 0) + timings.get("baseline", 0)
+
+            if packed:
+                step = time.perf_counter()
+                output = Path(output_dir) / input_path.name
+                pack_document(unpacked, output)
+                timings["pack"] = time.perf_counter() - step
+            else:
+                output = destination
+            result["output"] = str(output)
+    except Exception as e:
+        result["status"] = "invalid" if result["validation"] == "failed" else "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if doc is not None:
+            shutil.rmtree(doc.temp_dir, ignore_errors=True)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    result["messages"] = [
+        line
+        for line in log.getvalue().splitlines()
+        if line.strip() and not line.startswith("Using RSID")
+    ]
+    timings["total"] = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Apply the same edits to many Word documents in parallel"
+    )
+    parser.add_argument(
+        "input_dir", help="Directory of .docx files and/or unpacked documents"
+    )
+    parser.add_argument(
+        "edit_script", help="JSON edit list or Python file defining edit(doc, name)"
+    )
+    parser.add_argument("output_dir", help="Directory for the edited documents")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument("--results", help="Also append the JSON results to this file")
+    parser.add_argument("--no-validate", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--author", default="Claude", help="Author of comments and tracked changes"
+    )
+    parser.add_argument("--initials", default="C", help="Author initials for comments")
+    parser.add_argument(
+        "--rsid", help="RSID for every document (default: a new one per document)"
+    )
+    parser.add_argument(
+        "--engine", default="auto", choices=["auto", "minidom", "lxml"]
+    )
+    args = parser.parse_args()
+
+    document_kwargs = {
+        "author": args.author,
+        "initials": args.initials,
+        "rsid": args.rsid,
+        "engine": args.engine,
+    }
+    results_file = open(args.results, "a", encoding="utf-8") if args.results else None
+
+    start = time.perf_counter()
+    counts = {}
+    try:
+        for result in run_batch(
+            args.input_dir,
+            args.edit_script,
+            args.output_dir,
+            jobs=args.jobs,
+            validate=not args.no_validate,
+            document_kwargs=document_kwargs,
+        ):
+            line = json.dumps(result)
+            print(line, flush=True)
+            if results_file:
+                results_file.write(line + "\n")
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+    finally:
+        if results_file:
+            results_file.close()
+
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    rate = total / elapsed * 60 if elapsed else 0
+    print(
+        f"{total} documents in {elapsed:.1f}s ({rate:.0f}/min): {summary or 'none'}",
+        file=sys.stderr,
+    )
+    sys.exit(0 if counts.get("ok", 0) == total else 1)
+
+
+if __name__ == "__main__":
+    main()
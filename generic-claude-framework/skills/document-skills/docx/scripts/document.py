@@ -22,27 +22,94 @@ Usage:
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Apply many edits as one validated, all-or-nothing batch
+    doc.apply_edits([
+        {"op": "comment", "contains": "Term of Agreement", "text": "Check term"},
+        {"op": "delete", "tag": "w:r", "contains": "30 days"},
+    ])
+
     # Save
     doc.save()
 """
 
+import functools
 import html
+import json
+import os
 import random
 import shutil
+import sys
 import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
+from ooxml.scripts.unpack import is_xml_part
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
 from .utilities import XMLEditor
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Linux ioctl that clones a file's extents (reflink) on CoW filesystems
+FICLONE = 0x40049409
+
+# Attributes holding random hex IDs that must stay unique across the document
+HEX_ID_ATTRIBUTES = ("w14:paraId", "w14:textId", "w16cid:durableId", "w16cex:durableId")
+
+# Operations accepted by Document.apply_edits, mapped to whether they need an anchor
+BATCH_OPERATIONS = {
+    "replace": True,
+    "insert_after": True,
+    "insert_before": True,
+    "append": True,
+    "delete": True,
+    "revert_insertion": True,
+    "revert_deletion": True,
+    "comment": True,
+    "reply": False,
+}
+
+# Document attributes saved in a session file; paths and containers are converted
+# to JSON by _encode_session_value()
+SESSION_ATTRIBUTES = (
+    "temp_dir",
+    "unpacked_path",
+    "word_path",
+    "original_docx",
+    "setup_stats",
+    "rsid",
+    "next_comment_id",
+    "existing_comments",
+    "comments_path",
+    "comments_extended_path",
+    "comments_ids_path",
+    "comments_extensible_path",
+    "_hex_ids",
+    "_lazy_parts",
+    "_synced",
+)
+
+# Bumped whenever the session file layout changes; older files are rejected
+SESSION_VERSION = 1
+
+# Parts whose hex IDs share a namespace with document.xml paragraphs
+COMMENT_PARTS = (
+    "word/comments.xml",
+    "word/commentsExtended.xml",
+    "word/commentsIds.xml",
+    "word/commentsExtensible.xml",
+)
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -52,12 +119,21 @@ class DocxXMLEditor(XMLEditor):
     - w:author and w:date (for w:ins, w:del, w:comment elements)
     - w:id (for w:ins and w:del elements)
 
+    Change IDs and hex IDs (w14:paraId, w14:textId, durableId) are allocated from
+    counters and sets seeded once from the DOM, so each new ID costs O(1).
+
     Attributes:
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        engine: str = "auto",
+        hex_ids=None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,52 +142,88 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            engine: XML parsing engine, see XMLEditor (default: "auto")
+            hex_ids: Set of hex IDs already in use, shared between the editors of one
+                     document (default: a new set for this editor)
         """
-        super().__init__(xml_path)
+        super().__init__(xml_path, engine=engine)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self._hex_ids = hex_ids if hex_ids is not None else set()
+        self._hex_ids_seeded = False
+        self._next_change_id = None  # Seeded from the DOM on first use
+
+    def invalidate_index(self):
+        """Discard lookup indexes and ID allocators so they are rebuilt from the DOM."""
+        super().invalidate_index()
+        self._next_change_id = None
+        self._hex_ids_seeded = False
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next change ID.
+
+        The first call scans all tracked change elements for the highest w:id; later
+        calls count up from there.
+        """
+        if self._next_change_id is None:
+            max_id = -1
+            for tag in ("w:ins", "w:del"):
+                elements = self.dom.getElementsByTagName(tag)
+                for elem in elements:
+                    change_id = elem.getAttribute("w:id")
+                    if change_id:
+                        try:
+                            max_id = max(max_id, int(change_id))
+                        except ValueError:
+                            pass
+            self._next_change_id = max_id + 1
+        change_id = self._next_change_id
+        self._next_change_id += 1
+        return change_id
+
+    def _reserve_change_id(self, change_id):
+        """Keep allocated change IDs above an explicit w:id on inserted content."""
+        if self._next_change_id is None:
+            return  # The seeding scan will see it
+        try:
+            self._next_change_id = max(self._next_change_id, int(change_id) + 1)
+        except ValueError:
+            pass
+
+    def _seed_hex_ids(self):
+        """Add the HEX_ID_ATTRIBUTES values of this part to the used set (once)."""
+        if self._hex_ids_seeded:
+            return
+        for elem in self.dom.getElementsByTagName("*"):
+            for name in HEX_ID_ATTRIBUTES:
+                value = elem.getAttribute(name)
+                if value:
+                    self._hex_ids.add(value)
+        self._hex_ids_seeded = True
+
+    def _new_hex_id(self):
+        """Generate a hex ID that is not used anywhere in the seeded parts."""
+        self._seed_hex_ids()
+        return _generate_hex_id(self._hex_ids)
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -127,10 +239,22 @@ class DocxXMLEditor(XMLEditor):
         Args:
             nodes: List of DOM nodes to process
         """
-        from datetime import datetime, timezone
+        self.modified = True
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+        # Namespaces are declared at most once per batch, when first needed
+        namespaces = {
+            "w14": self._ensure_w14_namespace,
+            "w16du": self._ensure_w16du_namespace,
+            "w16cex": self._ensure_w16cex_namespace,
+        }
+
+        def declare(prefix):
+            ensure = namespaces.pop(prefix, None)
+            if ensure is not None:
+                ensure()
+
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
             parent = elem.parentNode
@@ -140,7 +264,7 @@ class DocxXMLEditor(XMLEditor):
                 parent = parent.parentNode
             return False
 
-        def add_rsid_to_p(elem):
+        def add_rsid_to_p(elem, inside_del):
             if not elem.hasAttribute("w:rsidR"):
                 elem.setAttribute("w:rsidR", self.rsid)
             if not elem.hasAttribute("w:rsidRDefault"):
@@ -149,37 +273,37 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidP", self.rsid)
             # Add w14:paraId and w14:textId if not present
             if not elem.hasAttribute("w14:paraId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
+                declare("w14")
+                elem.setAttribute("w14:paraId", self._new_hex_id())
             if not elem.hasAttribute("w14:textId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:textId", _generate_hex_id())
+                declare("w14")
+                elem.setAttribute("w14:textId", self._new_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, inside_del):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if inside_del:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
                 if not elem.hasAttribute("w:rsidR"):
                     elem.setAttribute("w:rsidR", self.rsid)
 
-        def add_tracked_change_attrs(elem):
+        def add_tracked_change_attrs(elem, inside_del):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
                 elem.setAttribute("w:id", str(self._get_next_change_id()))
+            else:
+                self._reserve_change_id(elem.getAttribute("w:id"))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
                 elem.setAttribute("w:date", timestamp)
             # Add w16du:dateUtc for tracked changes (same as w:date since we generate UTC timestamps)
-            if elem.tagName in ("w:ins", "w:del") and not elem.hasAttribute(
-                "w16du:dateUtc"
-            ):
-                self._ensure_w16du_namespace()
+            if not elem.hasAttribute("w16du:dateUtc"):
+                declare("w16du")
                 elem.setAttribute("w16du:dateUtc", timestamp)
 
-        def add_comment_attrs(elem):
+        def add_comment_attrs(elem, inside_del):
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -187,55 +311,60 @@ class DocxXMLEditor(XMLEditor):
             if not elem.hasAttribute("w:initials"):
                 elem.setAttribute("w:initials", self.initials)
 
-        def add_comment_extensible_date(elem):
+        def add_comment_extensible_date(elem, inside_del):
             # Add w16cex:dateUtc for comment extensible elements
             if not elem.hasAttribute("w16cex:dateUtc"):
-                self._ensure_w16cex_namespace()
+                declare("w16cex")
                 elem.setAttribute("w16cex:dateUtc", timestamp)
 
-        def add_xml_space_to_t(elem):
+        def add_xml_space_to_t(elem, inside_del):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
+            text = self._get_leading_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if not elem.hasAttribute("xml:space"):
+                    elem.setAttribute("xml:space", "preserve")
+
+        # Handlers by tag, in the order descendants are processed
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
 
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            # Handle the node itself; only its ancestors need to be walked
+            inside_del = is_inside_deletion(node)
+            handler = handlers.get(node.tagName)
+            if handler:
+                handler(node, inside_del)
+
+            # One pre-order pass over the descendants, carrying the "inside w:del"
+            # flag down and grouping matches by tag
+            found = {tag: [] for tag in handlers}
+            inside_del = inside_del or node.tagName == "w:del"
+            stack = [(child, inside_del) for child in reversed(node.childNodes)]
+            while stack:
+                elem, inside_del = stack.pop()
+                if elem.nodeType != elem.ELEMENT_NODE:
+                    continue
+                matches = found.get(elem.tagName)
+                if matches is not None:
+                    matches.append((elem, inside_del))
+                inside_del = inside_del or elem.tagName == "w:del"
+                stack.extend((child, inside_del) for child in reversed(elem.childNodes))
+            for tag, handler in handlers.items():
+                for elem, inside_del in found[tag]:
+                    handler(elem, inside_del)
+
+        # Re-index so lookups see the injected w:id and w14:paraId values
+        self._index_nodes(nodes)
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -318,14 +447,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
                 for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
+                    self._rename_element(t_elem, "w:delText")
 
             # Move all children from ins to del wrapper
             while ins_elem.firstChild:
@@ -399,14 +521,7 @@ class DocxXMLEditor(XMLEditor):
 
                 # Convert w:delText → w:t
                 for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+                    self._rename_element(del_text, "w:t")
 
                 # Update run attributes: w:rsidDel → w:rsidR
                 if new_run.hasAttribute("w:rsidDel"):
@@ -431,6 +546,7 @@ class DocxXMLEditor(XMLEditor):
             return [elem]
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def suggest_paragraph(xml_content: str) -> str:
         """Transform paragraph XML to add tracked change wrapping for insertion.
 
@@ -502,15 +618,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+                self._rename_element(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             if elem.hasAttribute("w:rsidR"):
@@ -556,18 +664,11 @@ class DocxXMLEditor(XMLEditor):
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
+                self._index_nodes([rPr])
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+                self._rename_element(t_elem, "w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             for run in elem.getElementsByTagName("w:r"):
@@ -593,15 +694,107 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
-def _generate_hex_id() -> str:
+def _generate_hex_id(used=None) -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
     Values are constrained to be less than 0x7FFFFFFF per OOXML spec:
     - paraId must be < 0x80000000
     - durableId must be < 0x7FFFFFFF
     We use the stricter constraint (0x7FFFFFFF) for both.
+
+    Args:
+        used: Optional set of IDs already in use; the new ID is guaranteed not to be
+              in it and is added to it
+    """
+    hex_id = f"{random.randint(1, 0x7FFFFFFE):08X}"
+    if used is not None:
+        while hex_id in used:
+            hex_id = f"{random.randint(1, 0x7FFFFFFE):08X}"
+        used.add(hex_id)
+    return hex_id
+
+
+def _clone_file(src, dst):
+    """Reflink or hard-link src to dst.
+
+    Returns:
+        str: "reflinked" or "linked", or None if neither is supported
     """
-    return f"{random.randint(1, 0x7FFFFFFE):08X}"
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            return "reflinked"
+        except OSError:
+            Path(dst).unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+        return "linked"
+    except OSError:
+        return None
+
+
+def _atomic_copy(src, dst):
+    """Copy src over dst via a temporary file in the same directory and a rename.
+
+    Files hard-linked to their destination are left alone.
+    """
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst.with_name(f".{dst.name}.tmp")
+    shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def _encode_session_value(value):
+    """Convert a session attribute to JSON data, tagging types JSON lacks."""
+    if isinstance(value, Path):
+        return {"path": str(value)}
+    if isinstance(value, set):
+        return {"set": [_encode_session_value(v) for v in sorted(value, key=str)]}
+    if isinstance(value, tuple):
+        return {"tuple": [_encode_session_value(v) for v in value]}
+    if isinstance(value, dict):
+        return {
+            "dict": [
+                [_encode_session_value(k), _encode_session_value(v)]
+                for k, v in value.items()
+            ]
+        }
+    if isinstance(value, list):
+        return [_encode_session_value(v) for v in value]
+    return value
+
+
+def _changed_files(current, recorded, limit=5):
+    """Describe the files whose signatures differ between two file snapshots."""
+    changed = sorted(
+        str(path)
+        for path in current.keys() | recorded.keys()
+        if current.get(path) != recorded.get(path)
+    )
+    if len(changed) > limit:
+        changed = changed[:limit] + [f"and {len(changed) - limit} more"]
+    return ", ".join(changed)
+
+
+def _decode_session_value(data):
+    """Inverse of _encode_session_value()."""
+    if isinstance(data, list):
+        return [_decode_session_value(v) for v in data]
+    if not isinstance(data, dict):
+        return data
+    (kind, value), = data.items()
+    if kind == "path":
+        return Path(value)
+    if kind == "set":
+        return {_decode_session_value(v) for v in value}
+    if kind == "tuple":
+        return tuple(_decode_session_value(v) for v in value)
+    if kind == "dict":
+        return {_decode_session_value(k): _decode_session_value(v) for k, v in value}
+    raise ValueError(f"Unknown session value type: {kind}")
 
 
 def _generate_rsid() -> str:
@@ -619,31 +812,94 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        engine="auto",
+        copy_on_write=False,
+        instrument=None,
+        baseline=None,
+        session=None,
     ):
         """
         Initialize with path to unpacked Word document directory.
         Automatically sets up comment infrastructure (people.xml, RSIDs).
 
+        The session works on a private copy of the directory. With copy_on_write, files
+        are reflinked or hard-linked into it instead of copied; binary parts that can't
+        be linked (e.g., across filesystems) are only copied when validation or saving
+        needs them. Editors replace files rather than writing into them, so linked
+        originals are never modified. The validation baseline (original.docx) is
+        packed on first use rather than up front.
+
+        With a session file, the session outlives the process: save() and persist()
+        record the working directory, comment state and ID allocators there, and a
+        later Document created with the same session file and options resumes the
+        session instead of setting up a new one, as long as neither the working
+        directory nor the original directory changed in between. Editors are parsed
+        again lazily when first accessed. A session file that doesn't match raises
+        ValueError; its working directory is never deleted automatically, since it
+        may hold persisted edits that were never saved.
+
         Args:
             unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
             rsid: Optional RSID to use for all comment elements. If not provided, one will be generated.
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            engine: XML parsing engine for the editors: "minidom", "lxml", or "auto"
+                    to use lxml for very large parts when installed (default: "auto")
+            copy_on_write: If True, link unchanged files into the session instead of
+                           copying them (default: False)
+            instrument: Optional callable(event, info) receiving timing data for the
+                        "setup", "baseline", "validate" and "save" steps
+            baseline: Optional path to the .docx that unpacked_dir was unpacked from,
+                      used as the validation baseline instead of packing one
+            session: Optional path of a session file to resume from and persist to
         """
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
+        self.instrument = instrument
+        self.author = author
+        self.initials = initials
+        self.engine = engine
+        self._editors = {}  # Cache for lazy-loaded editors
+        self._editor_state = {}  # Allocator state for editors not loaded yet
+        self._keep_temp_dir = False
+
+        self.session_path = Path(session) if session else None
+        self._session_options = {
+            "original_path": str(self.original_path.resolve()),
+            "track_revisions": track_revisions,
+            "author": author,
+            "initials": initials,
+            "engine": engine,
+            "baseline": str(Path(baseline).resolve()) if baseline else None,
+        }
+        if self.session_path and self._resume(rsid):
+            return
+
         # Create temporary directory with subdirectories for unpacked content and baseline
+        start = time.perf_counter()
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self._lazy_parts = set()  # Binary parts not copied into the session yet
+        if copy_on_write:
+            counts = self._link_tree()
+        else:
+            shutil.copytree(self.original_path, self.unpacked_path)
+            counts = {"copied": sum(1 for p in self.unpacked_path.rglob("*") if p.is_file())}
+        self.setup_stats = {"seconds": time.perf_counter() - start, **counts}
+        self._report("setup", self.setup_stats)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Session file state as of the last sync per target (the original matches now)
+        self._synced = {self.original_path.resolve(): self._snapshot_files()}
+
+        # Validation baseline (outside unpacked dir), packed on first use
+        if baseline:
+            self.original_docx = Path(baseline)
+        else:
+            self.original_docx = Path(self.temp_dir) / "original.docx"
 
         self.word_path = self.unpacked_path / "word"
 
@@ -651,12 +907,8 @@ class Document:
         self.rsid = rsid if rsid else _generate_rsid()
         print(f"Using RSID: {self.rsid}")
 
-        # Set default author and initials
-        self.author = author
-        self.initials = initials
-
-        # Cache for lazy-loaded editors
-        self._editors = {}
+        # Hex IDs (paraId, textId, durableId) in use, shared by all editors
+        self._hex_ids = set()
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -668,15 +920,17 @@ class Document:
         self.existing_comments = self._load_existing_comments()
         self.next_comment_id = self._get_next_comment_id()
 
-        # Convenient access to document.xml editor (semi-private)
-        self._document = self["word/document.xml"]
-
         # Setup tracked changes infrastructure
         self._setup_tracking(track_revisions=track_revisions)
 
         # Add author to people.xml
         self._add_author_to_people(author)
 
+    @property
+    def _document(self) -> "DocxXMLEditor":
+        """Convenient access to the document.xml editor (semi-private)."""
+        return self["word/document.xml"]
+
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
         Get or create a DocxXMLEditor for the specified XML file.
@@ -705,9 +959,20 @@ class Document:
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+            editor = DocxXMLEditor(
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                engine=self.engine,
+                hex_ids=self._hex_ids,
             )
+            # Allocators restored from a session file still match the file
+            state = self._editor_state.pop(xml_path, None)
+            if state:
+                editor._next_change_id = state["next_change_id"]
+                editor._hex_ids_seeded = state["hex_ids_seeded"]
+            self._editors[xml_path] = editor
         return self._editors[xml_path]
 
     def add_comment(self, start, end, text: str) -> int:
@@ -728,8 +993,8 @@ class Document:
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        para_id = self._new_hex_id()
+        durable_id = self._new_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
@@ -785,8 +1050,8 @@ class Document:
 
         parent_info = self.existing_comments[parent_comment_id]
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        para_id = self._new_hex_id()
+        durable_id = self._new_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
@@ -830,8 +1095,115 @@ class Document:
         self.next_comment_id += 1
         return comment_id
 
+    def apply_edits(self, edits, validate=True) -> list:
+        """
+        Apply a batch of edits as one transaction.
+
+        All anchors are resolved first, against the current index, so a batch either
+        starts with every anchor found or fails without changing anything. Edits are
+        then applied in document order (ties keep their order in the list), the
+        changed parts are written, and the document is validated once. If applying or
+        validating fails, all files and comment state are rolled back and the error
+        is re-raised; editors and nodes obtained before the call must then be
+        fetched again.
+
+        Each edit is a dict with an "op" and, except for "reply", an anchor:
+            - "para_id": w14:paraId of a w:p (shorthand for tag w:p and attrs)
+            - "tag", "attrs", "line" (int or [first, last]), "contains": get_node filters
+            - "part": XML part to edit (default: "word/document.xml")
+
+        Operations:
+            - "replace", "insert_after", "insert_before", "append": with "xml"
+            - "delete": suggest_deletion() on a w:r or w:p
+            - "revert_insertion", "revert_deletion"
+            - "comment": with "text" and an optional "end" anchor dict (default: the anchor)
+            - "reply": with "text" and "parent_comment_id", or "reply_to" (the index of a
+              "comment" edit earlier in the batch)
+
+        Args:
+            edits: List of edit dicts
+            validate: If True, validate the document after applying (default: True)
+
+        Returns:
+            list: One result per edit, in input order (inserted nodes, the processed
+                  element, or the new comment ID)
+
+        Raises:
+            ValueError: If an edit is malformed or its anchor can't be resolved (nothing
+                        is changed), or if applying or validation fails (rolled back)
+
+        Example:
+            doc.apply_edits([
+                {"op": "comment", "contains": "Term of Agreement", "text": "Check term"},
+                {"op": "reply", "reply_to": 0, "text": "Agreed"},
+                {"op": "delete", "tag": "w:r", "contains": "30 days"},
+                {"op": "insert_after", "para_id": "3A5F01B2",
+                 "xml": DocxXMLEditor.suggest_paragraph("<w:p>...</w:p>")},
+            ])
+        """
+        # Resolve every anchor before touching the DOM
+        resolved = []
+        errors = []
+        for i, edit in enumerate(edits):
+            try:
+                resolved.append(self._resolve_edit(i, edit, edits))
+            except ValueError as e:
+                errors.append(f"edit {i} ({edit.get('op')}): {e}")
+        if errors:
+            raise ValueError("Could not resolve edits:\n" + "\n".join(errors))
+
+        # Document order per part; replies go after the anchored edits
+        positions = {}
+        for part, anchor, _ in resolved:
+            if anchor is not None and part not in positions:
+                positions[part] = {
+                    elem: pos
+                    for pos, elem in enumerate(self[part].dom.getElementsByTagName("*"))
+                }
+        order = sorted(
+            range(len(edits)),
+            key=lambda i: (
+                resolved[i][1] is None,
+                resolved[i][0],
+                positions.get(resolved[i][0], {}).get(resolved[i][1], 0),
+            ),
+        )
+
+        # Checkpoint: disk holds the current state, so it can be restored from disk
+        self._flush_editors()
+        files_before = self._snapshot_files()
+        state_before = (
+            self.next_comment_id,
+            {k: dict(v) for k, v in self.existing_comments.items()},
+            set(self._hex_ids),
+        )
+        backups = {}
+
+        results = [None] * len(edits)
+        try:
+            for i in order:
+                results[i] = self._apply_edit(i, edits[i], resolved[i], results)
+
+            if self.comments_path.exists():
+                self._ensure_comment_relationships()
+                self._ensure_comment_content_types()
+            for editor in self._editors.values():
+                if editor.modified and editor.xml_path.exists():
+                    backups[editor.xml_path] = editor.xml_path.read_bytes()
+            self._flush_editors()
+
+            if validate:
+                self.validate()
+        except Exception:
+            self._rollback(files_before, backups, state_before)
+            raise
+
+        return results
+
     def __del__(self):
-        """Clean up temporary directory on deletion."""
+        """Clean up temporary directory on deletion, unless a session file uses it."""
+        if getattr(self, "_keep_temp_dir", False):
+            return
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
@@ -842,30 +1214,47 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
-        schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-        redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
+        self._ensure_baseline()
+        self._materialize_lazy_parts()
+        start = time.perf_counter()
+        passed = False
+
+        try:
+            # Create validators with current state
+            schema_validator = DOCXSchemaValidator(
+                self.unpacked_path, self.original_docx, verbose=False
+            )
+            redlining_validator = RedliningValidator(
+                self.unpacked_path, self.original_docx, verbose=False
+            )
 
-        # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+            # Run validations
+            if not schema_validator.validate():
+                raise ValueError("Schema validation failed")
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
+            passed = True
+        finally:
+            self._report(
+                "validate", {"seconds": time.perf_counter() - start, "passed": passed}
+            )
 
     def save(self, destination=None, validate=True) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only editors marked as modified are serialized, and only files created or
+        changed since the last save to the same directory are copied, each through
+        a temporary file and an atomic rename. The first save to a new destination
+        copies every file.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
+        start = time.perf_counter()
+
         # Only ensure comment relationships and content types if comment files exist
         if self.comments_path.exists():
             self._ensure_comment_relationships()
@@ -873,7 +1262,8 @@ class Document:
 
         # Save all modified XML files in temp directory
         for editor in self._editors.values():
-            editor.save()
+            if editor.modified:
+                editor.save()
 
         # Validate by default
         if validate:
@@ -881,10 +1271,343 @@ class Document:
 
         # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() == self.original_path.resolve():
+            # The baseline must be packed before the original files change
+            self._ensure_baseline()
+        else:
+            self._materialize_lazy_parts()
+        copied = self._sync_to(target_path)
+        if self.session_path:
+            self.persist()
+        self._report("save", {"seconds": time.perf_counter() - start, "files": copied})
+
+    def persist(self) -> None:
+        """
+        Record the session in the session file so a later Document can resume it.
+
+        Modified editors are written to the session's working directory (not to the
+        original directory; use save() for that). The working directory is kept when
+        this Document is garbage collected.
+
+        Raises:
+            ValueError: If the Document was created without a session file
+        """
+        if self.session_path is None:
+            raise ValueError("Document was created without a session file")
+        start = time.perf_counter()
+        self._flush_editors()
+
+        editor_state = dict(self._editor_state)
+        for xml_path, editor in self._editors.items():
+            editor_state[xml_path] = {
+                "next_change_id": editor._next_change_id,
+                "hex_ids_seeded": editor._hex_ids_seeded,
+            }
+        session = {
+            "version": SESSION_VERSION,
+            "options": self._session_options,
+            "attributes": {
+                name: _encode_session_value(getattr(self, name))
+                for name in SESSION_ATTRIBUTES
+            },
+            "editors": editor_state,
+            "files": _encode_session_value(self._snapshot_files()),
+            "original_files": _encode_session_value(
+                self._snapshot_files(self.original_path)
+            ),
+        }
+        self.session_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.session_path.with_name(f".{self.session_path.name}.tmp")
+        tmp_path.write_text(json.dumps(session), encoding="utf-8")
+        os.replace(tmp_path, self.session_path)
+        self._keep_temp_dir = True
+        self._report("persist", {"seconds": time.perf_counter() - start})
+
+    # ==================== Private: Batch Edits ====================
+
+    def _resolve_edit(self, index, edit, edits):
+        """Validate an edit and find its anchor.
+
+        Returns:
+            tuple: (part, anchor element or None, end element or None)
+        """
+        op = edit.get("op")
+        if op not in BATCH_OPERATIONS:
+            raise ValueError(f"Unknown op {op!r}. Use one of {list(BATCH_OPERATIONS)}")
+        if op in ("replace", "insert_after", "insert_before", "append"):
+            if "xml" not in edit:
+                raise ValueError(f"{op} requires 'xml'")
+        if op in ("comment", "reply") and "text" not in edit:
+            raise ValueError(f"{op} requires 'text'")
+
+        part = edit.get("part", "word/document.xml")
+        if op in ("comment", "reply") and part != "word/document.xml":
+            raise ValueError("Comments can only be anchored in word/document.xml")
+
+        if op == "reply":
+            if "reply_to" in edit:
+                target = edit["reply_to"]
+                if not (
+                    isinstance(target, int)
+                    and 0 <= target < index
+                    and edits[target].get("op") == "comment"
+                ):
+                    raise ValueError(
+                        "reply_to must be the index of an earlier comment edit"
+                    )
+            elif edit.get("parent_comment_id") not in self.existing_comments:
+                raise ValueError(
+                    f"Parent comment with id={edit.get('parent_comment_id')} not found"
+                )
+            return part, None, None
+
+        anchor = self._find_anchor(part, edit)
+        end = anchor
+        if op == "comment" and "end" in edit:
+            end = self._find_anchor(part, edit["end"])
+        return part, anchor, end
+
+    def _find_anchor(self, part, locator):
+        """Find the element described by an edit's anchor keys."""
+        tag = locator.get("tag", "w:p")
+        attrs = dict(locator.get("attrs") or {})
+        if "para_id" in locator:
+            attrs["w14:paraId"] = locator["para_id"]
+        line_number = locator.get("line")
+        if isinstance(line_number, (list, tuple)):
+            line_number = range(line_number[0], line_number[1] + 1)
+        if not attrs and line_number is None and "contains" not in locator:
+            raise ValueError("Anchor needs para_id, attrs, line, or contains")
+        return self[part].get_node(
+            tag=tag,
+            attrs=attrs or None,
+            line_number=line_number,
+            contains=locator.get("contains"),
+        )
+
+    def _apply_edit(self, index, edit, resolved, results):
+        """Apply one resolved edit and return its result."""
+        op = edit["op"]
+        part, anchor, end = resolved
+        editor = self[part]
+
+        if op == "reply":
+            if "reply_to" in edit:
+                parent_comment_id = results[edit["reply_to"]]
+            else:
+                parent_comment_id = edit["parent_comment_id"]
+            return self.reply_to_comment(parent_comment_id, edit["text"])
+
+        for elem in (anchor, end):
+            if not editor._is_attached(elem):
+                raise ValueError(
+                    f"edit {index} ({op}): anchor was removed by an earlier edit"
+                )
+
+        if op == "replace":
+            return editor.replace_node(anchor, edit["xml"])
+        if op == "insert_after":
+            return editor.insert_after(anchor, edit["xml"])
+        if op == "insert_before":
+            return editor.insert_before(anchor, edit["xml"])
+        if op == "append":
+            return editor.append_to(anchor, edit["xml"])
+        if op == "delete":
+            return editor.suggest_deletion(anchor)
+        if op == "revert_insertion":
+            return editor.revert_insertion(anchor)
+        if op == "revert_deletion":
+            return editor.revert_deletion(anchor)
+        return self.add_comment(anchor, end, edit["text"])
+
+    def _flush_editors(self):
+        """Write every modified editor to the session directory."""
+        for editor in self._editors.values():
+            if editor.modified:
+                editor.save()
+
+    def _rollback(self, files_before, backups, state_before):
+        """Restore session files and comment state after a failed batch."""
+        for path, content in backups.items():
+            path.write_bytes(content)
+        for rel in set(self._snapshot_files()) - set(files_before):
+            (self.unpacked_path / rel).unlink()
+        self.next_comment_id, self.existing_comments, self._hex_ids = state_before
+
+        # Editors are reloaded from the restored files on next access
+        self._editors = {}
+        self._editor_state = {}
+
+    # ==================== Private: Session Files ====================
+
+    def _link_tree(self):
+        """Populate the session directory with reflinks or hard links to the original.
+
+        XML parts that can't be linked are copied; other parts are left for
+        _materialize_lazy_parts().
+
+        Returns:
+            dict: Number of files per method (reflinked, linked, copied, lazy)
+        """
+        counts = {"reflinked": 0, "linked": 0, "copied": 0, "lazy": 0}
+        for src in sorted(self.original_path.rglob("*")):
+            rel = src.relative_to(self.original_path)
+            dst = self.unpacked_path / rel
+            if src.is_dir():
+                dst.mkdir(parents=True, exist_ok=True)
+                continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            method = _clone_file(src, dst)
+            if method is None:
+                if is_xml_part(rel.as_posix()):
+                    shutil.copy2(src, dst)
+                    method = "copied"
+                else:
+                    self._lazy_parts.add(rel)
+                    method = "lazy"
+            counts[method] += 1
+        return counts
+
+    def _snapshot_files(self, root=None):
+        """Map each file under root (default: the session directory) to a signature.
+
+        The signature changes whenever the file is written.
+        """
+        root = root or self.unpacked_path
+        snapshot = {}
+        for path in root.rglob("*"):
+            if path.is_file():
+                st = path.stat()
+                snapshot[path.relative_to(root)] = (
+                    st.st_ino,
+                    st.st_size,
+                    st.st_mtime_ns,
+                )
+        return snapshot
+
+    def _sync_to(self, target_path):
+        """Copy session files created or changed since the last sync to target_path.
+
+        Returns:
+            list: Relative paths of the files copied
+        """
+        key = target_path.resolve()
+        previous = self._synced.get(key, {})
+        current = self._snapshot_files()
+        copied = []
+        for rel, signature in sorted(current.items()):
+            if previous.get(rel) == signature:
+                continue
+            _atomic_copy(self.unpacked_path / rel, target_path / rel)
+            copied.append(rel)
+        self._synced[key] = current
+        return copied
+
+    def _materialize_lazy_parts(self):
+        """Copy binary parts deferred by copy-on-write setup into the session."""
+        original_state = self._synced[self.original_path.resolve()]
+        for rel in sorted(self._lazy_parts):
+            dst = self.unpacked_path / rel
+            if not dst.exists():
+                shutil.copy2(self.original_path / rel, dst)
+                # Same content as the original, so there is nothing to sync back
+                st = dst.stat()
+                original_state[rel] = (st.st_ino, st.st_size, st.st_mtime_ns)
+        self._lazy_parts.clear()
+
+    def _ensure_baseline(self):
+        """Pack the original directory into original.docx if not done yet."""
+        if self.original_docx.exists():
+            return
+        start = time.perf_counter()
+        pack_document(self.original_path, self.original_docx, validate=False)
+        self._report("baseline", {"seconds": time.perf_counter() - start})
+
+    def _resume(self, rsid):
+        """Restore the session recorded in the session file.
+
+        A session is resumed if it was created with the same options and neither its
+        working directory nor the original directory changed since it was persisted.
+        Its working directory may hold edits that were persisted but never saved, so
+        it is never removed: a session that doesn't match raises instead.
+
+        Returns:
+            bool: True if the session was resumed, False if a new one must be set up
+            (no readable session file, or its working directory no longer exists)
+
+        Raises:
+            ValueError: If the session file is from another SESSION_VERSION, or was
+                created with other options or RSID, or its working directory or the
+                original directory changed since it was persisted
+        """
+        start = time.perf_counter()
+        try:
+            session = json.loads(self.session_path.read_text(encoding="utf-8"))
+            attributes = {
+                name: _decode_session_value(value)
+                for name, value in session["attributes"].items()
+            }
+            unpacked_path = attributes["unpacked_path"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        if not unpacked_path.is_dir():
+            # Nothing left to resume (or to lose)
+            return False
+
+        problems = []
+        if session.get("version") != SESSION_VERSION:
+            problems.append(
+                f"session version {session.get('version')} "
+                f"(this version reads {SESSION_VERSION})"
+            )
+        recorded_options = session.get("options", {})
+        for name, value in self._session_options.items():
+            if recorded_options.get(name) != value:
+                problems.append(
+                    f"option {name}={value!r} (session: {recorded_options.get(name)!r})"
+                )
+        if rsid and rsid != attributes.get("rsid"):
+            problems.append(f"rsid={rsid!r} (session: {attributes.get('rsid')!r})")
+        for label, root, recorded in (
+            ("session files", unpacked_path, session.get("files")),
+            ("original files", self.original_path, session.get("original_files")),
+        ):
+            changed = _changed_files(
+                self._snapshot_files(root), _decode_session_value(recorded or [])
+            )
+            if changed:
+                problems.append(f"{label} changed since persist(): {changed}")
+
+        if problems:
+            raise ValueError(
+                f"Session {self.session_path} does not match this Document: "
+                + "; ".join(problems)
+                + f". Its working directory {attributes.get('temp_dir')} is kept, as "
+                "it may hold unsaved edits; resume with the session's options, or "
+                "delete the session file to start a new session"
+            )
+
+        for name in SESSION_ATTRIBUTES:
+            setattr(self, name, attributes[name])
+        self._editor_state = session["editors"]
+        self._keep_temp_dir = True
+        print(f"Using RSID: {self.rsid}")
+        self._report("resume", {"seconds": time.perf_counter() - start})
+        return True
+
+    def _report(self, event, info):
+        if self.instrument is not None:
+            self.instrument(event, info)
 
     # ==================== Private: Initialization ====================
 
+    def _new_hex_id(self):
+        """Generate a paraId/durableId unused in document.xml and the comment parts."""
+        for part in COMMENT_PARTS:
+            if (self.unpacked_path / part).exists():
+                self[part]._seed_hex_ids()
+        return self._document._new_hex_id()
+
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
         if not self.comments_path.exists():
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+lxml-backed DOM with the minidom subset used by XMLEditor and DocxXMLEditor.
+
+minidom keeps a Python object per node and, with line tracking, a position tuple per
+element, so a 20 MB document.xml grows to well over 1 GB in memory. This module parses
+with a hardened lxml parser instead and exposes elements through a custom element
+class that offers the minidom methods the editors rely on (tagName, getAttribute,
+setAttribute, getElementsByTagName, insertBefore, appendChild, ...). Source line numbers
+come from lxml's native `sourceline`.
+
+Differences from minidom that callers may notice:
+    - childNodes, firstChild and nextSibling only return elements; text lives in the
+      lxml `text`/`tail` attributes and travels with the element it belongs to
+    - parse_position is (line, None): lxml does not record columns
+    - New namespace declarations are added through LxmlDocument.declare_namespace()
+      and written on the root element at serialization time
+
+Usage:
+    editor = XMLEditor("word/document.xml", engine="lxml")
+"""
+
+import copy
+import io
+
+from lxml import etree
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# Well-known OOXML prefixes, used to resolve names whose prefix is not declared yet
+OOXML_NAMESPACES = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+    "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
+    "w15": "http://schemas.microsoft.com/office/word/2012/wordml",
+    "w16cex": "http://schemas.microsoft.com/office/word/2018/wordml/cex",
+    "w16cid": "http://schemas.microsoft.com/office/word/2016/wordml/cid",
+    "w16du": "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
+    "w16se": "http://schemas.microsoft.com/office/word/2015/wordml/symex",
+    "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "xml": XML_NAMESPACE,
+}
+
+
+class LxmlElement(etree.ElementBase):
+    """lxml element class exposing the minidom element API used by the editors.
+
+    lxml element classes must not keep Python-side state, so every property here is
+    derived from the underlying tree.
+    """
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    nodeType = ELEMENT_NODE
+
+    def __bool__(self):
+        # minidom nodes are always truthy; lxml elements are falsy without children
+        return True
+
+    @property
+    def tagName(self):
+        local = etree.QName(self).localname
+        return f"{self.prefix}:{local}" if self.prefix else local
+
+    @property
+    def nodeName(self):
+        return self.tagName
+
+    @property
+    def parse_position(self):
+        return (self.sourceline, None)
+
+    @property
+    def parentNode(self):
+        return self.getparent()
+
+    @property
+    def childNodes(self):
+        return list(self.iterchildren(etree.Element))
+
+    @property
+    def firstChild(self):
+        return next(self.iterchildren(etree.Element), None)
+
+    @property
+    def nextSibling(self):
+        return next(self.itersiblings(etree.Element), None)
+
+    @property
+    def attributes(self):
+        return _Attributes(self)
+
+    def getAttribute(self, name):
+        return self.get(self._attribute_key(name), "")
+
+    def hasAttribute(self, name):
+        if name.startswith("xmlns:"):
+            return name[6:] in self.nsmap
+        return self.get(self._attribute_key(name)) is not None
+
+    def setAttribute(self, name, value):
+        if name.startswith("xmlns:"):
+            if self.nsmap.get(name[6:]) != value:
+                raise ValueError(
+                    f"Cannot declare {name} on an element; use "
+                    f"LxmlDocument.declare_namespace() instead"
+                )
+            return
+        self.set(self._attribute_key(name), value)
+
+    def removeAttribute(self, name):
+        self.attrib.pop(self._attribute_key(name), None)
+
+    def getElementsByTagName(self, name):
+        if name == "*":
+            return list(self.iterdescendants(etree.Element))
+        return list(self.iterdescendants(self._tag_key(name)))
+
+    def appendChild(self, node):
+        _detach(node)
+        self.append(node)
+        return node
+
+    def insertBefore(self, node, ref):
+        _detach(node)
+        if ref is None:
+            self.append(node)
+        else:
+            self.insert(self.index(ref), node)
+        return node
+
+    def removeChild(self, node):
+        _detach(node)
+        self.remove(node)
+        return node
+
+    def replaceChild(self, new, old):
+        _detach(new)
+        new.tail, old.tail = old.tail, None
+        self.replace(old, new)
+        return old
+
+    def cloneNode(self, deep=False):
+        if deep:
+            clone = copy.deepcopy(self)
+        else:
+            clone = self.makeelement(self.tag, self.attrib, nsmap=self.nsmap)
+        clone.tail = None
+        return clone
+
+    def toxml(self):
+        return etree.tostring(self, encoding="unicode", with_tail=False)
+
+    def _resolve_prefix(self, prefix):
+        uri = self.nsmap.get(prefix) or OOXML_NAMESPACES.get(prefix)
+        if uri is None:
+            raise ValueError(f"Unknown namespace prefix: {prefix}")
+        return uri
+
+    def _tag_key(self, name):
+        prefix, _, local = name.rpartition(":")
+        if prefix:
+            return f"{{{self._resolve_prefix(prefix)}}}{local}"
+        default = self.nsmap.get(None)
+        return f"{{{default}}}{local}" if default else local
+
+    def _attribute_key(self, name):
+        prefix, _, local = name.rpartition(":")
+        if prefix:
+            return f"{{{self._resolve_prefix(prefix)}}}{local}"
+        return local
+
+
+class LxmlDocument:
+    """Document wrapper offering the minidom Document API used by the editors.
+
+    Attributes:
+        tree: The parsed lxml ElementTree
+        pending_namespaces: Prefix -> URI declarations to add to the root when saving
+    """
+
+    ELEMENT_NODE = LxmlElement.ELEMENT_NODE
+    TEXT_NODE = LxmlElement.TEXT_NODE
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.pending_namespaces = {}
+
+    @property
+    def documentElement(self):
+        return self.tree.getroot()
+
+    def getElementsByTagName(self, name):
+        root = self.documentElement
+        if name == "*":
+            return list(root.iter(etree.Element))
+        return list(root.iter(root._tag_key(name)))
+
+    def createElement(self, tag_name):
+        prefix, _, local = tag_name.rpartition(":")
+        if not prefix:
+            return make_parser().makeelement(local)
+        uri = self.namespace_uri(prefix)
+        return make_parser().makeelement(f"{{{uri}}}{local}", nsmap={prefix: uri})
+
+    def namespace_uri(self, prefix):
+        """Resolve a prefix against the root, pending declarations and OOXML defaults."""
+        uri = (
+            self.documentElement.nsmap.get(prefix)
+            or self.pending_namespaces.get(prefix)
+            or OOXML_NAMESPACES.get(prefix)
+        )
+        if uri is None:
+            raise ValueError(f"Unknown namespace prefix: {prefix}")
+        return uri
+
+    def declare_namespace(self, prefix, uri):
+        """Declare prefix on the root element (applied when the document is serialized)."""
+        if self.documentElement.nsmap.get(prefix) != uri:
+            self.pending_namespaces[prefix] = uri
+
+    def namespace_declarations(self):
+        """Get all prefix -> URI declarations on the root, including pending ones."""
+        declarations = {
+            prefix: uri
+            for prefix, uri in self.documentElement.nsmap.items()
+            if prefix is not None
+        }
+        declarations.update(self.pending_namespaces)
+        return declarations
+
+    def toxml(self, encoding="utf-8"):
+        """Serialize like minidom's Document.toxml(encoding=...)."""
+        buffer = io.BytesIO()
+        self.write(buffer, encoding)
+        return buffer.getvalue()
+
+    def write(self, file, encoding="utf-8"):
+        """Serialize the document into a binary file object, as toxml() would."""
+        root = self.documentElement
+        if self.pending_namespaces:
+            # Moves prefixes such as lxml's generated ns0 onto the declared names
+            etree.cleanup_namespaces(
+                root,
+                top_nsmap=self.pending_namespaces,
+                keep_ns_prefixes=[p for p in root.nsmap if p is not None],
+            )
+            self.pending_namespaces = {
+                prefix: uri
+                for prefix, uri in self.pending_namespaces.items()
+                if root.nsmap.get(prefix) != uri
+            }
+        file.write(f'<?xml version="1.0" encoding="{encoding}"?>'.encode(encoding))
+        self.tree.write(file, encoding=encoding, xml_declaration=False)
+
+
+class _Attributes:
+    """Read-only view of an element's attributes in minidom NamedNodeMap style."""
+
+    def __init__(self, elem):
+        self._items = [
+            _Attribute(_prefixed_name(elem, key), value)
+            for key, value in elem.attrib.items()
+        ]
+        self.length = len(self._items)
+
+    def item(self, index):
+        return self._items[index] if 0 <= index < self.length else None
+
+
+class _Attribute:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+
+def make_parser():
+    """Create a hardened lxml parser producing LxmlElement elements.
+
+    Entities are not resolved, DTDs are neither loaded nor validated, and network
+    access is disabled.
+    """
+    parser = etree.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        dtd_validation=False,
+        remove_blank_text=False,
+    )
+    parser.set_element_class_lookup(etree.ElementDefaultClassLookup(element=LxmlElement))
+    return parser
+
+
+def parse(xml_path):
+    """Parse an XML file into an LxmlDocument.
+
+    Raises:
+        ValueError: If the document contains a DTD (rejected, as defusedxml does)
+    """
+    tree = etree.parse(str(xml_path), make_parser())
+    if tree.docinfo.doctype:
+        raise ValueError(f"DTDs are not allowed: {xml_path}")
+    return LxmlDocument(tree)
+
+
+def fragment_wrapper(document):
+    """Get the opening wrapper tag declaring a document's namespaces for fragments."""
+    ns_decl = " ".join(
+        f'xmlns:{prefix}="{uri}"'
+        for prefix, uri in document.namespace_declarations().items()
+    )
+    default = document.documentElement.nsmap.get(None)
+    if default:
+        ns_decl += f' xmlns="{default}"'
+    return f"<root {ns_decl}>"
+
+
+def parse_fragment(wrapper, xml_content):
+    """Parse an XML fragment inside a wrapper tag from fragment_wrapper().
+
+    Returns:
+        List of top-level LxmlElement nodes, detached and without source lines
+    """
+    root = etree.fromstring(f"{wrapper}{xml_content}</root>", make_parser())
+    for elem in root.iter(etree.Element):
+        elem.sourceline = 0  # Reads back as None, like unparsed minidom nodes
+    return list(root.iterchildren(etree.Element))
+
+
+def _detach(node):
+    """Hand a node's tail text to its preceding sibling or parent before it moves.
+
+    lxml moves an element's tail along with it, whereas minidom leaves the text node
+    where it was; this keeps document whitespace where minidom would keep it.
+    """
+    parent = node.getparent()
+    if parent is None or not node.tail:
+        node.tail = None
+        return
+    previous = node.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or "") + node.tail
+    else:
+        parent.text = (parent.text or "") + node.tail
+    node.tail = None
+
+
+def _prefixed_name(elem, key):
+    if not key.startswith("{"):
+        return key
+    uri, local = key[1:].split("}", 1)
+    if uri == XML_NAMESPACE:
+        return f"xml:{local}"
+    for prefix, ns in elem.nsmap.items():
+        if ns == uri and prefix:
+            return f"{prefix}:{local}"
+    for prefix, ns in OOXML_NAMESPACES.items():
+        if ns == uri:
+            return f"{prefix}:{local}"
+    return local
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark XMLEditor.save() against serializing with toxml() and writing the bytes.
+
+The XML is either a given file (e.g. an unpacked word/document.xml) or a synthetic
+document.xml of --paragraphs paragraphs. For each engine, a copy is opened with
+XMLEditor and written both ways: toxml() (the whole document as one bytes object,
+as save() used to do) and save() (streamed to a temporary file renamed over the
+original). Each is timed (best of --repeat runs) and its peak Python allocations
+are measured with tracemalloc; the outputs are checked to be identical.
+
+Usage:
+    PYTHONPATH=/mnt/skills/docx python -m scripts.save_benchmark
+    PYTHONPATH=/mnt/skills/docx python -m scripts.save_benchmark \\
+        unpacked/word/document.xml --repeat 5
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from .utilities import XMLEditor
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod".split()
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def make_document(path, paragraphs, seed=0):
+    """Write a synthetic document.xml with runs of random text in each paragraph."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:document xmlns:w="{W_NAMESPACE}"><w:body>\n'
+        )
+        for index in range(paragraphs):
+            f.write(f'<w:p w:rsidR="00AB{index % 10000:04d}">')
+            for _ in range(rng.randint(1, 4)):
+                text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 15)))
+                bold = "<w:rPr><w:b/></w:rPr>" if rng.random() < 0.2 else ""
+                f.write(f'<w:r>{bold}<w:t xml:space="preserve">{text} </w:t></w:r>')
+            f.write("</w:p>\n")
+        f.write("</w:body></w:document>\n")
+
+
+def write_with_toxml(editor):
+    """Serialize the whole document with toxml() and write it, as save() used to."""
+    data = editor.dom.toxml(encoding=editor.encoding)
+    with open(editor.xml_path, "wb") as f:
+        f.write(data)
+
+
+def measure(method, editor, repeat):
+    """Time a writer (best of repeat) and trace its peak allocations.
+
+    Returns:
+        tuple: (best seconds, peak MB, bytes written)
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        method(editor)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        method(editor)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak / 1e6, editor.xml_path.read_bytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark XMLEditor.save() against toxml()"
+    )
+    parser.add_argument("xml", nargs="?", help="XML file (default: a synthetic one)")
+    parser.add_argument(
+        "--paragraphs",
+        type=int,
+        default=20000,
+        help="Paragraphs in the synthetic document (default: 20000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument(
+        "--engines", default="minidom,lxml", help="Comma-separated engines to run"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / "source.xml"
+        if args.xml:
+            shutil.copyfile(args.xml, source)
+        else:
+            make_document(source, args.paragraphs)
+        size = source.stat().st_size
+        print(f"{size / 1e6:.1f} MB of XML")
+        print(
+            f"{'engine':>8} {'method':>7} {'seconds':>8} {'MB/s':>7} {'peak MB':>8}"
+        )
+
+        for engine in args.engines.split(","):
+            target = Path(temp_dir) / f"{engine}.xml"
+            shutil.copyfile(source, target)
+            editor = XMLEditor(target, engine=engine)
+            outputs = {}
+            for name, method in (
+                ("toxml", write_with_toxml),
+                ("save", XMLEditor.save),
+            ):
+                seconds, peak, outputs[name] = measure(method, editor, args.repeat)
+                print(
+                    f"{engine:>8} {name:>7} {seconds:>8.3f} "
+                    f"{size / seconds / 1e6:>7.1f} {peak:>8.1f}"
+                )
+            if outputs["save"] != outputs["toxml"]:
+                raise SystemExit(f"save() output differs from toxml() with {engine}")
+
+
+if __name__ == "__main__":
+    main()
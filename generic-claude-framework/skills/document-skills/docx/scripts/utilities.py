@@ -6,6 +6,10 @@ This module provides XMLEditor, a tool for manipulating XML files with support f
 line-number-based node finding and DOM manipulation. Each element is automatically
 annotated with its original line and column position during parsing.
 
+Two parsing engines are available: minidom (default for regular files) and lxml
+(see lxml_dom.py), which is used automatically for files of LXML_SIZE_THRESHOLD bytes
+or more when lxml is installed, or explicitly with engine="lxml".
+
 Example usage:
     editor = XMLEditor("document.xml")
 
@@ -22,6 +26,9 @@ Example usage:
     # Combine filters
     elem = editor.get_node(tag="w:p", line_number=range(1, 50), contains="text")
 
+    # Force a parsing engine
+    editor = XMLEditor("document.xml", engine="lxml")
+
     # Replace, insert, or manipulate
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
@@ -30,13 +37,43 @@ Example usage:
     editor.save()
 """
 
+import copy
 import html
+import os
+import re
+import tempfile
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
 
+# Attributes whose values are indexed for get_node(attrs=...) lookups
+INDEXED_ATTRIBUTES = ("w:id", "w14:paraId", "r:id")
+
+# Paragraph and run level tags whose text is cached and searchable for contains=
+TEXT_INDEXED_TAGS = ("w:p", "w:r", "w:t", "w:delText", "a:p", "a:r", "a:t")
+
+# Minimum number of candidates before contains= uses the document-wide text search
+TEXT_SEARCH_THRESHOLD = 32
+
+# Parsing engines accepted by XMLEditor
+ENGINES = ("auto", "minidom", "lxml")
+
+# File size from which engine="auto" parses with lxml (when installed)
+LXML_SIZE_THRESHOLD = 8 * 1024 * 1024
+
+# Number of parsed fragment templates kept per editor
+FRAGMENT_CACHE_SIZE = 256
+
+# Markup-only fragments (no text content), whose attribute values can be templated
+_MARKUP_ONLY = re.compile(r"(?:\s*<[^<>]*>)*\s*")
+_ATTRIBUTE = re.compile(r"""(\s[^\s=<>/"']+)\s*=\s*(?:"([^"<]*)"|'([^'<]*)')""")
+_ATTRIBUTE_WHITESPACE = str.maketrans("\t\n\r", "   ")
+_REFERENCE = re.compile(r"&(?:#[0-9]+|#x[0-9a-fA-F]+|amp|lt|gt|quot|apos);")
+
 
 class XMLEditor:
     """
@@ -49,29 +86,63 @@ class XMLEditor:
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        engine: Parsing engine in use ('minidom' or 'lxml')
         dom: Parsed DOM tree with parse_position attributes on elements
+        modified: Whether the DOM was changed since it was parsed or last saved
+
+    get_node() answers queries from lazily built indexes (by tag, by source line and
+    by INDEXED_ATTRIBUTES values) and, for TEXT_INDEXED_TAGS, from cached element
+    texts. The insertion helpers keep the indexes up to date; call
+    invalidate_index() after manipulating `dom` directly, which also marks the
+    editor as modified.
     """
 
-    def __init__(self, xml_path):
+    def __init__(self, xml_path, engine="auto"):
         """
         Initialize with path to XML file and parse with line number tracking.
 
         Args:
             xml_path: Path to XML file to edit (str or Path)
+            engine: "minidom", "lxml", or "auto" to use lxml for files of at least
+                    LXML_SIZE_THRESHOLD bytes when it is installed (default: "auto")
 
         Raises:
-            ValueError: If the XML file does not exist
+            ValueError: If the XML file does not exist or the engine is unknown
+            ImportError: If engine="lxml" and lxml is not installed
         """
         self.xml_path = Path(xml_path)
         if not self.xml_path.exists():
             raise ValueError(f"XML file not found: {xml_path}")
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}. Use one of {ENGINES}")
 
         with open(self.xml_path, "rb") as f:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
-        parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        if engine == "auto":
+            engine = (
+                "lxml"
+                if self.xml_path.stat().st_size >= LXML_SIZE_THRESHOLD
+                and _lxml_available()
+                else "minidom"
+            )
+        self.engine = engine
+
+        if self.engine == "lxml":
+            from .lxml_dom import parse
+
+            self.dom = parse(self.xml_path)
+        else:
+            parser = _create_line_tracking_parser()
+            self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._node_index = None
+        self._text_cache = {}  # element -> text, for TEXT_INDEXED_TAGS
+        self._text_search = {}  # tag -> _TextSearch over all elements with that tag
+        self._declared_namespaces = set()  # prefixes known to be declared on the root
+        self._fragment_wrapper = None  # "<root xmlns:...>" for parsing fragments
+        self._fragment_cache = OrderedDict()  # template key -> _FragmentTemplate
+        self.modified = False
 
     def get_node(
         self,
@@ -109,8 +180,23 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
+        # Normalize the search string once: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and "“Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        candidates = self._get_index().candidates(tag, attrs, line_number)
+
+        # For broad queries, find text matches with one pass over the document text
+        text_matches = None
+        if (
+            normalized_contains is not None
+            and tag in TEXT_INDEXED_TAGS
+            and len(candidates) > TEXT_SEARCH_THRESHOLD
+        ):
+            text_matches = self._get_text_search(tag).find(normalized_contains)
+
         matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        for elem in candidates:
             # Check line_number filter
             if line_number is not None:
                 parse_pos = getattr(elem, "parse_position", (None,))
@@ -133,14 +219,17 @@ class XMLEditor:
                     continue
 
             # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
+            if normalized_contains is not None:
+                if text_matches is not None:
+                    if elem not in text_matches:
+                        continue
+                elif normalized_contains not in self._get_element_text(elem):
                     continue
 
+            # Skip elements removed from the document since they were indexed
+            if not self._is_attached(elem):
+                continue
+
             # If all applicable filters passed, this is a match
             matches.append(elem)
 
@@ -186,6 +275,7 @@ class XMLEditor:
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
+        Results for TEXT_INDEXED_TAGS are cached until the element's subtree changes.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
@@ -193,15 +283,44 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
-        text_parts = []
-        for node in elem.childNodes:
-            if node.nodeType == node.TEXT_NODE:
-                # Skip whitespace-only text nodes (XML formatting)
-                if node.data.strip():
-                    text_parts.append(node.data)
-            elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+        cached = self._text_cache.get(elem)
+        if cached is not None:
+            return cached
+
+        if self.engine == "lxml":
+            text = "".join(t for t in elem.itertext() if t.strip())
+        else:
+            text_parts = []
+            for node in elem.childNodes:
+                if node.nodeType == node.TEXT_NODE:
+                    # Skip whitespace-only text nodes (XML formatting)
+                    if node.data.strip():
+                        text_parts.append(node.data)
+                elif node.nodeType == node.ELEMENT_NODE:
+                    text_parts.append(self._get_element_text(node))
+            text = "".join(text_parts)
+
+        if elem.tagName in TEXT_INDEXED_TAGS:
+            self._text_cache[elem] = text
+        return text
+
+    def _get_text_search(self, tag):
+        """Get the substring search structure for a tag, building it if needed."""
+        search = self._text_search.get(tag)
+        if search is None:
+            elems = [
+                e for e in self._get_index().candidates(tag) if self._is_attached(e)
+            ]
+            search = _TextSearch(elems, [self._get_element_text(e) for e in elems])
+            self._text_search[tag] = search
+        return search
+
+    def _invalidate_text(self, node):
+        """Drop cached texts affected by a change at node (node and its ancestors)."""
+        self._text_search.clear()
+        while node is not None:
+            self._text_cache.pop(node, None)
+            node = node.parentNode
 
     def replace_node(self, elem, new_content):
         """
@@ -222,6 +341,10 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._unindex_node(elem)
+        self._index_nodes(nodes)
+        self._invalidate_text(parent)
+        self.modified = True
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +369,8 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._index_nodes(nodes)
+        self.modified = True
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +391,8 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._index_nodes(nodes)
+        self.modified = True
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,8 +412,53 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._index_nodes(nodes)
+        self.modified = True
         return nodes
 
+    def invalidate_index(self):
+        """Discard lookup indexes so the next get_node() rebuilds them from the DOM.
+
+        Only needed after modifying `dom` directly; the insertion helpers keep the
+        indexes current on their own. Also marks the editor as modified so that
+        Document.save() writes it.
+        """
+        self.modified = True
+        self._node_index = None
+        self._text_cache.clear()
+        self._text_search.clear()
+        self._reset_fragment_cache()
+
+    def _get_index(self):
+        """Get the node index, building it from the current DOM on first use."""
+        if self._node_index is None:
+            self._node_index = _NodeIndex(self.dom)
+        return self._node_index
+
+    def _index_nodes(self, nodes):
+        """Add newly inserted nodes and their descendants to the index, if built.
+
+        Also drops the cached texts of the nodes' ancestors, which now include them.
+        """
+        for node in nodes:
+            if self._node_index is not None:
+                self._node_index.add(node)
+            self._invalidate_text(node)
+
+    def _unindex_node(self, node):
+        """Remove a detached node and its descendants from the index, if built."""
+        if self._node_index is not None:
+            self._node_index.remove(node)
+
+    def _is_attached(self, elem):
+        """Check whether an element is still part of this editor's document."""
+        if self.engine == "lxml":
+            return elem.getroottree().getroot() is self.dom.documentElement
+        node = elem
+        while node.parentNode is not None:
+            node = node.parentNode
+        return node is self.dom
+
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
@@ -304,24 +476,161 @@ class XMLEditor:
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The output is streamed to a
+        temporary file in the same directory, which then replaces the original
+        atomically; hard links to the previous version are left untouched. The file
+        keeps the original's permissions (mkstemp would create it as 0600).
+        """
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.xml_path.parent, prefix=f".{self.xml_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), _file_mode(self.xml_path))
+                if self.engine == "lxml":
+                    self.dom.write(f, encoding=self.encoding)
+                else:
+                    writer = _ChunkedWriter(f, self.encoding)
+                    # Same arguments as Document.toxml(encoding=...)
+                    self.dom.writexml(writer, "", "", "", self.encoding)
+                    writer.flush()
+            os.replace(tmp_name, self.xml_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.modified = False
+
+    def _declare_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is not declared yet."""
+        if prefix in self._declared_namespaces:
+            return
+        if self.engine == "lxml":
+            if prefix not in self.dom.namespace_declarations():
+                self.dom.declare_namespace(prefix, uri)
+                self.modified = True
+                self._reset_fragment_cache()
+        else:
+            root = self.dom.documentElement
+            if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+                root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+                self.modified = True
+                self._reset_fragment_cache()
+        self._declared_namespaces.add(prefix)
+
+    def _rename_element(self, elem, tag_name):
+        """Change an element's tag, keeping its attributes, children and position.
+
+        Args:
+            elem: Element to rename
+            tag_name: New qualified tag name (e.g., "w:delText")
+
+        Returns:
+            The renamed element (a new element with the minidom engine)
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        self._unindex_node(elem)
+        if self.engine == "lxml":
+            elem.tag = self.dom.createElement(tag_name).tag
+            renamed = elem
+        else:
+            renamed = self.dom.createElement(tag_name)
+            # Copy ALL child nodes (not just firstChild) to handle entities
+            while elem.firstChild:
+                renamed.appendChild(elem.firstChild)
+            # Preserve attributes like xml:space
+            for i in range(elem.attributes.length):
+                attr = elem.attributes.item(i)
+                renamed.setAttribute(attr.name, attr.value)
+            elem.parentNode.replaceChild(renamed, elem)
+        if self._is_attached(renamed):
+            self._index_nodes([renamed])
+            self.modified = True
+        return renamed
+
+    def _get_leading_text(self, elem):
+        """Get the text before an element's first child element, or None if empty."""
+        if self.engine == "lxml":
+            return elem.text or None
+        node = elem.firstChild
+        if node is not None and node.nodeType == node.TEXT_NODE:
+            return node.data
+        return None
 
     def _parse_fragment(self, xml_content):
         """
         Parse XML fragment and return list of imported nodes.
 
+        Parsed fragments are kept as templates, so repeating a fragment costs a clone
+        rather than a parse. Markup-only fragments (such as comment markers) share a
+        template when they differ only in attribute values, which are then set on
+        the clone.
+
         Args:
             xml_content: String containing XML fragment
 
         Returns:
             List of defusedxml.minidom.Node objects imported into this document
+            (elements only with the lxml engine)
 
         Raises:
             AssertionError: If fragment contains no element nodes
         """
+        values = None
+        key = xml_content
+        if _MARKUP_ONLY.fullmatch(xml_content):
+            raw_values = []
+            shape = _ATTRIBUTE.sub(
+                lambda m: _template_attribute(m, raw_values), xml_content
+            )
+            # Only template values that an XML parser would accept unchanged
+            if not any("&" in _REFERENCE.sub("", v) for v in raw_values):
+                key = shape
+                values = [
+                    html.unescape(v.translate(_ATTRIBUTE_WHITESPACE))
+                    for v in raw_values
+                ]
+
+        template = self._fragment_cache.get(key)
+        if template is not None and template.fits(values):
+            self._fragment_cache.move_to_end(key)
+            return template.instantiate(values)
+
+        nodes = self._parse_fragment_uncached(xml_content)
+        template = _FragmentTemplate(nodes, self.engine, templated=values is not None)
+        if template.fits(values):
+            self._fragment_cache[key] = template
+            if len(self._fragment_cache) > FRAGMENT_CACHE_SIZE:
+                self._fragment_cache.popitem(last=False)
+        return nodes
+
+    def _parse_fragment_uncached(self, xml_content):
+        """Parse an XML fragment in the namespace context of the root element."""
+        if self._fragment_wrapper is None:
+            self._fragment_wrapper = self._build_fragment_wrapper()
+
+        if self.engine == "lxml":
+            from .lxml_dom import parse_fragment
+
+            nodes = parse_fragment(self._fragment_wrapper, xml_content)
+            assert nodes, "Fragment must contain at least one element"
+            return nodes
+
+        wrapper = f"{self._fragment_wrapper}{xml_content}</root>"
+        fragment_doc = defusedxml.minidom.parseString(wrapper)
+        nodes = [
+            self.dom.importNode(child, deep=True)
+            for child in fragment_doc.documentElement.childNodes  # type: ignore
+        ]
+        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+        assert elements, "Fragment must contain at least one element"
+        return nodes
+
+    def _build_fragment_wrapper(self):
+        """Build the opening wrapper tag carrying the root's namespace declarations."""
+        if self.engine == "lxml":
+            from .lxml_dom import fragment_wrapper
+
+            return fragment_wrapper(self.dom)
+
         # Extract namespace declarations from the root document element
         root_elem = self.dom.documentElement
         namespaces = []
@@ -332,16 +641,232 @@ class XMLEditor:
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
 
         ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+        return f"<root {ns_decl}>"
+
+    def _reset_fragment_cache(self):
+        """Forget the namespace wrapper and templates after namespace changes."""
+        self._fragment_wrapper = None
+        self._fragment_cache.clear()
+
+
+class _FragmentTemplate:
+    """Parsed fragment kept detached and cloned for each use.
+
+    For templated (markup-only) fragments, slots lists the attributes in source
+    order as (element position, attribute name), so the values of a fragment with
+    the same shape can be applied to a clone.
+    """
+
+    def __init__(self, nodes, engine, templated=False):
+        self.engine = engine
+        self.nodes = [self._clone(node) for node in nodes]
+        self.slots = []
+        if templated:
+            for position, elem in enumerate(self._elements(self.nodes)):
+                for i in range(elem.attributes.length):
+                    name = elem.attributes.item(i).name
+                    if not name.startswith("xmlns"):
+                        self.slots.append((position, name))
+
+    def fits(self, values):
+        """Check whether attribute values line up with this template's slots."""
+        return values is None or len(values) == len(self.slots)
+
+    def instantiate(self, values=None):
+        """Clone the template nodes, applying attribute values in slot order."""
+        nodes = [self._clone(node) for node in self.nodes]
+        if values:
+            elements = self._elements(nodes)
+            for (position, name), value in zip(self.slots, values):
+                elements[position].setAttribute(name, value)
         return nodes
 
+    def _clone(self, node):
+        if self.engine == "lxml":
+            return copy.deepcopy(node)
+        return node.cloneNode(True)
+
+    @staticmethod
+    def _elements(nodes):
+        """All elements of the nodes and their descendants, in document order."""
+        elements = []
+        for node in nodes:
+            if node.nodeType == node.ELEMENT_NODE:
+                elements.append(node)
+                elements.extend(node.getElementsByTagName("*"))
+        return elements
+
+
+class _NodeIndex:
+    """Lookup tables over a DOM for XMLEditor.get_node.
+
+    Holds elements by tag (document order as of the build, newly inserted elements
+    appended), parsed elements by source line per tag, and elements by the value of
+    each INDEXED_ATTRIBUTES attribute. Entries may go stale when the DOM is changed
+    behind the index's back, so callers must still verify every candidate.
+    """
+
+    def __init__(self, dom):
+        self.by_tag = {}  # tag -> {element: None}, an insertion-ordered set
+        self.by_attr = {}  # (attribute, value) -> {element: None}
+        self.lines = {}  # tag -> ([line, ...], [element, ...]) sorted by line
+        for elem in dom.getElementsByTagName("*"):
+            self._add_element(elem)
+            line = getattr(elem, "parse_position", (None,))[0]
+            if line is not None:
+                lines, elems = self.lines.setdefault(elem.tagName, ([], []))
+                lines.append(line)
+                elems.append(elem)
+
+    def add(self, node):
+        """Index an element node and all of its descendants."""
+        if node.nodeType != node.ELEMENT_NODE:
+            return
+        self._add_element(node)
+        for elem in node.getElementsByTagName("*"):
+            self._add_element(elem)
+
+    def remove(self, node):
+        """Drop an element node and all of its descendants from the index."""
+        if node.nodeType != node.ELEMENT_NODE:
+            return
+        self._remove_element(node)
+        for elem in node.getElementsByTagName("*"):
+            self._remove_element(elem)
+
+    def candidates(self, tag, attrs=None, line_number=None):
+        """Get elements with the given tag that may satisfy the attrs/line filters.
+
+        Uses the most selective index available: an indexed attribute value, then the
+        line index, then all elements with the tag.
+        """
+        if attrs:
+            for name in INDEXED_ATTRIBUTES:
+                if name in attrs:
+                    elems = self.by_attr.get((name, attrs[name]), {})
+                    return [e for e in elems if e.tagName == tag]
+
+        if line_number is not None:
+            lines, elems = self.lines.get(tag, ([], []))
+            if isinstance(line_number, range):
+                if not line_number:
+                    return []
+                first, last = sorted((line_number[0], line_number[-1]))
+            else:
+                first = last = line_number
+            tagged = self.by_tag.get(tag, {})
+            return [
+                e
+                for e in elems[bisect_left(lines, first) : bisect_left(lines, last + 1)]
+                if e in tagged
+            ]
+
+        return list(self.by_tag.get(tag, {}))
+
+    def _add_element(self, elem):
+        self.by_tag.setdefault(elem.tagName, {})[elem] = None
+        for name in INDEXED_ATTRIBUTES:
+            value = elem.getAttribute(name)
+            if value:
+                self.by_attr.setdefault((name, value), {})[elem] = None
+
+    def _remove_element(self, elem):
+        self.by_tag.get(elem.tagName, {}).pop(elem, None)
+        for name in INDEXED_ATTRIBUTES:
+            value = elem.getAttribute(name)
+            if value:
+                self.by_attr.get((name, value), {}).pop(elem, None)
+
+
+class _TextSearch:
+    """Substring search over the texts of all elements with one tag.
+
+    Texts are joined with a separator that cannot appear in XML character data, so a
+    single str.find() pass over the joined text finds every element whose own text
+    contains the needle, and offsets map back to elements by bisection.
+    """
+
+    SEPARATOR = "\x00"
+
+    def __init__(self, elems, texts):
+        self.elems = elems
+        self.starts = []
+        offset = 0
+        for text in texts:
+            self.starts.append(offset)
+            offset += len(text) + len(self.SEPARATOR)
+        self.text = self.SEPARATOR.join(texts)
+
+    def find(self, needle):
+        """Get the elements whose text contains needle, as an insertion-ordered set."""
+        if not needle:
+            return dict.fromkeys(self.elems)
+
+        matches = {}
+        pos = self.text.find(needle)
+        while pos != -1:
+            i = bisect_right(self.starts, pos) - 1
+            matches[self.elems[i]] = None
+            # Continue after this element; it already matched
+            if i + 1 >= len(self.starts):
+                break
+            pos = self.text.find(needle, self.starts[i + 1])
+        return matches
+
+
+def _file_mode(path):
+    """Permission bits for a file replacing path: path's own, or the umask default."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class _ChunkedWriter:
+    """Text writer for minidom's writexml() that encodes into a file in chunks.
+
+    Encoding errors become character references, as in minidom's toxml().
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, file, encoding):
+        self.file = file
+        self.encoding = encoding
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            data = "".join(self.parts)
+            self.file.write(data.encode(self.encoding, "xmlcharrefreplace"))
+            self.parts = []
+            self.size = 0
+
+
+def _template_attribute(match, values):
+    """Blank an attribute value in a fragment key, collecting the raw value."""
+    if match.group(1).strip().startswith("xmlns"):
+        return match.group(0)
+    values.append(match.group(2) if match.group(2) is not None else match.group(3))
+    return f'{match.group(1)}=""'
+
+
+def _lxml_available():
+    try:
+        import lxml.etree  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
 def _create_line_tracking_parser():
     """
@@ -1,29 +1,189 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx).
 
+Example usage:
+    python unpack.py <office_file> <output_dir>
+    python unpack.py <office_file> <output_dir> --pretty "word/document.xml" --pretty "word/comments*.xml"
+
+Library usage:
+    from ooxml.scripts.unpack import unpack_document
+
+    # Extract everything and pretty-print all XML parts (same as the CLI default)
+    unpacked = unpack_document("report.docx", "unpacked")
+
+    # Only pretty-print the parts that will be edited
+    unpacked = unpack_document("report.docx", "unpacked", pretty=["word/document.xml"])
+
+    # Materialize parts on first access only
+    unpacked = unpack_document("report.docx", "unpacked", lazy=True)
+    document_xml = unpacked["word/document.xml"]  # Extracted and formatted now
+"""
+
+import argparse
 import random
-import sys
-import defusedxml.minidom
 import zipfile
+from fnmatch import fnmatchcase
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
+import defusedxml.minidom
+
+# Members treated as XML parts (everything else is considered binary)
+XML_PATTERNS = ("*.xml", "*.rels")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("office_file", help="Office file to unpack (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to extract into")
+    parser.add_argument(
+        "--pretty",
+        action="append",
+        metavar="PATTERN",
+        help="Only pretty-print parts matching this glob (repeatable, default: all XML)",
+    )
+    parser.add_argument(
+        "--skip-binary",
+        action="store_true",
+        help="Do not extract non-XML members such as media and embeddings",
+    )
+    args = parser.parse_args()
+
+    unpack_document(
+        args.office_file,
+        args.output_dir,
+        pretty=args.pretty if args.pretty else XML_PATTERNS,
+        skip_binary=args.skip_binary,
+    )
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(
+    input_file, output_dir, pretty=XML_PATTERNS, lazy=False, skip_binary=False
+):
+    """Unpack an Office file (.docx/.pptx/.xlsx) into a directory.
+
+    Args:
+        input_file: Path to the Office file
+        output_dir: Directory to extract into (created if missing)
+        pretty: Glob patterns of member names to pretty-print (default: all XML parts).
+                Pass an empty list to extract parts verbatim.
+        lazy: If True, parts are only extracted when first accessed
+        skip_binary: If True, members that are not XML parts are never extracted
+
+    Returns:
+        UnpackedDocument: Handle to the unpacked parts
+
+    Raises:
+        ValueError: If the input file is not a valid Office (zip) file
+    """
+    unpacked = UnpackedDocument(input_file, output_dir, pretty, skip_binary)
+    if not lazy:
+        unpacked.materialize_all()
+    return unpacked
+
+
+class UnpackedDocument:
+    """Unpacked Office file whose parts are extracted on demand.
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
+    Attributes:
+        input_file: Path to the source Office file
+        path: Directory the parts are extracted into
+        names: Member names of the package, in archive order
+    """
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
+    def __init__(self, input_file, output_dir, pretty=XML_PATTERNS, skip_binary=False):
+        """Read the archive index without extracting anything.
+
+        Args:
+            input_file: Path to the Office file
+            output_dir: Directory to extract into (created if missing)
+            pretty: Glob patterns of member names to pretty-print
+            skip_binary: If True, members that are not XML parts are never extracted
+        """
+        self.input_file = Path(input_file)
+        self.path = Path(output_dir)
+        self.pretty = tuple(pretty)
+        self.skip_binary = skip_binary
+
+        if not zipfile.is_zipfile(self.input_file):
+            raise ValueError(f"{self.input_file} is not a valid Office file")
+
+        with zipfile.ZipFile(self.input_file) as zf:
+            self.names = [info.filename for info in zf.infolist() if not info.is_dir()]
+        self._materialized = set()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def __getitem__(self, name):
+        """Get the extracted path of a part, extracting it on first access."""
+        return self.materialize(name)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def materialize(self, name):
+        """Extract a single part (and pretty-print it if it matches) if not done yet.
+
+        Args:
+            name: Member name inside the package (e.g., "word/document.xml")
+
+        Returns:
+            Path: Location of the extracted part
+
+        Raises:
+            KeyError: If the part does not exist in the package
+            ValueError: If the part is binary and skip_binary is enabled
+        """
+        if name not in self.names:
+            raise KeyError(f"Part not found in {self.input_file.name}: {name}")
+        if name not in self._materialized:
+            with zipfile.ZipFile(self.input_file) as zf:
+                self._extract(zf, name)
+        return self.path / name
+
+    def materialize_all(self):
+        """Extract every part that is not excluded by skip_binary."""
+        with zipfile.ZipFile(self.input_file) as zf:
+            for name in self.names:
+                if name in self._materialized:
+                    continue
+                if self.skip_binary and not is_xml_part(name):
+                    continue
+                self._extract(zf, name)
+
+    @property
+    def materialized(self):
+        """Member names that have been extracted so far."""
+        return sorted(self._materialized)
+
+    def _extract(self, zf, name):
+        if self.skip_binary and not is_xml_part(name):
+            raise ValueError(f"Binary part skipped by skip_binary: {name}")
+        extracted = Path(zf.extract(name, self.path))
+        if is_xml_part(name) and _matches_any(name, self.pretty):
+            pretty_print_xml(extracted)
+        self._materialized.add(name)
+
+
+def is_xml_part(name):
+    """Check whether a package member is an XML part."""
+    return _matches_any(name, XML_PATTERNS)
+
+
+def pretty_print_xml(xml_file):
+    """Reformat an XML file in place with two-space indentation."""
+    content = Path(xml_file).read_text(encoding="utf-8")
     dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+    Path(xml_file).write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+
+
+def _matches_any(name, patterns):
+    return any(fnmatchcase(name, pattern) for pattern in patterns)
+
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+if __name__ == "__main__":
+    main()
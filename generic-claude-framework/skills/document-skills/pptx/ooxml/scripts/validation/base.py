@@ -7,6 +7,48 @@ from pathlib import Path
 
 import lxml.etree
 
+# Compiled XSD schemas by path; compiling wml.xsd alone takes a noticeable fraction of
+# a second, and every validated part (plus its original) needs a schema
+_schema_cache = {}
+
+
+def load_schema(schema_path):
+    """Get the compiled XMLSchema for an XSD file, compiling it on first use.
+
+    Raises:
+        lxml.etree.XMLSchemaParseError: If the schema can't be compiled (the failure
+            is cached and raised again on later calls)
+    """
+    schema_path = Path(schema_path)
+    if schema_path not in _schema_cache:
+        try:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+                _schema_cache[schema_path] = lxml.etree.XMLSchema(xsd_doc)
+        except Exception as e:
+            _schema_cache[schema_path] = e
+    schema = _schema_cache[schema_path]
+    if isinstance(schema, Exception):
+        raise schema
+    return schema
+
+
+def warm_schema_cache():
+    """Compile every schema in BaseSchemaValidator.SCHEMA_MAPPINGS ahead of time.
+
+    Useful in long-lived or worker processes that validate many documents. Schemas
+    that fail to compile are skipped here and reported when a file needs them.
+    """
+    schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+    for relative_path in sorted(set(BaseSchemaValidator.SCHEMA_MAPPINGS.values())):
+        try:
+            load_schema(schemas_dir / relative_path)
+        except Exception:
+            continue
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -830,13 +872,7 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            schema = load_schema(schema_path)
 
             # Load and preprocess XML
             with open(xml_file, "r") as f:
@@ -886,17 +922,15 @@ class BaseSchemaValidator:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Extract original file
+            # Extract only the corresponding file from the original
             with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+                if relative_path.as_posix() not in zip_ref.namelist():
+                    # File didn't exist in original, so no original errors
+                    return set()
+                zip_ref.extract(relative_path.as_posix(), temp_path)
 
-            # Find corresponding file in original
             original_xml_file = temp_path / relative_path
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
             # Validate the specific file in original
             is_valid, errors = self._validate_single_file_xsd(
                 original_xml_file, temp_path
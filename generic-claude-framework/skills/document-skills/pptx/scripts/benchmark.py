@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pptx scripts on a synthetic deck and check for regressions.
+
+A deck is generated with synthetic_deck.make_deck() (or given with --deck), and each
+benchmark is run once under tracemalloc for its peak memory and then --repeat times
+for its best time. Setup (the deck, replacement JSON, slide images) is not timed:
+    inventory       extract_text_inventory() with the default "xml" engine
+    inventory_pptx  extract_text_inventory() with the "pptx" engine
+    replace         apply_replacements() with the deck's own inventory as replacements
+    rearrange       rearrange_presentation() reversing the deck and repeating 2 slides
+    thumbnail_grid  create_grids() with placeholder outlines, on slide images drawn
+                    from the inventory (the soffice/pdftoppm rendering is not included)
+
+Each benchmark runs in a fresh process, so results don't depend on which benchmarks
+ran before it (--only results compare with a full baseline). After setup, the
+inventory's process-wide caches are cleared: the traced run measures text and loads
+fonts from scratch. The timed runs keep the font and text measurement caches warm,
+but start with an empty inventory cache, so "replace" always extracts the inventory.
+
+Results are printed and can be written as JSON (--output). With --baseline, results
+are compared with a baseline recorded by --save-baseline for the same deck, and the
+exit status is 1 if a time or peak exceeds the baseline by more than its threshold
+(a fraction of the baseline, stored with it; --time-threshold/--memory-threshold
+override it).
+
+Usage:
+    python benchmark.py --save-baseline baseline.json
+    python benchmark.py --baseline baseline.json
+    python benchmark.py --slides 200 --shapes 12 --group-depth 3 --only inventory
+    python benchmark.py --deck template.pptx --output results.json
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from inventory import (
+    clear_inventory_caches,
+    extract_text_inventory,
+    get_inventory_as_dict,
+)
+from PIL import Image, ImageDraw
+from pptx import Presentation
+from synthetic_deck import make_deck
+from thumbnail import (
+    CONVERSION_DPI,
+    DEFAULT_COLS,
+    THUMBNAIL_WIDTH,
+    create_grids,
+    get_placeholder_regions,
+)
+
+BENCHMARKS = ("inventory", "inventory_pptx", "replace", "rearrange", "thumbnail_grid")
+
+# Version of the results/baseline JSON layout
+BASELINE_VERSION = 1
+
+# Allowed growth over the baseline, as a fraction of it
+DEFAULT_THRESHOLDS = {"seconds": 0.3, "peak_mb": 0.1}
+
+# Changes smaller than these are never regressions (timer and allocator noise)
+MIN_REGRESSION = {"seconds": 0.005, "peak_mb": 0.5}
+
+
+def setup_benchmark(name, deck_path, work_dir):
+    """Prepare a benchmark; returns the callable to time."""
+    if name == "inventory":
+        return lambda: extract_text_inventory(deck_path)
+
+    if name == "inventory_pptx":
+        return lambda: extract_text_inventory(deck_path, engine="pptx")
+
+    if name == "replace":
+        from replace import apply_replacements
+
+        replacements_path = work_dir / "replacements.json"
+        replacements_path.write_text(
+            json.dumps(get_inventory_as_dict(deck_path)), encoding="utf-8"
+        )
+        output_path = work_dir / "replaced.pptx"
+        return lambda: apply_replacements(
+            str(deck_path), str(replacements_path), str(output_path)
+        )
+
+    if name == "rearrange":
+        from rearrange import rearrange_presentation
+
+        slide_count = len(Presentation(str(deck_path)).slides)
+        sequence = list(reversed(range(slide_count))) + [0, slide_count // 2]
+        output_path = work_dir / "rearranged.pptx"
+        return lambda: rearrange_presentation(deck_path, output_path, sequence)
+
+    if name == "thumbnail_grid":
+        regions, dimensions = get_placeholder_regions(deck_path)
+        image_paths = _draw_slide_images(deck_path, regions, dimensions, work_dir)
+        output_path = work_dir / "grid.jpg"
+        return lambda: create_grids(
+            image_paths,
+            DEFAULT_COLS,
+            THUMBNAIL_WIDTH,
+            output_path,
+            regions,
+            dimensions,
+        )
+
+    raise ValueError(f"Unknown benchmark {name!r} (expected one of {BENCHMARKS})")
+
+
+def _draw_slide_images(deck_path, regions, dimensions, work_dir):
+    """Draw a stand-in JPEG per slide, as pdftoppm would produce at CONVERSION_DPI."""
+    slide_count = len(Presentation(str(deck_path)).slides)
+    width, height = (round(inches * CONVERSION_DPI) for inches in dimensions)
+    image_paths = []
+    for slide_idx in range(slide_count):
+        image = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(image)
+        for region in regions.get(slide_idx, []):
+            left = region["left"] * CONVERSION_DPI
+            top = region["top"] * CONVERSION_DPI
+            draw.rectangle(
+                [
+                    (left, top),
+                    (
+                        left + region["width"] * CONVERSION_DPI,
+                        top + region["height"] * CONVERSION_DPI,
+                    ),
+                ],
+                fill=(230, 236, 245),
+            )
+        image_path = work_dir / f"slide-{slide_idx + 1:03d}.jpg"
+        image.save(image_path, "JPEG")
+        image_paths.append(image_path)
+    return image_paths
+
+
+def run_benchmark(method, repeat, before_run=None):
+    """Measure a callable's peak memory (one traced run) and best time.
+
+    Args:
+        method: Callable to measure
+        repeat: Number of timed runs
+        before_run: Optional callable run (untimed) before each timed run
+
+    Returns:
+        dict: {"seconds": best time, "peak_mb": peak traced allocation in MB}
+    """
+    tracemalloc.start()
+    try:
+        method()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # Timed with the garbage collector off, as timeit does
+    best = None
+    gc_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            if before_run is not None:
+                before_run()
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            method()
+            elapsed = time.perf_counter() - start
+            gc.enable()
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return {"seconds": round(best, 4), "peak_mb": round(peak / 1e6, 2)}
+
+
+def run_benchmarks(deck_path, names=BENCHMARKS, repeat=5):
+    """Run benchmarks on a deck, each in a fresh process with its output suppressed.
+
+    Returns:
+        dict: {name: measurements, or {"skipped": reason} if a script's
+        dependencies are missing}
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in names:
+            work_dir = Path(temp_dir) / name
+            work_dir.mkdir()
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results[name] = executor.submit(
+                    _run_isolated, name, str(deck_path), str(work_dir), repeat
+                ).result()
+    return results
+
+
+def _run_isolated(name, deck_path, work_dir, repeat):
+    """Set up and measure one benchmark (in a worker process)."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            method = setup_benchmark(name, Path(deck_path), Path(work_dir))
+        except ImportError as e:
+            return {"skipped": str(e)}
+        # Setup may have measured the deck already; the traced run starts cold
+        clear_inventory_caches()
+        return run_benchmark(
+            method,
+            repeat,
+            before_run=lambda: clear_inventory_caches(measurement=False),
+        )
+
+
+def find_regressions(results, baseline, thresholds):
+    """Compare results with a baseline.
+
+    Returns:
+        list: "name metric: baseline -> now (+N%)" for each value over its threshold
+    """
+    regressions = []
+    for name, measured in results.items():
+        recorded = baseline.get("results", {}).get(name, {})
+        for metric, threshold in thresholds.items():
+            if metric not in measured or metric not in recorded:
+                continue
+            before, now = recorded[metric], measured[metric]
+            if (
+                now > before * (1 + threshold)
+                and now - before > MIN_REGRESSION[metric]
+            ):
+                change = (now / before - 1) * 100 if before else float("inf")
+                regressions.append(
+                    f"{name} {metric}: {before} -> {now} (+{change:.0f}%)"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pptx scripts on a synthetic deck"
+    )
+    parser.add_argument("--deck", help="Benchmark this .pptx instead of generating one")
+    parser.add_argument("--slides", type=int, default=40, help="Slides (default: 40)")
+    parser.add_argument(
+        "--shapes", type=int, default=8, help="Text boxes per slide (default: 8)"
+    )
+    parser.add_argument(
+        "--group-depth", type=int, default=2, help="Group nesting depth (default: 2)"
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=3, help="Paragraphs per text box (default: 3)"
+    )
+    parser.add_argument(
+        "--words", type=int, default=12, help="Average words per paragraph (default: 12)"
+    )
+    parser.add_argument("--fonts", type=int, default=3, help="Font names (default: 3)")
+    parser.add_argument(
+        "--images", type=int, default=1, help="Pictures per slide (default: 1)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "--only",
+        help=f"Comma-separated benchmarks to run (default: all of {', '.join(BENCHMARKS)})",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs (default: 5)")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare with this baseline JSON file")
+    parser.add_argument(
+        "--save-baseline", help="Write the results as a baseline to this JSON file"
+    )
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        help=f"Allowed time growth (default: baseline's, or {DEFAULT_THRESHOLDS['seconds']})",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        help="Allowed peak memory growth "
+        f"(default: baseline's, or {DEFAULT_THRESHOLDS['peak_mb']})",
+    )
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if baseline.get("version") != BASELINE_VERSION:
+            raise SystemExit(f"Unsupported baseline version in {args.baseline}")
+    thresholds = dict(
+        baseline.get("thresholds", DEFAULT_THRESHOLDS) if baseline else DEFAULT_THRESHOLDS
+    )
+    if args.time_threshold is not None:
+        thresholds["seconds"] = args.time_threshold
+    if args.memory_threshold is not None:
+        thresholds["peak_mb"] = args.memory_threshold
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.deck:
+            deck_path = Path(args.deck)
+            deck = {"path": deck_path.name}
+        else:
+            deck_path = Path(temp_dir) / "synthetic.pptx"
+            deck = make_deck(
+                deck_path,
+                slides=args.slides,
+                shapes_per_slide=args.shapes,
+                group_depth=args.group_depth,
+                paragraphs=args.paragraphs,
+                words=args.words,
+                fonts=args.fonts,
+                images=args.images,
+                seed=args.seed,
+            )
+        if baseline and baseline.get("deck") != deck:
+            raise SystemExit(
+                f"{args.baseline} was recorded for a different deck: {baseline.get('deck')}"
+            )
+        results = run_benchmarks(deck_path, names, args.repeat)
+
+    report = {
+        "version": BASELINE_VERSION,
+        "deck": deck,
+        "repeat": args.repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "thresholds": thresholds,
+        "results": results,
+    }
+
+    recorded = baseline.get("results", {}) if baseline else {}
+    print(
+        f"{'benchmark':<16} {'seconds':>9} {'peak MB':>9}"
+        + (f" {'baseline s':>11} {'baseline MB':>12}" if baseline else "")
+    )
+    for name, measured in results.items():
+        if "skipped" in measured:
+            print(f"{name:<16} skipped: {measured['skipped']}")
+            continue
+        line = f"{name:<16} {measured['seconds']:>9.4f} {measured['peak_mb']:>9.2f}"
+        if name in recorded and "seconds" in recorded[name]:
+            line += (
+                f" {recorded[name]['seconds']:>11.4f} {recorded[name]['peak_mb']:>12.2f}"
+            )
+        print(line)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+            print(f"Results saved to: {path}")
+
+    if baseline:
+        regressions = find_regressions(results, baseline, thresholds)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over the baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("No regressions over the baseline")
+
+
+if __name__ == "__main__":
+    main()
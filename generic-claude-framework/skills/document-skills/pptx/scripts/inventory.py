@@ -13,27 +13,81 @@ This module provides functionality to:
 Classes:
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
+    FontResolver: Finds and loads fonts for overflow estimation, with caching
+    TextMetrics: Memoized text measurement and line wrapping for one font
+    ThemeStyleCache: Slide master text style font sizes, resolved once per master
+    InventoryCache: Per-slide inventory results keyed by slide, layout and master XML
+    XmlInventoryReader: Reads inventory entries straight from the slide XML ("xml" engine)
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    iter_text_inventory: Extract the text slide by slide (generator)
     save_inventory: Save extracted data to JSON
+    write_inventory: Stream extracted data as JSON or NDJSON, one slide at a time
 
 Usage:
     python inventory.py input.pptx output.json
+
+    # Process slides in 8 worker processes
+    python inventory.py input.pptx output.json --jobs 8
+
+    # Read shapes through python-pptx objects (the engine used before the XML reader)
+    python inventory.py input.pptx output.json --engine pptx
+
+    # Stream shapes with issues to stdout, one JSON line per shape, slide by slide
+    python inventory.py input.pptx - --issues-only --format ndjson
+
+    # Reuse results for slides unchanged since an earlier run
+    python inventory.py input.pptx output.json --cache-dir ~/.cache/pptx-inventory
+
+    # Persist the font directory index between runs
+    PPTX_FONT_INDEX=~/.cache/pptx-fonts.json python inventory.py input.pptx output.json
 """
 
 import argparse
+import hashlib
 import json
+import os
 import platform
+import posixpath
 import sys
+import tempfile
+import weakref
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from lxml import etree
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.dml.color import ColorFormat
+from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
 from pptx.shapes.base import BaseShape
+from pptx.text.text import Font
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
@@ -45,6 +99,72 @@ InventoryData = Dict[
     str, Dict[str, "ShapeData"]
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
+SlideEntries = List[
+    Tuple[str, int, "ShapeData"]
+]  # (shape-N, index in collect_slide_shapes() order, ShapeData) in inventory order
+TextFrameParagraphs = List[
+    Tuple[str, Optional["ParagraphData"], int]
+]  # (paragraph.text, ParagraphData if it has text, outline level) per paragraph
+Margins = Tuple[int, int, int, int]  # Text frame insets (left, top, right, bottom) in EMUs
+
+# Loaded FreeTypeFont objects kept per process, keyed by (path, size)
+FONT_CACHE_SIZE = 64
+
+# Optional JSON file persisting the font directory index between runs
+FONT_INDEX_ENV = "PPTX_FONT_INDEX"
+
+# Measured strings (and wrapped lines) remembered per font before the caches reset
+TEXT_CACHE_SIZE = 100_000
+
+# Slide master text styles (p:txStyles children) used for default font sizes
+THEME_TEXT_STYLES = ("titleStyle", "bodyStyle", "otherStyle")
+
+# Slides with at least this many shapes use the NumPy overlap path when available
+NUMPY_OVERLAP_MIN_SHAPES = 200
+
+# Tasks per worker process in parallel extraction (more tasks balance uneven slides)
+TASKS_PER_JOB = 4
+
+# Optional directory persisting per-slide inventory results between runs
+INVENTORY_CACHE_ENV = "PPTX_INVENTORY_CACHE"
+
+# Part of every inventory cache key; bump when cached results change meaning
+INVENTORY_CACHE_VERSION = 1
+
+# Inventory engines: "xml" reads the slide XML directly (XmlInventoryReader), "pptx"
+# goes through python-pptx shape objects
+INVENTORY_ENGINES = ("xml", "pptx")
+
+# Output formats of write_inventory(): one JSON document, or one JSON line per shape
+INVENTORY_FORMATS = ("json", "ndjson")
+
+# Shape tree children that are shapes (as python-pptx iterates them)
+XML_SHAPE_TAGS = tuple(
+    qn(tag)
+    for tag in ("p:sp", "p:grpSp", "p:graphicFrame", "p:cxnSp", "p:pic", "p:contentPart")
+)
+
+# Master placeholder type a layout placeholder inherits its position from
+LAYOUT_BASE_PLACEHOLDER_TYPES = {
+    PP_PLACEHOLDER.BODY: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.BITMAP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.CENTER_TITLE: PP_PLACEHOLDER.TITLE,
+    PP_PLACEHOLDER.ORG_CHART: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.DATE: PP_PLACEHOLDER.DATE,
+    PP_PLACEHOLDER.FOOTER: PP_PLACEHOLDER.FOOTER,
+    PP_PLACEHOLDER.MEDIA_CLIP: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.OBJECT: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.PICTURE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.SLIDE_NUMBER: PP_PLACEHOLDER.SLIDE_NUMBER,
+    PP_PLACEHOLDER.SUBTITLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TABLE: PP_PLACEHOLDER.BODY,
+    PP_PLACEHOLDER.TITLE: PP_PLACEHOLDER.TITLE,
+}
+
+_font_resolver = None
+_inventory_cache = None
+_text_metrics: "weakref.WeakKeyDictionary[Any, TextMetrics]" = weakref.WeakKeyDictionary()
 
 
 def main():
@@ -60,6 +180,15 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 8
+    Processes slides in 8 worker processes (same output, in slide order)
+
+  python inventory.py presentation.pptx inventory.json --engine pptx
+    Reads shapes through python-pptx objects instead of the slide XML (same output)
+
+  python inventory.py presentation.pptx - --issues-only --format ndjson
+    Streams one line per problem shape to stdout as each slide is checked
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -70,12 +199,40 @@ The output JSON includes:
     )
 
     parser.add_argument("input", help="Input PowerPoint file (.pptx)")
-    parser.add_argument("output", help="Output JSON file for inventory")
+    parser.add_argument(
+        "output", help="Output JSON file for inventory (- for standard output)"
+    )
     parser.add_argument(
         "--issues-only",
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for per-slide extraction (default: 1)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=INVENTORY_ENGINES,
+        default="xml",
+        help="Read slides from the XML directly (xml, default) or through "
+        "python-pptx shape objects (pptx)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=INVENTORY_FORMATS,
+        default="json",
+        help="Write one JSON document (json, default) or one JSON line per shape "
+        "(ndjson)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get(INVENTORY_CACHE_ENV),
+        help="Directory caching per-slide results between runs "
+        f"(default: ${INVENTORY_CACHE_ENV})",
+    )
 
     args = parser.parse_args()
 
@@ -88,37 +245,80 @@ The output JSON includes:
         print("Error: Input must be a PowerPoint file (.pptx)")
         sys.exit(1)
 
+    # With output to stdout ("-"), progress messages go to stderr
+    log = sys.stderr if args.output == "-" else sys.stdout
+    output_path = None
     try:
-        print(f"Extracting text inventory from: {args.input}")
+        print(f"Extracting text inventory from: {args.input}", file=log)
         if args.issues_only:
             print(
-                "Filtering to include only text shapes with issues (overflow/overlap)"
+                "Filtering to include only text shapes with issues (overflow/overlap)",
+                file=log,
+            )
+        cache = InventoryCache(args.cache_dir) if args.cache_dir else None
+        # Slides are written as they are extracted
+        inventory = iter_text_inventory(
+            input_path,
+            issues_only=args.issues_only,
+            jobs=args.jobs,
+            cache=cache,
+            engine=args.engine,
+        )
+
+        if args.output == "-":
+            total_slides, total_shapes = write_inventory(
+                inventory, sys.stdout, args.format
+            )
+            sys.stdout.write("\n" if args.format == "json" else "")
+            sys.stdout.flush()
+        else:
+            output_path = Path(args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            total_slides, total_shapes = save_inventory(
+                inventory, output_path, args.format
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+            print(f"Output saved to: {args.output}", file=log)
 
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        # Report fonts that fell back to PIL's default font
+        resolver = get_font_resolver()
+        if resolver.missing_fonts:
+            print(
+                "Fonts not found (estimated with default font): "
+                + ", ".join(sorted(resolver.missing_fonts)),
+                file=log,
+            )
 
-        print(f"Output saved to: {args.output}")
+        if cache:
+            print(
+                f"Inventory cache: {cache.stats['hits']} slides reused, "
+                f"{cache.stats['misses']} measured",
+                file=log,
+            )
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
         if args.issues_only:
             if total_shapes > 0:
                 print(
-                    f"Found {total_shapes} text elements with issues in {total_slides} slides"
+                    f"Found {total_shapes} text elements with issues in {total_slides} slides",
+                    file=log,
                 )
             else:
-                print("No issues discovered")
+                print("No issues discovered", file=log)
         else:
             print(
-                f"Found text in {total_slides} slides with {total_shapes} text elements"
+                f"Found text in {total_slides} slides with {total_shapes} text elements",
+                file=log,
             )
 
+    except BrokenPipeError:
+        # Output piped to a reader that stopped early (e.g. head); exit quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
     except Exception as e:
-        print(f"Error processing presentation: {e}")
+        # Don't leave a truncated inventory behind
+        if output_path is not None and output_path.exists():
+            output_path.unlink()
+        print(f"Error processing presentation: {e}", file=log)
         import traceback
 
         traceback.print_exc()
@@ -135,7 +335,13 @@ class ShapeWithPosition:
 
 
 class ParagraphData:
-    """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
+    """Data structure for paragraph properties extracted from a PowerPoint paragraph.
+
+    Properties are read from the paragraph's XML without the python-pptx accessors
+    that add missing elements (paragraph.alignment/level add a:pPr, run.font adds
+    a:rPr and font.color turns the run's fill into an empty a:solidFill), so reading
+    never changes the presentation.
+    """
 
     def __init__(self, paragraph: Any):
         """Initialize from a PowerPoint paragraph object.
@@ -143,7 +349,23 @@ class ParagraphData:
         Args:
             paragraph: The PowerPoint paragraph object
         """
-        self.text: str = paragraph.text.strip()
+        self._read(paragraph._p, paragraph.text)
+
+    @classmethod
+    def from_xml(cls, p: Any, text: str) -> "ParagraphData":
+        """Create from an a:p element, without a python-pptx paragraph object.
+
+        Args:
+            p: The a:p element (parsed with python-pptx's XML parser)
+            text: The paragraph text, as python-pptx's paragraph.text returns it
+        """
+        para = cls.__new__(cls)
+        para._read(p, text)
+        return para
+
+    def _read(self, p: Any, text: str) -> None:
+        """Read the paragraph's properties from its a:p element."""
+        self.text: str = text.strip()
         self.bullet: bool = False
         self.level: Optional[int] = None
         self.alignment: Optional[str] = None
@@ -158,43 +380,40 @@ class ParagraphData:
         self.theme_color: Optional[str] = None
         self.line_spacing: Optional[float] = None
 
+        pPr = p.pPr
+
         # Check for bullet formatting
-        if (
-            hasattr(paragraph, "_p")
-            and paragraph._p is not None
-            and paragraph._p.pPr is not None
-        ):
-            pPr = paragraph._p.pPr
+        if pPr is not None:
             ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
             if (
                 pPr.find(f"{ns}buChar") is not None
                 or pPr.find(f"{ns}buAutoNum") is not None
             ):
                 self.bullet = True
-                if hasattr(paragraph, "level"):
-                    self.level = paragraph.level
+                self.level = pPr.lvl
 
         # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
+        if pPr is not None and pPr.algn is not None:
             alignment_map = {
                 PP_ALIGN.CENTER: "CENTER",
                 PP_ALIGN.RIGHT: "RIGHT",
                 PP_ALIGN.JUSTIFY: "JUSTIFY",
             }
-            if paragraph.alignment in alignment_map:
-                self.alignment = alignment_map[paragraph.alignment]
+            if pPr.algn in alignment_map:
+                self.alignment = alignment_map[pPr.algn]
 
         # Add spacing properties if set
-        if hasattr(paragraph, "space_before") and paragraph.space_before:
-            self.space_before = paragraph.space_before.pt
-        if hasattr(paragraph, "space_after") and paragraph.space_after:
-            self.space_after = paragraph.space_after.pt
-
-        # Extract font properties from first run
-        if paragraph.runs:
-            first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
-                font = first_run.font
+        if pPr is not None and pPr.space_before:
+            self.space_before = pPr.space_before.pt
+        if pPr is not None and pPr.space_after:
+            self.space_after = pPr.space_after.pt
+
+        # Extract font properties from first run (a run without rPr sets none)
+        r = p.find(qn("a:r"))
+        if r is not None:
+            rPr = r.rPr
+            if rPr is not None:
+                font = Font(rPr)
                 if font.name:
                     self.font_name = font.name
                 if font.size:
@@ -206,27 +425,34 @@ class ParagraphData:
                 if font.underline is not None:
                     self.underline = font.underline
 
-                # Handle color - both RGB and theme colors
-                try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
-                except (AttributeError, TypeError):
-                    # Fall back to theme color
+                # Handle color - both RGB and theme colors (only solid fills have one)
+                solid_fill = rPr.find(qn("a:solidFill"))
+                if solid_fill is not None:
+                    color = ColorFormat.from_colorchoice_parent(solid_fill)
                     try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
+                        # Try RGB color first
+                        if color.rgb:
+                            self.color = str(color.rgb)
                     except (AttributeError, TypeError):
-                        pass
-
-        # Add line spacing if set
-        if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
-            if hasattr(paragraph.line_spacing, "pt"):
-                self.line_spacing = round(paragraph.line_spacing.pt, 2)
+                        # Fall back to theme color
+                        try:
+                            if color.theme_color:
+                                self.theme_color = color.theme_color.name
+                        except (AttributeError, TypeError):
+                            pass
+
+        # Add line spacing if set (an a:lnSpc without a value has none)
+        try:
+            line_spacing = pPr.line_spacing if pPr is not None else None
+        except AttributeError:
+            line_spacing = None
+        if line_spacing is not None:
+            if hasattr(line_spacing, "pt"):
+                self.line_spacing = round(line_spacing.pt, 2)
             else:
                 # Multiplier - convert to points
                 font_size = self.font_size if self.font_size else 12.0
-                self.line_spacing = round(paragraph.line_spacing * font_size, 2)
+                self.line_spacing = round(line_spacing * font_size, 2)
 
     def to_dict(self) -> ParagraphDict:
         """Convert to dictionary for JSON serialization, excluding None values."""
@@ -286,61 +512,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return get_font_resolver().resolve(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -391,6 +563,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        theme_styles: Optional["ThemeStyleCache"] = None,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,9 +572,13 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            theme_styles: Optional ThemeStyleCache shared by the shapes of a
+                          presentation (default: one for this shape only)
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
+        self.theme_styles = theme_styles if theme_styles else ThemeStyleCache()
+        self._paragraphs: Optional[List[ParagraphData]] = None  # Set when detached
 
         # Get slide dimensions from slide object
         self.slide_width_emu, self.slide_height_emu = (
@@ -453,21 +630,87 @@ class ShapeData:
         self.width_emu = shape.width if hasattr(shape, "width") else 0
         self.height_emu = shape.height if hasattr(shape, "height") else 0
 
-        # Calculate overflow status
-        self.frame_overflow_bottom: Optional[float] = None
-        self.slide_overflow_right: Optional[float] = None
-        self.slide_overflow_bottom: Optional[float] = None
-        self.overlapping_shapes: Dict[
-            str, float
-        ] = {}  # Dict of shape_id -> overlap area in sq inches
-        self.warnings: List[str] = []
-        self._estimate_frame_overflow()
-        self._calculate_slide_overflow()
-        self._detect_bullet_issues()
+        if hasattr(shape, "text_frame"):
+            self._measure(*self.read_text_frame(shape.text_frame))  # type: ignore
+        else:
+            self._measure([], None)
+
+    @staticmethod
+    def read_text_frame(text_frame: Any) -> Tuple[TextFrameParagraphs, Margins]:
+        """Read the paragraphs and margins of a python-pptx text frame for measurement."""
+        paragraphs: TextFrameParagraphs = []
+        for paragraph in text_frame.paragraphs:
+            text = paragraph.text
+            # Outline level read without paragraph.level, which adds a missing pPr
+            pPr = paragraph._p.pPr
+            paragraphs.append(
+                (
+                    text,
+                    ParagraphData(paragraph) if text.strip() else None,
+                    pPr.lvl if pPr is not None else 0,
+                )
+            )
+        margins = (
+            text_frame.margin_left,
+            text_frame.margin_top,
+            text_frame.margin_right,
+            text_frame.margin_bottom,
+        )
+        return paragraphs, margins
+
+    @classmethod
+    def from_paragraphs(
+        cls,
+        paragraphs: TextFrameParagraphs,
+        margins: Margins,
+        position: Tuple[int, int, int, int],
+        slide_size: Tuple[Optional[int], Optional[int]],
+        placeholder_type: Optional[str] = None,
+        default_font_size: Optional[float] = None,
+        text_style: Optional["TextStyleSizes"] = None,
+    ) -> "ShapeData":
+        """Create a detached ShapeData from text and properties read from the XML.
+
+        Used by XmlInventoryReader, which reads shapes from the slide XML rather than
+        through python-pptx shape objects.
+
+        Args:
+            paragraphs: The text frame's paragraphs (see read_text_frame())
+            margins: The text frame's margins (see read_text_frame())
+            position: (left, top, width, height) on the slide in EMUs
+            slide_size: (width, height) of the slide in EMUs, or (None, None)
+            placeholder_type: Placeholder type name (e.g. 'TITLE'), if a placeholder
+            default_font_size: Default font size in points from the slide layout
+            text_style: Slide master text style sizes that apply to the shape
+        """
+        shape_data = cls.__new__(cls)
+        shape_data.shape = None
+        shape_data.shape_id = ""
+        shape_data.theme_styles = None
+        shape_data._paragraphs = [para for _, para, _ in paragraphs if para]
+        shape_data._text_style = text_style
+        shape_data.slide_width_emu, shape_data.slide_height_emu = slide_size
+        shape_data.placeholder_type = placeholder_type
+        shape_data.default_font_size = default_font_size
+
+        left_emu, top_emu, width_emu, height_emu = position
+        shape_data.left = round(cls.emu_to_inches(left_emu), 2)
+        shape_data.top = round(cls.emu_to_inches(top_emu), 2)
+        shape_data.width = round(cls.emu_to_inches(width_emu), 2)
+        shape_data.height = round(cls.emu_to_inches(height_emu), 2)
+        shape_data.left_emu = left_emu
+        shape_data.top_emu = top_emu
+        shape_data.width_emu = width_emu
+        shape_data.height_emu = height_emu
+
+        shape_data._measure(paragraphs, margins)
+        return shape_data
 
     @property
     def paragraphs(self) -> List[ParagraphData]:
         """Calculate paragraphs from the shape's text frame."""
+        if self.shape is None and self._paragraphs is not None:
+            return self._paragraphs
         if not self.shape or not hasattr(self.shape, "text_frame"):
             return []
 
@@ -477,49 +720,94 @@ class ShapeData:
                 paragraphs.append(ParagraphData(paragraph))
         return paragraphs
 
-    def _get_default_font_size(self) -> int:
-        """Get default font size from theme text styles or use conservative default."""
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the python-pptx shape, keeping its paragraphs.
+
+        Used to send results back from extraction workers; the unpickled ShapeData is
+        detached (shape is None) until a shape is assigned to it again.
+        """
+        state = dict(self.__dict__)
+        state["_paragraphs"] = self.paragraphs
+        state["shape"] = None
+        state["theme_styles"] = None
+        state.pop("_text_style", None)
+        return state
+
+    def to_state(self) -> Dict[str, Any]:
+        """Get the detached state (see __getstate__) as JSON-serializable data."""
+        state = self.__getstate__()
+        state["_paragraphs"] = [dict(vars(para)) for para in state["_paragraphs"]]
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "ShapeData":
+        """Create a detached ShapeData from to_state() data."""
+        shape_data = cls.__new__(cls)
+        shape_data.__dict__.update(state)
+        paragraphs = []
+        for para_state in state["_paragraphs"]:
+            para = ParagraphData.__new__(ParagraphData)
+            para.__dict__.update(para_state)
+            paragraphs.append(para)
+        shape_data._paragraphs = paragraphs
+        return shape_data
+
+    def _measure(
+        self, paragraphs: TextFrameParagraphs, margins: Optional[Margins]
+    ) -> None:
+        """Calculate the overflow status and warnings of the shape's text frame."""
+        self.frame_overflow_bottom: Optional[float] = None
+        self.slide_overflow_right: Optional[float] = None
+        self.slide_overflow_bottom: Optional[float] = None
+        self.overlapping_shapes: Dict[
+            str, float
+        ] = {}  # Dict of shape_id -> overlap area in sq inches
+        self.warnings: List[str] = []
+        self._estimate_frame_overflow(paragraphs, margins)
+        self._calculate_slide_overflow()
+        self._detect_bullet_issues(paragraphs)
+
+    def _get_default_font_size(self, level: int = 0) -> int:
+        """Get default font size from theme text styles or use conservative default.
+
+        Args:
+            level: Paragraph outline level (0-8); levels above 0 use the size of the
+                   matching lvlNpPr when the theme style defines one
+        """
+        size = self._text_style.size(level) if self._text_style else None
+        return size if size is not None else 14  # Conservative default for body text
+
+    @cached_property
+    def _text_style(self) -> Optional["TextStyleSizes"]:
+        """The slide master text style sizes that apply to this shape."""
         try:
             if not (
                 hasattr(self.shape, "part") and hasattr(self.shape.part, "slide_layout")
             ):
-                return 14
+                return None
 
             slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
             if not hasattr(slide_master, "element"):
-                return 14
+                return None
 
             # Determine theme style based on placeholder type
             style_name = "bodyStyle"  # Default
             if self.placeholder_type and "TITLE" in self.placeholder_type:
                 style_name = "titleStyle"
 
-            # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            return self.theme_styles.get(slide_master, style_name)
         except Exception:
-            pass
+            return None
 
-        return 14  # Conservative default for body text
-
-    def _get_usable_dimensions(self, text_frame) -> Tuple[int, int]:
+    def _get_usable_dimensions(self, insets: Optional[Margins]) -> Tuple[int, int]:
         """Get usable width and height in pixels after accounting for margins."""
         # Default PowerPoint margins in inches
         margins = {"top": 0.05, "bottom": 0.05, "left": 0.1, "right": 0.1}
 
         # Override with actual margins if set
-        if hasattr(text_frame, "margin_top") and text_frame.margin_top:
-            margins["top"] = self.emu_to_inches(text_frame.margin_top)
-        if hasattr(text_frame, "margin_bottom") and text_frame.margin_bottom:
-            margins["bottom"] = self.emu_to_inches(text_frame.margin_bottom)
-        if hasattr(text_frame, "margin_left") and text_frame.margin_left:
-            margins["left"] = self.emu_to_inches(text_frame.margin_left)
-        if hasattr(text_frame, "margin_right") and text_frame.margin_right:
-            margins["right"] = self.emu_to_inches(text_frame.margin_right)
+        for side, inset in zip(("left", "top", "right", "bottom"), insets or ()):
+            if inset:
+                margins[side] = self.emu_to_inches(inset)
 
         # Calculate usable area
         usable_width = self.width - margins["left"] - margins["right"]
@@ -531,82 +819,39 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
+    def _wrap_text_line(self, line: str, max_width_px: int, font) -> List[str]:
         """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
+        return get_text_metrics(font).wrap(line, max_width_px)
 
-        return wrapped
-
-    def _estimate_frame_overflow(self) -> None:
+    def _estimate_frame_overflow(
+        self, paragraphs: TextFrameParagraphs, margins: Optional[Margins]
+    ) -> None:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
+        if not paragraphs:
             return
 
         # Get usable dimensions after accounting for margins
-        usable_width_px, usable_height_px = self._get_usable_dimensions(text_frame)
+        usable_width_px, usable_height_px = self._get_usable_dimensions(margins)
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
-        # Get default font size from placeholder or use conservative estimate
-        default_font_size = self._get_default_font_size()
-
         # Calculate total height of all paragraphs
         total_height_px = 0
 
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
+        for para_idx, (text, para_data, level) in enumerate(paragraphs):
+            if para_data is None:
                 continue
 
-            para_data = ParagraphData(paragraph)
-
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
-            font_size = int(para_data.font_size or default_font_size)
+            font_size = int(para_data.font_size or self._get_default_font_size(level))
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font = get_font_resolver().load_font(font_name, font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
+            for line in text.split("\n"):
+                wrapped = self._wrap_text_line(line, usable_width_px, font)
                 all_wrapped_lines.extend(wrapped)
 
             if all_wrapped_lines:
@@ -657,20 +902,13 @@ class ShapeData:
             if overflow_inches > 0.01:  # Only report significant overflows
                 self.slide_overflow_bottom = overflow_inches
 
-    def _detect_bullet_issues(self) -> None:
+    def _detect_bullet_issues(self, paragraphs: TextFrameParagraphs) -> None:
         """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
-
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        for text, _, _ in paragraphs:
+            text = text.strip()
             # Check for manual bullet symbols
             if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
                 self.warnings.append(
@@ -739,10 +977,886 @@ class ShapeData:
         return result
 
 
+class FontResolver:
+    """Resolves font names to font files and loads fonts, with caching.
+
+    The system font directories are listed once (or loaded from a persistent index
+    whose directory mtimes still match), name lookups are memoized, and loaded
+    FreeTypeFont objects are kept in an LRU keyed by (path, size). Lookups follow
+    the same order as a direct search: per directory, exact file names for each
+    name variant and extension, then the first file containing the name.
+
+    Attributes:
+        font_dirs: Directories searched, in order
+        extensions: Font file extensions accepted
+        stats: Counters for resolutions, missing fonts and font loads
+        missing_fonts: Font names that fell back to PIL's default font
+    """
+
+    def __init__(
+        self,
+        font_dirs: Optional[List[str]] = None,
+        extensions: Optional[List[str]] = None,
+        index_path: Optional[Path] = None,
+        max_fonts: int = FONT_CACHE_SIZE,
+    ):
+        """Create a resolver.
+
+        Args:
+            font_dirs: Directories to search (default: the platform's font directories)
+            extensions: Accepted extensions (default: the platform's font extensions)
+            index_path: Optional JSON file to persist the directory index in
+            max_fonts: Number of loaded fonts to keep (default: FONT_CACHE_SIZE)
+        """
+        default_dirs, default_extensions = _platform_font_locations()
+        self.font_dirs = [
+            Path(d).expanduser() for d in (font_dirs if font_dirs else default_dirs)
+        ]
+        self.extensions = extensions if extensions else default_extensions
+        self.index_path = Path(index_path) if index_path else None
+        self.max_fonts = max_fonts
+        self.stats = {
+            "resolved": 0,
+            "missing": 0,
+            "font_loads": 0,
+            "font_cache_hits": 0,
+        }
+        self.missing_fonts: set = set()
+        self._index: Optional[Dict[str, List[Tuple[str, bool]]]] = None
+        self._paths: Dict[str, Optional[str]] = {}
+        self._fonts: OrderedDict = OrderedDict()
+
+    def resolve(self, font_name: str) -> Optional[str]:
+        """Get the font file path for a font name, or None if not found."""
+        if font_name not in self._paths:
+            self._paths[font_name] = self._search(font_name)
+        path = self._paths[font_name]
+        if path:
+            self.stats["resolved"] += 1
+        else:
+            self.stats["missing"] += 1
+            self.missing_fonts.add(font_name)
+        return path
+
+    def load_font(self, font_name: str, size: int):
+        """Load a font by name and size, falling back to PIL's default font.
+
+        Returns:
+            ImageFont.FreeTypeFont, or the default font if the font can't be found or
+            loaded
+        """
+        path = self.resolve(font_name)
+        if not path:
+            return self._load(None, size)
+        try:
+            return self._load(path, size)
+        except Exception:
+            self.missing_fonts.add(font_name)
+            return self._load(None, size)
+
+    def _load(self, path: Optional[str], size: int):
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            self.stats["font_cache_hits"] += 1
+            return font
+        if path is None:
+            font = ImageFont.load_default()
+        else:
+            font = ImageFont.truetype(path, size=size)
+        self.stats["font_loads"] += 1
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def _search(self, font_name: str) -> Optional[str]:
+        variants = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        needle = font_name.lower().replace(" ", "")
+        for font_dir, entries in self._get_index().items():
+            names = {name for name, _ in entries}
+            # First try exact matches
+            for variant in variants:
+                for ext in self.extensions:
+                    if f"{variant}{ext}" in names:
+                        return str(Path(font_dir) / f"{variant}{ext}")
+            # Then try fuzzy matching - find files containing the font name
+            for name, is_file in entries:
+                name_lower = name.lower()
+                if (
+                    is_file
+                    and needle in name_lower
+                    and any(name_lower.endswith(ext) for ext in self.extensions)
+                ):
+                    return str(Path(font_dir) / name)
+        return None
+
+    def _get_index(self) -> Dict[str, List[Tuple[str, bool]]]:
+        """List each existing font directory once: {dir: [(name, is_file), ...]}."""
+        if self._index is not None:
+            return self._index
+
+        mtimes = {}
+        for font_dir in self.font_dirs:
+            try:
+                mtimes[str(font_dir)] = font_dir.stat().st_mtime_ns
+            except OSError:
+                continue
+
+        if self.index_path and self.index_path.exists():
+            try:
+                saved = json.loads(self.index_path.read_text(encoding="utf-8"))
+                if saved.get("mtimes") == mtimes:
+                    self._index = {
+                        d: [(name, is_file) for name, is_file in entries]
+                        for d, entries in saved["entries"].items()
+                    }
+                    return self._index
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        index = {}
+        for font_dir in mtimes:
+            try:
+                with os.scandir(font_dir) as it:
+                    index[font_dir] = [(e.name, e.is_file()) for e in it]
+            except OSError:
+                index[font_dir] = []
+        self._index = index
+
+        if self.index_path:
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                self.index_path.write_text(
+                    json.dumps({"mtimes": mtimes, "entries": index}), encoding="utf-8"
+                )
+            except OSError:
+                pass
+        return index
+
+
+def get_font_resolver() -> FontResolver:
+    """Get the process-wide FontResolver, created on first use.
+
+    Set the PPTX_FONT_INDEX environment variable to a file path to persist the font
+    directory index between runs.
+    """
+    global _font_resolver
+    if _font_resolver is None:
+        _font_resolver = FontResolver(index_path=os.environ.get(FONT_INDEX_ENV))
+    return _font_resolver
+
+
+def _platform_font_locations() -> Tuple[List[str], List[str]]:
+    """Get the font directories and extensions to search on this platform."""
+    if platform.system() == "Darwin":  # macOS
+        return (
+            ["/System/Library/Fonts/", "/Library/Fonts/", "~/Library/Fonts/"],
+            [".ttf", ".otf", ".ttc", ".dfont"],
+        )
+    # Linux
+    return (
+        ["/usr/share/fonts/truetype/", "/usr/local/share/fonts/", "~/.fonts/"],
+        [".ttf", ".otf"],
+    )
+
+
+class TextMetrics:
+    """Memoized text measurement and greedy word wrapping for one font.
+
+    Wrapping gives the same lines as adding words one at a time and measuring each
+    candidate line with ImageDraw.textlength, without measuring every prefix: words
+    are measured once, a line's width is composed from its word widths, the space
+    width and the kerning of the character pairs at each join, and the break point
+    is found by binary search over those composed widths.
+
+    With PIL's basic layout a string's width is the sum of its glyph advances plus
+    pair kerning, so composed widths equal measured ones. With other layouts
+    (e.g. Raqm shaping) or bitmap fonts they are an approximation, and the break
+    point is confirmed by measuring the lines on either side of it.
+
+    Attributes:
+        font: The PIL font measured
+        exact_composition: Whether composed widths equal measured widths
+    """
+
+    def __init__(self, font):
+        """Create a measurer for a font loaded with PIL's ImageFont."""
+        self.font = font
+        self.exact_composition = (
+            isinstance(font, ImageFont.FreeTypeFont)
+            and font.layout_engine == ImageFont.Layout.BASIC
+        )
+        self._draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        self._lengths: Dict[str, float] = {}
+        self._wraps: Dict[Tuple[str, int], List[str]] = {}
+
+    def length(self, text: str) -> float:
+        """Get the width of text in pixels, as ImageDraw.textlength measures it."""
+        width = self._lengths.get(text)
+        if width is None:
+            if len(self._lengths) >= TEXT_CACHE_SIZE:
+                self._lengths.clear()
+            width = self._draw.textlength(text, font=self.font)
+            self._lengths[text] = width
+        return width
+
+    def wrap(self, line: str, max_width_px: int) -> List[str]:
+        """Wrap a single line of text (no newlines) to fit within max_width_px.
+
+        Words are split on single spaces and added to the current line while the line
+        still fits; a word that doesn't fit starts the next line, and a word wider
+        than max_width_px gets a line of its own.
+        """
+        if not line:
+            return [""]
+
+        key = (line, max_width_px)
+        wrapped = self._wraps.get(key)
+        if wrapped is None:
+            if len(self._wraps) >= TEXT_CACHE_SIZE:
+                self._wraps.clear()
+            wrapped = self._wrap(line, max_width_px)
+            self._wraps[key] = wrapped
+        return list(wrapped)
+
+    def _wrap(self, line: str, max_width_px: int) -> List[str]:
+        if self.length(line) <= max_width_px:
+            return [line]
+
+        words = line.split(" ")
+        count = len(words)
+        word_widths = [self.length(word) for word in words]
+
+        # joined[k]: width of words[1..k-1] appended to words[0] one by one, each as
+        # " " + word, including the kerning at both sides of the space. The text
+        # before a join ends with the previous word, or with a space if it is empty
+        space = self.length(" ")
+        joined = [0.0, 0.0]
+        for k in range(1, count):
+            previous = words[k - 1][-1:] or " "
+            width = space + word_widths[k] + self._kerning(previous, " ")
+            if words[k]:
+                width += self._kerning(" ", words[k][0])
+            joined.append(joined[-1] + width)
+
+        def composed(start: int, end: int) -> float:
+            # Width of " ".join(words[start:end]) for a non-empty words[start]
+            return word_widths[start] + joined[end] - joined[start + 1]
+
+        wrapped = []
+        start = 0
+        while start < count:
+            # Empty words only add to a line once it has text
+            if not words[start]:
+                start += 1
+                continue
+
+            # Largest end whose line fits; the first word always takes the line
+            low, high = start + 1, count
+            while low < high:
+                middle = (low + high + 1) // 2
+                if composed(start, middle) <= max_width_px:
+                    low = middle
+                else:
+                    high = middle - 1
+            end = low
+
+            if not self.exact_composition:
+                # Confirm the break point against measured widths
+                while end > start + 1 and (
+                    self.length(" ".join(words[start:end])) > max_width_px
+                ):
+                    end -= 1
+                while end < count and (
+                    self.length(" ".join(words[start : end + 1])) <= max_width_px
+                ):
+                    end += 1
+
+            wrapped.append(" ".join(words[start:end]))
+            start = end
+
+        return wrapped
+
+    def _kerning(self, left: str, right: str) -> float:
+        """Get the width adjustment between two characters set next to each other."""
+        return self.length(left + right) - self.length(left) - self.length(right)
+
+
+def get_text_metrics(font) -> TextMetrics:
+    """Get the shared TextMetrics for a font, created on first use."""
+    metrics = _text_metrics.get(font)
+    if metrics is None:
+        metrics = TextMetrics(font)
+        _text_metrics[font] = metrics
+    return metrics
+
+
+@dataclass
+class TextStyleSizes:
+    """Font sizes in points defined by one slide master text style."""
+
+    default: Optional[int]  # First size in the style (normally from lvl1pPr)
+    levels: Dict[int, int]  # Outline level 1-9 -> size from lvlNpPr/defRPr
+
+    def size(self, level: int = 0) -> Optional[int]:
+        """Get the size for a paragraph level (0-8), falling back to the default."""
+        if level > 0 and level + 1 in self.levels:
+            return self.levels[level + 1]
+        return self.default
+
+
+class ThemeStyleCache:
+    """Slide master text style font sizes, resolved once per master and style.
+
+    Reading a size used to walk the whole slide master tree for every text shape;
+    the cache walks each master's p:txStyles once and keeps the sizes keyed by master
+    part and style name.
+    """
+
+    def __init__(self):
+        self._styles: Dict[Tuple[Any, str], TextStyleSizes] = {}
+
+    def preload(self, prs: Any) -> None:
+        """Resolve the text styles of every slide master in a presentation."""
+        for slide_master in prs.slide_masters:
+            for style_name in THEME_TEXT_STYLES:
+                try:
+                    self.get(slide_master, style_name)
+                except Exception:
+                    # Left to fail again (and fall back) where the size is needed
+                    pass
+
+    def get(self, slide_master: Any, style_name: str) -> TextStyleSizes:
+        """Get the font sizes of a text style (e.g. 'titleStyle') of a slide master."""
+        return self.get_for_element(
+            slide_master.part, slide_master.element, style_name
+        )
+
+    def get_for_element(
+        self, master_key: Any, master_element: Any, style_name: str
+    ) -> TextStyleSizes:
+        """Get the font sizes of a text style of a p:sldMaster element.
+
+        Args:
+            master_key: Hashable identifying the slide master (e.g. its part)
+            master_element: The p:sldMaster element
+            style_name: Text style name (e.g. 'titleStyle')
+        """
+        key = (master_key, style_name)
+        sizes = self._styles.get(key)
+        if sizes is None:
+            sizes = self._resolve(master_element, style_name)
+            self._styles[key] = sizes
+        return sizes
+
+    @staticmethod
+    def _resolve(master_element: Any, style_name: str) -> TextStyleSizes:
+        for child in master_element.iter():
+            tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
+            if tag != style_name:
+                continue
+
+            default = None
+            levels = {}
+            for elem in child.iter():
+                if "sz" not in elem.attrib:
+                    continue
+                size = int(elem.attrib["sz"]) // 100
+                if default is None:
+                    default = size
+                parent = elem.getparent()
+                parent_tag = parent.tag.split("}")[-1] if parent is not None else ""
+                if (
+                    elem.tag.endswith("}defRPr")
+                    and parent_tag.startswith("lvl")
+                    and parent_tag.endswith("pPr")
+                    and parent_tag[3:-3].isdigit()
+                ):
+                    levels.setdefault(int(parent_tag[3:-3]), size)
+            if default is not None:
+                return TextStyleSizes(default, levels)
+        return TextStyleSizes(None, {})
+
+
+class InventoryCache:
+    """Per-slide inventory results keyed by a hash of the slide, layout and master XML.
+
+    Entries hold a slide's full inventory (before any issues_only filtering): the
+    detached ShapeData state of each shape and its position in collect_slide_shapes()
+    order, used to attach the slide's live shapes when the entry is reused. Entries
+    are kept in memory and, with cache_dir, as one JSON file per key, so they can be
+    reused across runs. Keys also cover the slide size and INVENTORY_CACHE_VERSION.
+
+    Attributes:
+        cache_dir: Directory for persistent entries, or None to keep them in memory only
+        stats: Counters for slides reused ("hits") and measured ("misses")
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: Dict[str, str] = {}  # key -> JSON
+
+    def slide_keys(self, slides: List[Any]) -> List[str]:
+        """Compute the cache key of each slide from its current XML."""
+        part_digests: Dict[int, bytes] = {}
+
+        def digest(part: Any) -> bytes:
+            # Layouts and masters are shared by many slides; hash each once
+            if id(part) not in part_digests:
+                part_digests[id(part)] = hashlib.sha256(part.blob).digest()
+            return part_digests[id(part)]
+
+        keys = []
+        for slide in slides:
+            layout = slide.slide_layout
+            keys.append(
+                self.make_key(
+                    ShapeData.get_slide_dimensions(slide),
+                    digest(layout.slide_master.part),
+                    digest(layout.part),
+                    slide.part.blob,
+                )
+            )
+        return keys
+
+    @staticmethod
+    def make_key(
+        slide_size: Tuple[Optional[int], Optional[int]],
+        master_digest: bytes,
+        layout_digest: bytes,
+        slide_xml: bytes,
+    ) -> str:
+        """Build a cache key from the slide size and the master, layout and slide XML.
+
+        Args:
+            slide_size: (width, height) of the slide in EMUs
+            master_digest: SHA-256 digest of the slide master XML
+            layout_digest: SHA-256 digest of the slide layout XML
+            slide_xml: The slide XML
+
+        All XML is serialized the way python-pptx saves parts, so keys computed from a
+        Presentation and by XmlInventoryReader agree.
+        """
+        width, height = slide_size
+        key = hashlib.sha256(f"{INVENTORY_CACHE_VERSION}:{width}:{height}:".encode())
+        key.update(master_digest)
+        key.update(layout_digest)
+        key.update(slide_xml)
+        return key.hexdigest()
+
+    def get(self, key: str) -> Optional[SlideEntries]:
+        """Get the detached entries stored for a key, or None."""
+        data = self._entries.get(key)
+        if data is None and self.cache_dir:
+            try:
+                data = (self.cache_dir / f"{key}.json").read_text(encoding="utf-8")
+                self._entries[key] = data
+            except OSError:
+                data = None
+        if data is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return [
+            (shape_key, position, ShapeData.from_state(state))
+            for shape_key, position, state in json.loads(data)
+        ]
+
+    def put(self, key: str, entries: SlideEntries) -> None:
+        """Store a slide's full (unfiltered) entries under a key."""
+        data = json.dumps(
+            [
+                [shape_key, position, shape_data.to_state()]
+                for shape_key, position, shape_data in entries
+            ]
+        )
+        self._entries[key] = data
+        if not self.cache_dir:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError:
+            pass
+
+
+def get_inventory_cache() -> InventoryCache:
+    """Get the process-wide InventoryCache, created on first use.
+
+    Set the PPTX_INVENTORY_CACHE environment variable to a directory to persist
+    per-slide results between runs.
+    """
+    global _inventory_cache
+    if _inventory_cache is None:
+        _inventory_cache = InventoryCache(os.environ.get(INVENTORY_CACHE_ENV))
+    return _inventory_cache
+
+
+def clear_inventory_caches(measurement: bool = True) -> None:
+    """Drop the process-wide caches, as in a fresh process.
+
+    Args:
+        measurement: If True (default), also drop the FontResolver (its loaded fonts
+                     and font index) and every TextMetrics; otherwise only the
+                     inventory cache is dropped
+    """
+    global _font_resolver, _inventory_cache
+    _inventory_cache = None
+    if measurement:
+        _font_resolver = None
+        _text_metrics.clear()
+
+
+# Tags XmlInventoryReader looks for, in Clark notation
+_P_GRPSP, _P_SP, _P_TXBODY = qn("p:grpSp"), qn("p:sp"), qn("p:txBody")
+_A_BODYPR, _A_P, _A_R, _A_FLD, _A_BR, _A_T = (
+    qn(tag) for tag in ("a:bodyPr", "a:p", "a:r", "a:fld", "a:br", "a:t")
+)
+
+
+class XmlInventoryReader:
+    """Reads inventory entries straight from a presentation's slide, layout and master XML.
+
+    This is the "xml" engine of extract_text_inventory(). Parts are read from the
+    package with zipfile and parsed with lxml (using python-pptx's element classes),
+    shapes are found by walking each slide's p:spTree, and group offsets and placeholder
+    positions (slide placeholder -> layout placeholder with the same idx -> master
+    placeholder of the matching type) are resolved from the parsed trees. Text frames
+    are read from the a:p elements as ParagraphData reads them for the "pptx" engine,
+    which builds python-pptx shape, text frame and paragraph objects (and repeats
+    their inheritance lookups) for every shape. Layouts and masters are parsed once
+    per reader.
+
+    Entries are detached (ShapeData.shape is None).
+
+    Attributes:
+        slide_count: Number of slides in the presentation
+        slide_size: (width, height) of the slides in EMUs, or (None, None)
+    """
+
+    def __init__(self, pptx_path: Union[str, Path]):
+        self._zip = zipfile.ZipFile(pptx_path)
+        self.theme_styles = ThemeStyleCache()
+        self._layouts: Dict[str, Dict[str, Any]] = {}
+        self._masters: Dict[str, Dict[str, Any]] = {}
+
+        presentation_name = self._related(
+            "", RT.OFFICE_DOCUMENT
+        )  # e.g. ppt/presentation.xml
+        presentation = parse_xml(self._zip.read(presentation_name))
+        sldSz = presentation.find(qn("p:sldSz"))
+        self.slide_size: Tuple[Optional[int], Optional[int]] = (
+            (sldSz.cx, sldSz.cy) if sldSz is not None else (None, None)
+        )
+
+        # (slide partname, layout partname) in presentation order
+        targets = self._relationships(presentation_name)
+        self._slides: List[Tuple[str, str]] = []
+        sldIdLst = presentation.find(qn("p:sldIdLst"))
+        for sldId in sldIdLst if sldIdLst is not None else ():
+            target = targets.get(sldId.get(qn("r:id")))
+            if target is not None and target[0] == RT.SLIDE:
+                slide_name = target[1]
+                self._slides.append(
+                    (slide_name, self._related(slide_name, RT.SLIDE_LAYOUT))
+                )
+        self.slide_count = len(self._slides)
+
+    def __enter__(self) -> "XmlInventoryReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the package file."""
+        self._zip.close()
+
+    def slide_keys(self) -> List[str]:
+        """Compute the InventoryCache key of each slide (see InventoryCache.make_key)."""
+        keys = []
+        for slide_name, layout_name in self._slides:
+            layout = self._layout(layout_name)
+            master = self._master(layout["master"])
+            keys.append(
+                InventoryCache.make_key(
+                    self.slide_size,
+                    master["digest"],
+                    layout["digest"],
+                    serialize_part_xml(parse_xml(self._zip.read(slide_name))),
+                )
+            )
+        return keys
+
+    def slide_entries(self, slide_idx: int, issues_only: bool = False) -> SlideEntries:
+        """Extract the text shapes of one slide, as extract_slide_entries() does.
+
+        Args:
+            slide_idx: Index of the slide in the presentation
+            issues_only: If True, only include shapes that have overflow or overlap issues
+
+        Returns:
+            [(shape-N, collection index, ShapeData), ...] sorted by visual position
+        """
+        slide_name, layout_name = self._slides[slide_idx]
+        spTree = parse_xml(self._zip.read(slide_name)).find(qn("p:cSld")).find(
+            qn("p:spTree")
+        )
+        layout = self._layout(layout_name)
+        shape_data_list: List[ShapeData] = []
+        self._collect(spTree, layout, 0, 0, True, shape_data_list)
+        return _finish_slide_entries(shape_data_list, issues_only)
+
+    def _collect(
+        self,
+        group: Any,
+        layout: Dict[str, Any],
+        parent_left: int,
+        parent_top: int,
+        top_level: bool,
+        shape_data_list: List[ShapeData],
+    ) -> None:
+        """Collect the valid text shapes of a shape tree, in collect_slide_shapes() order.
+
+        Positions accumulate group offsets as collect_shapes_with_absolute_positions()
+        does; only placeholders directly on the slide inherit a missing position or
+        size from their layout placeholder.
+        """
+        for element in group.iterchildren(*XML_SHAPE_TAGS):
+            if element.tag == _P_GRPSP:
+                left, top, _, _ = _xfrm_position(element)
+                self._collect(
+                    element,
+                    layout,
+                    parent_left + (left or 0),
+                    parent_top + (top or 0),
+                    False,
+                    shape_data_list,
+                )
+                continue
+
+            # Same checks as is_valid_shape()
+            if element.tag != _P_SP:
+                continue
+            txBody = element.find(_P_TXBODY)
+            if txBody is None:
+                continue
+            p_elements = txBody.findall(_A_P)
+            texts = [_paragraph_text(p) for p in p_elements]
+            text = "\n".join(texts).strip()
+            if not text:
+                continue
+
+            ph = _placeholder_element(element)
+            placeholder_type = ph.type.name if ph is not None else None
+            if placeholder_type == "SLIDE_NUMBER":
+                continue
+            if placeholder_type == "FOOTER" and text.isdigit():
+                continue
+
+            position = _xfrm_position(element)
+            if top_level and ph is not None and None in position:
+                inherited = layout["positions"].get(ph.idx, (None,) * 4)
+                position = tuple(
+                    value if value is not None else base
+                    for value, base in zip(position, inherited)
+                )
+            left, top, width, height = (value or 0 for value in position)
+
+            style_name = (
+                "titleStyle"
+                if placeholder_type and "TITLE" in placeholder_type
+                else "bodyStyle"
+            )
+            paragraphs: TextFrameParagraphs = []
+            for p, p_text in zip(p_elements, texts):
+                pPr = p.pPr
+                paragraphs.append(
+                    (
+                        p_text,
+                        ParagraphData.from_xml(p, p_text) if p_text.strip() else None,
+                        pPr.lvl if pPr is not None else 0,
+                    )
+                )
+            bodyPr = txBody.find(_A_BODYPR)
+            shape_data_list.append(
+                ShapeData.from_paragraphs(
+                    paragraphs,
+                    (bodyPr.lIns, bodyPr.tIns, bodyPr.rIns, bodyPr.bIns),
+                    (parent_left + left, parent_top + top, width, height),
+                    self.slide_size,
+                    placeholder_type,
+                    layout["default_font_sizes"].get(ph.type)
+                    if ph is not None
+                    else None,
+                    layout["text_styles"][style_name],
+                )
+            )
+
+    def _layout(self, layout_name: str) -> Dict[str, Any]:
+        """Parse a slide layout once: its master, placeholder positions and sizes."""
+        layout = self._layouts.get(layout_name)
+        if layout is not None:
+            return layout
+
+        element = parse_xml(self._zip.read(layout_name))
+        master_name = self._related(layout_name, RT.SLIDE_MASTER)
+        master = self._master(master_name)
+        positions: Dict[int, Tuple[Optional[int], ...]] = {}
+        default_font_sizes: Dict[Any, Optional[float]] = {}
+        for shape, ph in _placeholder_shapes(element):
+            if ph.idx not in positions:
+                position = _xfrm_position(shape)
+                base_type = LAYOUT_BASE_PLACEHOLDER_TYPES.get(ph.type)
+                if shape.tag == _P_SP and base_type is not None:
+                    # Layout placeholders inherit from the master placeholder
+                    inherited = master["positions"].get(base_type, (None,) * 4)
+                    position = tuple(
+                        value if value is not None else base
+                        for value, base in zip(position, inherited)
+                    )
+                positions[ph.idx] = position
+            if ph.type not in default_font_sizes:
+                # First defRPr size, as get_default_font_size() finds it
+                default_font_sizes[ph.type] = None
+                try:
+                    for elem in shape.iter():
+                        if "defRPr" in elem.tag and (sz := elem.get("sz")):
+                            default_font_sizes[ph.type] = float(sz) / 100.0
+                            break
+                except Exception:
+                    pass
+
+        layout = {
+            "master": master_name,
+            "digest": hashlib.sha256(serialize_part_xml(element)).digest(),
+            "positions": positions,
+            "default_font_sizes": default_font_sizes,
+            "text_styles": {
+                style_name: self.theme_styles.get_for_element(
+                    master_name, master["element"], style_name
+                )
+                for style_name in ("titleStyle", "bodyStyle")
+            },
+        }
+        self._layouts[layout_name] = layout
+        return layout
+
+    def _master(self, master_name: str) -> Dict[str, Any]:
+        """Parse a slide master once: its element and placeholder positions by type."""
+        master = self._masters.get(master_name)
+        if master is not None:
+            return master
+
+        element = parse_xml(self._zip.read(master_name))
+        positions: Dict[Any, Tuple[Optional[int], ...]] = {}
+        for shape, ph in _placeholder_shapes(element):
+            if shape.tag == _P_SP and ph.type not in positions:
+                positions[ph.type] = _xfrm_position(shape)
+
+        master = {
+            "element": element,
+            "digest": hashlib.sha256(serialize_part_xml(element)).digest(),
+            "positions": positions,
+        }
+        self._masters[master_name] = master
+        return master
+
+    def _relationships(self, partname: str) -> Dict[str, Tuple[str, str]]:
+        """Read a part's internal relationships: {rId: (type, target partname)}."""
+        directory, filename = posixpath.split(partname)
+        try:
+            rels = etree.fromstring(
+                self._zip.read(posixpath.join(directory, "_rels", f"{filename}.rels"))
+            )
+        except KeyError:
+            return {}
+
+        relationships = {}
+        for rel in rels:
+            if rel.get("TargetMode") == "External" or rel.get("Target") is None:
+                continue
+            target = rel.get("Target")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.join(directory, target)
+            relationships[rel.get("Id")] = (
+                rel.get("Type"),
+                posixpath.normpath(target),
+            )
+        return relationships
+
+    def _related(self, partname: str, reltype: str) -> str:
+        """Get the partname of the part related to a part by a relationship type."""
+        for rel_type, target in self._relationships(partname).values():
+            if rel_type == reltype:
+                return target
+        raise KeyError(f"No {reltype.rsplit('/', 1)[-1]} relationship from /{partname}")
+
+
+def _paragraph_text(p: Any) -> str:
+    """Get the text of an a:p element as python-pptx's paragraph.text does."""
+    parts = []
+    for child in p:
+        if child.tag == _A_R or child.tag == _A_FLD:
+            t = child.find(_A_T)
+            parts.append(t.text or "" if t is not None else "")
+        elif child.tag == _A_BR:
+            parts.append("\v")  # Line break (soft carriage return)
+    return "".join(parts)
+
+
+def _placeholder_element(shape: Any) -> Optional[Any]:
+    """Get a shape element's p:ph (in the p:nvPr of its first child), or None."""
+    nvXxPr = next(shape.iterchildren(etree.Element), None)
+    if nvXxPr is None:
+        return None
+    nvPr = nvXxPr.find(qn("p:nvPr"))
+    return nvPr.find(qn("p:ph")) if nvPr is not None else None
+
+
+def _placeholder_shapes(part_element: Any):
+    """Generate (shape element, p:ph) for the placeholders at the top of a shape tree."""
+    spTree = part_element.find(qn("p:cSld")).find(qn("p:spTree"))
+    for shape in spTree.iterchildren(*XML_SHAPE_TAGS):
+        ph = _placeholder_element(shape)
+        if ph is not None:
+            yield shape, ph
+
+
+def _xfrm_position(shape: Any) -> Tuple[Optional[int], ...]:
+    """Get (left, top, width, height) in EMUs from a shape element's own a:xfrm.
+
+    Values missing from the XML are None, as python-pptx reports them before any
+    placeholder inheritance.
+    """
+    xfrm = getattr(shape, "xfrm", None)
+    if xfrm is None:
+        return (None, None, None, None)
+    return (xfrm.x, xfrm.y, xfrm.cx, xfrm.cy)
+
+
 def is_valid_shape(shape: BaseShape) -> bool:
     """Check if a shape contains meaningful text content."""
-    # Must have a text frame with content
-    if not hasattr(shape, "text_frame") or not shape.text_frame:  # type: ignore
+    # Must have a text frame with content; shape.text_frame would add an empty text
+    # body to shapes that have none
+    if not getattr(shape, "has_text_frame", False):
+        return False
+    if shape.element.find(qn("p:txBody")) is None:
         return False
 
     text = shape.text_frame.text.strip()  # type: ignore
@@ -879,40 +1993,124 @@ def calculate_overlap(
     return False, 0
 
 
-def detect_overlaps(shapes: List[ShapeData]) -> None:
+def detect_overlaps(
+    shapes: List[ShapeData], tolerance: float = 0.05, use_numpy: Optional[bool] = None
+) -> None:
     """Detect overlapping shapes and update their overlapping_shapes dictionaries.
 
     This function requires each ShapeData to have its shape_id already set.
     It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
 
+    Shapes are swept left to right, so only shapes whose horizontal extents overlap
+    are compared. The results, including the order of each overlapping_shapes
+    dictionary, are the same as comparing every pair with calculate_overlap().
+
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
+        tolerance: Minimum overlap in inches to consider as overlapping (default: 0.05")
+        use_numpy: Use the vectorized NumPy path; by default it is used when NumPy is
+                   installed and there are at least NUMPY_OVERLAP_MIN_SHAPES shapes
     """
     n = len(shapes)
+    if n < 2:
+        return
+
+    # Ensure shape IDs are set
+    for i, shape in enumerate(shapes):
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(shape.left, shape.top, shape.width, shape.height) for shape in shapes]
+    if use_numpy is None:
+        use_numpy = np is not None and n >= NUMPY_OVERLAP_MIN_SHAPES
+    if use_numpy:
+        if np is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+        pairs = _find_overlaps_numpy(rects, tolerance)
+    else:
+        pairs = _find_overlaps_sweep(rects, tolerance)
+
+    # Apply in pairwise order so each dictionary lists shapes in slide order
+    for i, j, overlap_area in sorted(pairs):
+        # Add shape IDs with overlap area in square inches
+        shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+        shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
+
+
+def _find_overlaps_sweep(
+    rects: List[Tuple[float, float, float, float]], tolerance: float
+) -> List[Tuple[int, int, float]]:
+    """Find overlapping rectangles with a sweep over their left edges.
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    Returns:
+        List of (i, j, overlap_area) with i < j
+    """
+    order = sorted(range(len(rects)), key=lambda index: rects[index][0])
+    pairs = []
+    active: List[int] = []
+    for index in order:
+        left = rects[index][0]
+        # A rectangle ending within tolerance of this left edge can't overlap this or
+        # any later rectangle by more than tolerance
+        active = [a for a in active if rects[a][0] + rects[a][2] - left > tolerance]
+        for other in active:
+            overlaps, overlap_area = calculate_overlap(
+                rects[other], rects[index], tolerance
+            )
+            if overlaps:
+                pairs.append((min(index, other), max(index, other), overlap_area))
+        active.append(index)
+    return pairs
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+def _find_overlaps_numpy(
+    rects: List[Tuple[float, float, float, float]], tolerance: float
+) -> List[Tuple[int, int, float]]:
+    """Find overlapping rectangles with NumPy, one vectorized row per rectangle.
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+    Computes the same float64 expressions as calculate_overlap(), so the overlaps
+    found and their rounded areas are identical.
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    Returns:
+        List of (i, j, overlap_area) with i < j
+    """
+    data = np.array(rects, dtype=np.float64)
+    order = np.argsort(data[:, 0], kind="stable")
+    left, top, width, height = data[order].T
+    right = left + width
+    bottom = top + height
+
+    pairs = []
+    for p in range(len(order) - 1):
+        # Later rectangles start at or after this one; only those starting before its
+        # right edge can overlap it (by more than a non-negative tolerance)
+        end = (
+            int(np.searchsorted(left, right[p], side="left"))
+            if tolerance >= 0
+            else len(order)
+        )
+        if end <= p + 1:
+            continue
+        overlap_width = np.minimum(right[p], right[p + 1 : end]) - np.maximum(
+            left[p], left[p + 1 : end]
+        )
+        overlap_height = np.minimum(bottom[p], bottom[p + 1 : end]) - np.maximum(
+            top[p], top[p + 1 : end]
+        )
+        overlapping = (overlap_width > tolerance) & (overlap_height > tolerance)
+        for q in np.nonzero(overlapping)[0]:
+            i, j = int(order[p]), int(order[p + 1 + q])
+            overlap_area = round(float(overlap_width[q] * overlap_height[q]), 2)
+            pairs.append((min(i, j), max(i, j), overlap_area))
+    return pairs
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    jobs: int = 1,
+    cache: Optional[InventoryCache] = None,
+    engine: str = "xml",
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,61 +2118,285 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes (default: 1, no workers). With jobs > 1 each
+              worker opens pptx_path itself and processes a share of the slides, so
+              prs must match the file; it is only used to attach the shapes to the
+              results. Without prs (and cache) the ShapeData objects are detached
+              (shape is None) but carry their paragraphs and measurements.
+        cache: Optional InventoryCache; slides whose slide, layout and master XML are
+               unchanged since they were cached are not measured again
+        engine: "xml" (default) to read the slide XML directly with XmlInventoryReader,
+                or "pptx" to go through python-pptx shape objects; both give the same
+                results. The "xml" engine always reads pptx_path, so as with jobs > 1
+                prs must match the file and without it the results are detached.
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
     The ShapeData objects contain the full shape information and can be
     converted to dictionaries for JSON serialization using to_dict().
     """
-    if prs is None:
-        prs = Presentation(str(pptx_path))
-    inventory: InventoryData = {}
+    return dict(
+        iter_text_inventory(
+            pptx_path,
+            prs,
+            issues_only=issues_only,
+            jobs=jobs,
+            cache=cache,
+            engine=engine,
+        )
+    )
 
-    for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
 
-        if not shapes_with_positions:
-            continue
+def iter_text_inventory(
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    jobs: int = 1,
+    cache: Optional[InventoryCache] = None,
+    engine: str = "xml",
+) -> Iterator[Tuple[str, Dict[str, ShapeData]]]:
+    """Extract the text inventory slide by slide, as extract_text_inventory() does.
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
+    Each slide is measured when it is requested and then left to the caller, so only
+    one slide's shapes are held at a time (with jobs > 1 the workers' results are
+    collected first and then yielded in order). The arguments are those of
+    extract_text_inventory().
+
+    Yields:
+        (slide-N, {shape-N: ShapeData}) in slide order, for slides with entries
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+    Raises:
+        ValueError: If engine is not one of INVENTORY_ENGINES
+    """
+    if engine not in INVENTORY_ENGINES:
+        raise ValueError(
+            f"Unknown inventory engine {engine!r} (expected one of {INVENTORY_ENGINES})"
+        )
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+    # Slides are read in this process unless workers do all of it
+    reader = None
+    if jobs <= 1 or cache is not None:
+        if engine == "xml":
+            reader = XmlInventoryReader(pptx_path)
+        elif prs is None:
+            prs = Presentation(str(pptx_path))
+    slides = list(prs.slides) if prs is not None else None
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+    # Cached entries are stored unfiltered, so filter after the cache when there is one
+    filter_issues = issues_only and cache is None
 
-        if not sorted_shapes:
-            continue
+    try:
+        if reader is not None:
+            slide_count: Optional[int] = reader.slide_count
+        else:
+            slide_count = len(slides) if slides is not None else None
+        cached: Dict[int, SlideEntries] = {}
+        keys: List[str] = []
+        if cache is not None and slide_count:
+            keys = reader.slide_keys() if reader else cache.slide_keys(slides)
+            for slide_idx, key in enumerate(keys):
+                entries = cache.get(key)
+                if entries is not None:
+                    cached[slide_idx] = entries
+
+        # Workers extract every uncached slide up front; otherwise each slide is
+        # extracted when it is reached below
+        extracted: Dict[int, SlideEntries] = {}
+        if jobs > 1:
+            if slide_count is None:
+                pending = None
+            else:
+                pending = [i for i in range(slide_count) if i not in cached]
+            if pending is None or pending:
+                extracted = _extract_entries_parallel(
+                    pptx_path, filter_issues, jobs, pending, engine
+                )
+        if slide_count is None:
+            slide_count = len(extracted)
+
+        theme_styles = None
+        for slide_idx in range(slide_count):
+            slide_entries = cached.pop(slide_idx, None)
+            if slide_entries is None:
+                slide_entries = extracted.pop(slide_idx, None)
+                if slide_entries is None and reader is not None:
+                    slide_entries = reader.slide_entries(slide_idx, filter_issues)
+                elif slide_entries is None:
+                    if theme_styles is None:
+                        # Resolve the masters' text styles once for every shape
+                        theme_styles = ThemeStyleCache()
+                        theme_styles.preload(prs)
+                    slide_entries = extract_slide_entries(
+                        slides[slide_idx], theme_styles, filter_issues
+                    )
+                if cache is not None:
+                    cache.put(keys[slide_idx], slide_entries)
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+            if slides is not None and any(
+                sd.shape is None for _, _, sd in slide_entries
+            ):
+                # Attach the live shapes, in collection order
+                shapes_with_positions = collect_slide_shapes(slides[slide_idx])
+                for _, position, shape_data in slide_entries:
+                    shape_data.shape = shapes_with_positions[position].shape
+
+            # Filter for issues only if requested (after overlap detection)
+            if issues_only:
+                slide_entries = [e for e in slide_entries if e[2].has_any_issues]
+
+            if slide_entries:
+                yield f"slide-{slide_idx}", {
+                    shape_key: shape_data for shape_key, _, shape_data in slide_entries
+                }
+    finally:
+        if reader is not None:
+            reader.close()
+
+
+def collect_slide_shapes(slide: Any) -> List[ShapeWithPosition]:
+    """Collect all valid shapes from a slide with absolute positions."""
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+    return shapes_with_positions
+
+
+def extract_slide_entries(
+    slide: Any,
+    theme_styles: Optional[ThemeStyleCache] = None,
+    issues_only: bool = False,
+) -> SlideEntries:
+    """Extract the text shapes of one slide.
+
+    Args:
+        slide: The slide
+        theme_styles: ThemeStyleCache shared by the slides of the presentation
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns:
+        [(shape-N, collection index, ShapeData), ...] sorted by visual position; empty
+        if there are no shapes
+    """
+    shapes_with_positions = collect_slide_shapes(slide)
+    if not shapes_with_positions:
+        return []
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            theme_styles,
+        )
+        for swp in shapes_with_positions
+    ]
+    return _finish_slide_entries(shape_data_list, issues_only)
+
+
+def _finish_slide_entries(
+    shape_data_list: List[ShapeData], issues_only: bool
+) -> SlideEntries:
+    """Sort a slide's shapes (in collection order), assign IDs and detect overlaps."""
+    positions = {id(shape_data): i for i, shape_data in enumerate(shape_data_list)}
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    return [(sd.shape_id, positions[id(sd)], sd) for sd in sorted_shapes]
+
+
+# Per-process state set up by _init_inventory_worker()
+_inventory_worker: Dict[str, Any] = {}
 
-    return inventory
 
+def _extract_entries_parallel(
+    pptx_path: Path,
+    issues_only: bool,
+    jobs: int,
+    slide_indices: Optional[List[int]],
+    engine: str = "xml",
+) -> Dict[int, SlideEntries]:
+    """Extract slides (default: all) in a pool of worker processes.
+
+    Returns:
+        {slide_idx: entries} with detached ShapeData objects
+    """
+    tasks = jobs * TASKS_PER_JOB
+    entries: Dict[int, SlideEntries] = {}
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path), issues_only, engine),
+    ) as executor:
+        for results, missing_fonts in executor.map(
+            _extract_slides,
+            [
+                (task, tasks, slide_indices[task::tasks] if slide_indices else None)
+                for task in range(tasks)
+            ],
+        ):
+            entries.update(results)
+            get_font_resolver().missing_fonts.update(missing_fonts)
+    return entries
+
+
+def _init_inventory_worker(pptx_path: str, issues_only: bool, engine: str) -> None:
+    """Open the presentation (and resolve its text styles) once per worker process."""
+    _inventory_worker["issues_only"] = issues_only
+    if engine == "xml":
+        # Kept open for the life of the worker
+        reader = XmlInventoryReader(pptx_path)
+        _inventory_worker.update(reader=reader, slide_count=reader.slide_count)
+        return
+
+    prs = Presentation(pptx_path)
+    theme_styles = ThemeStyleCache()
+    theme_styles.preload(prs)
+    slides = list(prs.slides)
+    _inventory_worker.update(
+        slides=slides, theme_styles=theme_styles, slide_count=len(slides)
+    )
+
+
+def _extract_slides(task: Tuple[int, int, Optional[List[int]]]):
+    """Extract the given slides, or every tasks-th slide starting at index task.
+
+    Returns:
+        ({slide_idx: entries}, missing fonts)
+    """
+    index, tasks, slide_indices = task
+    if slide_indices is None:
+        slide_indices = range(index, _inventory_worker["slide_count"], tasks)
+    reader = _inventory_worker.get("reader")
+    issues_only = _inventory_worker["issues_only"]
+    results = {}
+    for slide_idx in slide_indices:
+        if reader is not None:
+            results[slide_idx] = reader.slide_entries(slide_idx, issues_only)
+        else:
+            results[slide_idx] = extract_slide_entries(
+                _inventory_worker["slides"][slide_idx],
+                _inventory_worker["theme_styles"],
+                issues_only,
+            )
+    return results, set(get_font_resolver().missing_fonts)
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+
+def get_inventory_as_dict(
+    pptx_path: Path, issues_only: bool = False, jobs: int = 1, engine: str = "xml"
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
@@ -984,15 +2406,19 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes (default: 1, no workers)
+        engine: Inventory engine, "xml" (default) or "pptx" (see extract_text_inventory)
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
+    inventory = iter_text_inventory(
+        pptx_path, issues_only=issues_only, jobs=jobs, engine=engine
+    )
 
-    # Convert ShapeData objects to dictionaries
+    # Convert ShapeData objects to dictionaries, one slide at a time
     dict_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
+    for slide_key, shapes in inventory:
         dict_inventory[slide_key] = {
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
@@ -1000,20 +2426,90 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     return dict_inventory
 
 
-def save_inventory(inventory: InventoryData, output_path: Path) -> None:
+def save_inventory(
+    inventory: Union[InventoryData, Iterable[Tuple[str, Dict[str, ShapeData]]]],
+    output_path: Path,
+    output_format: str = "json",
+) -> Tuple[int, int]:
     """Save inventory to JSON file with proper formatting.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
-    """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
+    Converts ShapeData objects to dictionaries for JSON serialization, one slide at
+    a time (see write_inventory()).
+
+    Args:
+        inventory: Inventory dict, or (slide-N, shapes) pairs from iter_text_inventory()
+        output_path: Output file
+        output_format: "json" (default) or "ndjson"
 
+    Returns:
+        (slides, shapes) written
+    """
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+        return write_inventory(inventory, f, output_format)
+
+
+def write_inventory(
+    inventory: Union[InventoryData, Iterable[Tuple[str, Dict[str, ShapeData]]]],
+    output: TextIO,
+    output_format: str = "json",
+) -> Tuple[int, int]:
+    """Write an inventory to a text stream as its slides are produced.
+
+    Only one slide is converted to dictionaries at a time, so with
+    iter_text_inventory() the full inventory is never held in memory.
+
+    Args:
+        inventory: Inventory dict, or (slide-N, shapes) pairs from iter_text_inventory()
+        output: Text stream to write to (flushed after every slide)
+        output_format: "json" for the indented {slide-N: {shape-N: shape}} document
+                       save_inventory() has always written, or "ndjson" for one compact
+                       JSON object per shape: {"slide": "slide-N", "shape": "shape-N",
+                       ...shape fields}
+
+    Returns:
+        (slides, shapes) written
+
+    Raises:
+        ValueError: If output_format is not one of INVENTORY_FORMATS
+    """
+    if output_format not in INVENTORY_FORMATS:
+        raise ValueError(
+            f"Unknown inventory format {output_format!r} "
+            f"(expected one of {INVENTORY_FORMATS})"
+        )
+    if isinstance(inventory, dict):
+        inventory = inventory.items()
+
+    slide_count = shape_count = 0
+    for slide_key, shapes in inventory:
+        if output_format == "ndjson":
+            for shape_key, shape_data in shapes.items():
+                record = {"slide": slide_key, "shape": shape_key}
+                record.update(shape_data.to_dict())
+                output.write(
+                    json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+                    + "\n"
+                )
+        else:
+            slide_dict = {
+                shape_key: shape_data.to_dict()
+                for shape_key, shape_data in shapes.items()
+            }
+            # Same text as json.dump(inventory, indent=2): the slide's lines are
+            # indented one level further (strings never contain raw newlines)
+            slide_json = json.dumps(slide_dict, indent=2, ensure_ascii=False)
+            output.write(
+                ("{\n" if slide_count == 0 else ",\n")
+                + f"  {json.dumps(slide_key, ensure_ascii=False)}: "
+                + slide_json.replace("\n", "\n  ")
+            )
+        slide_count += 1
+        shape_count += len(shapes)
+        output.flush()
+
+    if output_format == "json":
+        output.write("\n}" if slide_count else "{}")
+    return slide_count, shape_count
 
 
 if __name__ == "__main__":
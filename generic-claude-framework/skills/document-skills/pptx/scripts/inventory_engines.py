@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Check that the inventory engines agree, and time them, on a corpus of presentations.
+
+Every presentation is inventoried with the "pptx" engine (python-pptx shape objects)
+and the "xml" engine (XmlInventoryReader), with and without issues_only, and the JSON
+inventories are compared; the first differing path is reported for each mismatch.
+Each engine is then timed (best of --repeat runs, after an untimed run of both so
+fonts and measured text are cached alike and the timings compare reading the slides).
+
+The exit status is 1 if any presentation differs, or fails with only one engine.
+
+Usage:
+    python inventory_engines.py decks/
+    python inventory_engines.py deck.pptx other.pptx --repeat 5
+"""
+
+import argparse
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from inventory import INVENTORY_ENGINES, extract_text_inventory, get_inventory_as_dict
+
+
+def find_presentations(paths):
+    """List the .pptx files given, searching directories recursively."""
+    presentations = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            presentations.extend(sorted(path.rglob("*.pptx")))
+        else:
+            presentations.append(path)
+    return presentations
+
+
+def first_difference(expected, actual, path="$"):
+    """Get the path of the first difference between two JSON values, or None."""
+    if type(expected) is not type(actual):
+        return f"{path}: {expected!r} != {actual!r}"
+    if isinstance(expected, dict):
+        if list(expected) != list(actual):
+            return f"{path} keys: {list(expected)} != {list(actual)}"
+        for key in expected:
+            difference = first_difference(expected[key], actual[key], f"{path}.{key}")
+            if difference:
+                return difference
+        return None
+    if isinstance(expected, list):
+        if len(expected) != len(actual):
+            return f"{path} length: {len(expected)} != {len(actual)}"
+        for index, (item1, item2) in enumerate(zip(expected, actual)):
+            difference = first_difference(item1, item2, f"{path}[{index}]")
+            if difference:
+                return difference
+        return None
+    return None if expected == actual else f"{path}: {expected!r} != {actual!r}"
+
+
+def compare_engines(pptx_path):
+    """Compare the engines' inventories of a presentation.
+
+    Returns:
+        list: Descriptions of the differences (empty if the engines agree)
+    """
+    differences = []
+    for issues_only in (False, True):
+        results = {}
+        for engine in INVENTORY_ENGINES:
+            try:
+                results[engine] = get_inventory_as_dict(
+                    pptx_path, issues_only=issues_only, engine=engine
+                )
+            except Exception as e:
+                results[engine] = e
+
+        expected, actual = results["pptx"], results["xml"]
+        mode = "issues_only" if issues_only else "full"
+        if isinstance(expected, Exception) or isinstance(actual, Exception):
+            if type(expected) is not type(actual):
+                differences.append(f"{mode}: pptx {expected!r}, xml {actual!r}")
+            continue
+        difference = first_difference(expected, actual)
+        if difference:
+            differences.append(f"{mode}: {difference}")
+    return differences
+
+
+def time_engine(pptx_path, engine, repeat):
+    """Time extract_text_inventory() with an engine; returns (best seconds, inventory)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        inventory = extract_text_inventory(pptx_path, engine=engine)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, inventory
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare and time the inventory engines on presentations"
+    )
+    parser.add_argument("paths", nargs="+", help=".pptx files or directories")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per engine")
+    args = parser.parse_args()
+
+    presentations = find_presentations(args.paths)
+    if not presentations:
+        print("No presentations found")
+        sys.exit(1)
+
+    print(
+        f"{'presentation':<40} {'shapes':>7} "
+        + " ".join(f"{engine:>9}" for engine in INVENTORY_ENGINES)
+        + f" {'speedup':>8}  result"
+    )
+    failed = 0
+    totals = dict.fromkeys(INVENTORY_ENGINES, 0.0)
+    for pptx_path in presentations:
+        differences = compare_engines(pptx_path)
+        timings = {}
+        shapes = 0
+        try:
+            for engine in INVENTORY_ENGINES:
+                extract_text_inventory(pptx_path, engine=engine)
+            for engine in INVENTORY_ENGINES:
+                timings[engine], inventory = time_engine(
+                    pptx_path, engine, args.repeat
+                )
+                totals[engine] += timings[engine]
+            shapes = sum(len(slide) for slide in inventory.values())
+        except Exception:
+            traceback.print_exc()
+
+        failed += bool(differences)
+        name = str(pptx_path)
+        if len(name) > 40:
+            name = "..." + name[-37:]
+        if len(timings) == len(INVENTORY_ENGINES):
+            columns = " ".join(
+                f"{timings[engine] * 1000:>7.1f}ms" for engine in INVENTORY_ENGINES
+            )
+            speedup = f"{timings['pptx'] / timings['xml']:>7.1f}x"
+        else:
+            columns = " ".join(f"{'-':>9}" for _ in INVENTORY_ENGINES)
+            speedup = f"{'-':>8}"
+        print(
+            f"{name:<40} {shapes:>7} {columns} {speedup}  "
+            + ("DIFFERENT" if differences else "same")
+        )
+        for difference in differences:
+            print(f"    {difference}")
+
+    if totals["xml"]:
+        print(
+            f"{len(presentations)} presentations, {failed} different; total "
+            + ", ".join(f"{e} {totals[e]:.2f}s" for e in INVENTORY_ENGINES)
+            + f" ({totals['pptx'] / totals['xml']:.1f}x)"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
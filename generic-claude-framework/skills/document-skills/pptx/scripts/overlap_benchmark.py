@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark overlap detection in inventory.py on synthetic slides.
+
+Two layouts are generated: "grid", a dashboard of text boxes with some jitter plus a
+few randomly placed callouts overlapping it, and "rows", full-width rows stacked down
+the slide, each overlapping the next by 0.1" (every pair overlaps horizontally, the
+sweep's worst case). Every size is timed with the pairwise comparison
+detect_overlaps() used to do, the sweep and (when NumPy is installed) the NumPy path,
+and the results of all three are checked to be identical.
+
+Usage:
+    python overlap_benchmark.py
+    python overlap_benchmark.py --sizes 10,100,500,2000 --repeat 5
+"""
+
+import argparse
+import math
+import random
+import time
+
+from inventory import calculate_overlap, detect_overlaps, np
+
+
+class _Shape:
+    """Minimal stand-in for ShapeData carrying what detect_overlaps() reads."""
+
+    def __init__(self, index, left, top, width, height):
+        self.shape_id = f"shape-{index}"
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.overlapping_shapes = {}
+
+
+def make_slide(count, layout="grid", seed=0):
+    """Create (left, top, width, height) rectangles in inches for a 13.33x7.5" slide."""
+    rng = random.Random(seed)
+    if layout == "rows":
+        row_height = 7.5 / count
+        return [
+            tuple(
+                round(value, 2)
+                for value in (
+                    rng.uniform(0, 0.5),
+                    index * row_height,
+                    12.5,
+                    row_height + 0.1,
+                )
+            )
+            for index in range(count)
+        ]
+
+    columns = max(1, round(math.sqrt(count * 16 / 9)))
+    rows = max(1, math.ceil(count / columns))
+    cell_width, cell_height = 13.33 / columns, 7.5 / rows
+    rects = []
+    for index in range(count):
+        if index % 10 == 9:
+            # Callout placed anywhere, typically overlapping a few grid cells
+            width, height = cell_width * 1.5, cell_height * 1.5
+            left, top = rng.uniform(0, 13.33 - width), rng.uniform(0, 7.5 - height)
+        else:
+            row, column = divmod(index, columns)
+            width, height = cell_width * 0.95, cell_height * 0.95
+            left = column * cell_width + rng.uniform(-0.1, 0.1) * cell_width
+            top = row * cell_height + rng.uniform(-0.1, 0.1) * cell_height
+        rects.append(tuple(round(value, 2) for value in (left, top, width, height)))
+    return rects
+
+
+def pairwise(shapes, tolerance=0.05):
+    """Compare every pair of shapes, as detect_overlaps() did before the sweep."""
+    for i in range(len(shapes)):
+        for j in range(i + 1, len(shapes)):
+            shape1, shape2 = shapes[i], shapes[j]
+            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
+            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+            overlaps, overlap_area = calculate_overlap(rect1, rect2, tolerance)
+            if overlaps:
+                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+
+
+def run(rects, method, repeat):
+    """Time a method on fresh shapes; returns (best seconds, overlap maps)."""
+    best = None
+    for _ in range(repeat):
+        shapes = [_Shape(index, *rect) for index, rect in enumerate(rects)]
+        start = time.perf_counter()
+        method(shapes)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, [list(shape.overlapping_shapes.items()) for shape in shapes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark overlap detection")
+    parser.add_argument(
+        "--sizes",
+        default="10,50,100,250,500,1000,2000",
+        help="Comma-separated shape counts per slide",
+    )
+    parser.add_argument(
+        "--layouts", default="grid,rows", help="Comma-separated layouts (grid, rows)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    methods = {
+        "pairwise": pairwise,
+        "sweep": lambda shapes: detect_overlaps(shapes, use_numpy=False),
+    }
+    if np is not None:
+        methods["numpy"] = lambda shapes: detect_overlaps(shapes, use_numpy=True)
+
+    print(
+        f"{'layout':>6} {'shapes':>7} {'overlaps':>9} "
+        + " ".join(f"{m:>10}" for m in methods)
+    )
+    sizes = [int(size) for size in args.sizes.split(",")]
+    for layout in args.layouts.split(","):
+        for count in sizes:
+            rects = make_slide(count, layout)
+            timings = {}
+            expected = None
+            for name, method in methods.items():
+                timings[name], result = run(rects, method, args.repeat)
+                if expected is None:
+                    expected = result
+                elif result != expected:
+                    raise SystemExit(
+                        f"{name} differs from pairwise for {layout} x {count}"
+                    )
+            overlaps = sum(len(items) for items in expected) // 2
+            print(
+                f"{layout:>6} {count:>7} {overlaps:>9} "
+                + " ".join(f"{timings[m] * 1000:>8.2f}ms" for m in methods)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,13 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-from inventory import InventoryData, extract_text_inventory
+from inventory import (
+    InventoryData,
+    ShapeData,
+    ThemeStyleCache,
+    extract_text_inventory,
+    get_inventory_cache,
+)
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
@@ -219,7 +225,9 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
     # Get inventory of all text shapes (returns ShapeData objects)
     # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
+    inventory = extract_text_inventory(
+        Path(pptx_file), prs, cache=get_inventory_cache()
+    )
 
     # Detect text overflow in original presentation
     original_overflow = detect_frame_overflow(inventory)
@@ -244,6 +252,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     shapes_processed = 0
     shapes_cleared = 0
     shapes_replaced = 0
+    replaced_shapes = []  # (slide_key, shape_key, ShapeData, slide)
 
     # Process each slide from inventory
     for slide_key, shapes_dict in inventory.items():
@@ -278,6 +287,9 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
                 continue
 
             shapes_replaced += 1
+            replaced_shapes.append(
+                (slide_key, shape_key, shape_data, prs.slides[slide_index])
+            )
 
             # Add replacement paragraphs
             for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
@@ -288,20 +300,20 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
-
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+    # Check for issues after replacements on the live presentation (inventory reads
+    # don't modify it). Only shapes that received paragraphs need measuring again:
+    # cleared shapes have no text, and so no overflow or warnings
+    updated_inventory: InventoryData = {}
+    theme_styles = ThemeStyleCache()
+    for slide_key, shape_key, shape_data, slide in replaced_shapes:
+        updated_inventory.setdefault(slide_key, {})[shape_key] = ShapeData(
+            shape_data.shape,
+            shape_data.left_emu,
+            shape_data.top_emu,
+            slide,
+            theme_styles,
+        )
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
     overflow_errors = []
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic PowerPoint decks for benchmarking the pptx scripts.
+
+Every slide uses the "Title Only" layout: its title placeholder is filled in and
+text boxes are laid out on a grid below it. Some boxes are placed inside group
+shapes nested --group-depth deep, and pictures are placed on top of the grid. The
+paragraphs are random words, and their fonts and sizes are drawn from the first
+--fonts names in FONT_NAMES. The same seed always gives the same deck.
+
+Usage:
+    python synthetic_deck.py deck.pptx
+    python synthetic_deck.py deck.pptx --slides 200 --shapes 12 --group-depth 3 \\
+        --words 40 --fonts 4 --images 2
+
+    # From Python
+    from synthetic_deck import make_deck
+    make_deck("deck.pptx", slides=200, shapes_per_slide=12)
+"""
+
+import argparse
+import io
+import math
+import random
+
+from PIL import Image, ImageDraw
+from pptx import Presentation
+from pptx.util import Emu, Inches, Pt
+
+# Fonts used, in order, when a deck asks for n of them (missing ones are measured
+# with the fallback font, as in real decks)
+FONT_NAMES = [
+    "Arial",
+    "DejaVu Sans",
+    "Liberation Serif",
+    "Calibri",
+    "Georgia",
+    "Courier New",
+]
+
+FONT_SIZES = [12, 14, 16, 18, 24]
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt labore dolore magna aliqua quarterly revenue growth pipeline roadmap "
+    "customer market launch strategy platform"
+).split()
+
+# Index of the "Title Only" layout in the default template
+TITLE_ONLY_LAYOUT = 5
+
+# Distinct pictures per deck; pictures repeat after that, as logos do in real decks
+IMAGE_VARIANTS = 8
+
+
+def make_deck(
+    output_path,
+    slides=20,
+    shapes_per_slide=8,
+    group_depth=1,
+    paragraphs=3,
+    words=12,
+    fonts=3,
+    images=1,
+    seed=0,
+):
+    """Create a synthetic deck.
+
+    Args:
+        output_path: Path of the .pptx to write
+        slides: Number of slides
+        shapes_per_slide: Text boxes per slide (not counting the title)
+        group_depth: Nesting depth of the group holding every third text box (0: no
+                     groups)
+        paragraphs: Paragraphs per text box
+        words: Average words per paragraph (each paragraph gets half to 1.5 times this)
+        fonts: Number of font names used, from FONT_NAMES
+        images: Pictures per slide
+        seed: Random seed
+
+    Returns:
+        dict: The parameters used (for recording alongside benchmark results)
+    """
+    params = {
+        "slides": slides,
+        "shapes_per_slide": shapes_per_slide,
+        "group_depth": group_depth,
+        "paragraphs": paragraphs,
+        "words": words,
+        "fonts": fonts,
+        "images": images,
+        "seed": seed,
+    }
+    rng = random.Random(seed)
+    font_names = FONT_NAMES[: max(1, min(fonts, len(FONT_NAMES)))]
+    pictures = [_make_picture(rng) for _ in range(min(images, IMAGE_VARIANTS))]
+
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Inches(13.333), Inches(7.5)
+    layout = prs.slide_layouts[TITLE_ONLY_LAYOUT]
+
+    # Grid cells below the title
+    columns = max(1, round(math.sqrt(shapes_per_slide * 2)))
+    rows = max(1, math.ceil(shapes_per_slide / columns))
+    cell_width = Inches(12.333) // columns
+    cell_height = Inches(5.5) // rows
+
+    for slide_idx in range(slides):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide {slide_idx + 1}: " + _sentence(rng, 4)
+
+        for shape_idx in range(shapes_per_slide):
+            row, column = divmod(shape_idx, columns)
+            left = Inches(0.5) + column * cell_width
+            top = Inches(1.75) + row * cell_height
+            container = slide.shapes
+            if group_depth and shape_idx % 3 == 2:
+                for _ in range(group_depth):
+                    container = container.add_group_shape().shapes
+            textbox = container.add_textbox(
+                left, top, Emu(int(cell_width * 0.9)), Emu(int(cell_height * 0.9))
+            )
+            text_frame = textbox.text_frame
+            text_frame.word_wrap = True
+            for para_idx in range(paragraphs):
+                paragraph = (
+                    text_frame.paragraphs[0]
+                    if para_idx == 0
+                    else text_frame.add_paragraph()
+                )
+                count = rng.randint(max(1, words // 2), max(1, words * 3 // 2))
+                run = paragraph.add_run()
+                run.text = _sentence(rng, count)
+                run.font.name = rng.choice(font_names)
+                run.font.size = Pt(rng.choice(FONT_SIZES))
+                run.font.bold = rng.random() < 0.2
+
+        for picture_idx in range(images):
+            picture = pictures[(slide_idx + picture_idx) % len(pictures)]
+            picture.seek(0)
+            slide.shapes.add_picture(
+                picture,
+                Inches(rng.uniform(0.5, 10.5)),
+                Inches(rng.uniform(1.75, 5.5)),
+                width=Inches(2),
+            )
+
+    prs.save(str(output_path))
+    return params
+
+
+def _sentence(rng, count):
+    """Random words, capitalized."""
+    return " ".join(rng.choice(WORDS) for _ in range(count)).capitalize()
+
+
+def _make_picture(rng):
+    """A small PNG with a random color gradient and shapes, as a stream."""
+    image = Image.new("RGB", (320, 200))
+    draw = ImageDraw.Draw(image)
+    start = [rng.randrange(256) for _ in range(3)]
+    end = [rng.randrange(256) for _ in range(3)]
+    for y in range(200):
+        color = tuple(s + (e - s) * y // 199 for s, e in zip(start, end))
+        draw.line([(0, y), (319, y)], fill=color)
+    for _ in range(5):
+        x, y = rng.randrange(280), rng.randrange(160)
+        draw.ellipse([(x, y), (x + 40, y + 40)], fill="white")
+    stream = io.BytesIO()
+    image.save(stream, "PNG")
+    return stream
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic .pptx deck")
+    parser.add_argument("output", help="Output .pptx file")
+    parser.add_argument("--slides", type=int, default=20, help="Slides (default: 20)")
+    parser.add_argument(
+        "--shapes", type=int, default=8, help="Text boxes per slide (default: 8)"
+    )
+    parser.add_argument(
+        "--group-depth",
+        type=int,
+        default=1,
+        help="Nesting depth of grouped text boxes (default: 1, 0 for no groups)",
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=3, help="Paragraphs per text box (default: 3)"
+    )
+    parser.add_argument(
+        "--words", type=int, default=12, help="Average words per paragraph (default: 12)"
+    )
+    parser.add_argument(
+        "--fonts",
+        type=int,
+        default=3,
+        help=f"Font names used (default: 3, max: {len(FONT_NAMES)})",
+    )
+    parser.add_argument(
+        "--images", type=int, default=1, help="Pictures per slide (default: 1)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    make_deck(
+        args.output,
+        slides=args.slides,
+        shapes_per_slide=args.shapes,
+        group_depth=args.group_depth,
+        paragraphs=args.paragraphs,
+        words=args.words,
+        fonts=args.fonts,
+        images=args.images,
+        seed=args.seed,
+    )
+    print(f"Created {args.output}")
+
+
+if __name__ == "__main__":
+    main()
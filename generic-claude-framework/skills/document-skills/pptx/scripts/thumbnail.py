@@ -20,6 +20,7 @@ Grid limits by column count:
 
 Usage:
     python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+                        [--cache-dir DIR] [--cache-max-mb MB]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,17 +39,26 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+    python thumbnail.py large-deck.pptx grid --cache-dir ~/.cache/pptx-thumbnails
+    # Reuses slide images rendered by earlier runs: an unchanged deck is not rendered
+    # again (e.g. to try another --cols), and after an edit only changed slides are
+    # rendered
 """
 
 import argparse
+import hashlib
+import json
+import os
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 
-from inventory import extract_text_inventory
+from inventory import extract_text_inventory, get_inventory_cache
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
@@ -63,6 +73,28 @@ BORDER_WIDTH = 2  # Border width around thumbnails
 FONT_SIZE_RATIO = 0.12  # Font size as fraction of thumbnail width
 LABEL_PADDING_RATIO = 0.4  # Label padding as fraction of font size
 
+# Render cache constants
+THUMBNAIL_CACHE_ENV = "PPTX_THUMBNAIL_CACHE"  # Default render cache directory
+THUMBNAIL_CACHE_MAX_MB = 512  # Default render cache size limit
+RENDER_CACHE_VERSION = 2  # Part of every render cache key; bump when rendering changes
+
+# Relationships followed to find what a slide's image depends on: its layout and
+# master are hashed separately, and notes never render
+RENDER_SKIPPED_RELTYPES = {
+    RT.SLIDE_LAYOUT,
+    RT.SLIDE_MASTER,
+    RT.NOTES_SLIDE,
+    RT.NOTES_MASTER,
+    RT.HANDOUT_MASTER,
+    RT.SLIDE,
+}
+
+# Slide number fields in a layout or master render on every slide using it, except
+# in placeholders (which only render through a placeholder on the slide itself)
+INHERITED_SLIDE_NUMBER_XPATH = (
+    './/a:fld[@type="slidenum"][not(ancestor::p:sp[p:nvSpPr/p:nvPr/p:ph])]'
+)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -86,6 +118,18 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get(THUMBNAIL_CACHE_ENV),
+        help="Directory caching rendered slide images between runs "
+        f"(default: ${THUMBNAIL_CACHE_ENV})",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=THUMBNAIL_CACHE_MAX_MB,
+        help=f"Size limit of the render cache in MB (default: {THUMBNAIL_CACHE_MAX_MB})",
+    )
 
     args = parser.parse_args()
 
@@ -119,7 +163,14 @@ def main():
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
             # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
+            cache = (
+                RenderCache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+                if args.cache_dir
+                else None
+            )
+            slide_images = convert_to_images(
+                input_path, Path(temp_dir), CONVERSION_DPI, cache=cache
+            )
             if not slide_images:
                 print("Error: No slides found")
                 sys.exit(1)
@@ -165,7 +216,7 @@ def get_placeholder_regions(pptx_path):
     slide_dimensions is a tuple of (width_inches, height_inches).
     """
     prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
+    inventory = extract_text_inventory(pptx_path, prs, cache=get_inventory_cache())
     placeholder_regions = {}
 
     # Get actual slide dimensions in inches (EMU to inches conversion)
@@ -194,8 +245,30 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def convert_to_images(pptx_path, temp_dir, dpi, pool=None, cache=None):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    If an office_pool.OfficePool is given, the PDF conversion runs on one of its
+    warm soffice instances instead of a freshly spawned process.
+
+    With a RenderCache, slide images cached at this DPI are reused: an unchanged file
+    is not rendered (or even parsed) again, and when only some slides changed just
+    those are rendered, from a copy of the deck holding only them. The returned
+    paths then point into the cache.
+    """
+    if cache is not None:
+        deck_key = cache.deck_key(pptx_path, dpi)
+        cached_images = cache.get_deck(deck_key)
+        if cached_images is not None:
+            print(f"Using {len(cached_images)} cached slide images")
+            cache.evict(keep={path.stem for path in cached_images if path} | {deck_key})
+            return add_hidden_slide_placeholders(
+                [path for path in cached_images if path is not None],
+                len(cached_images),
+                {idx + 1 for idx, path in enumerate(cached_images) if path is None},
+                temp_dir,
+            )
+
     # Detect hidden slides
     print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
@@ -212,24 +285,94 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
+    if cache is None:
+        visible_images = render_slides(pptx_path, temp_dir, dpi, pool)
+        return add_hidden_slide_placeholders(
+            visible_images, total_slides, hidden_slides, temp_dir
+        )
+
+    # Hidden slides are never rendered, so they get no key
+    keys = [
+        None if idx + 1 in hidden_slides else key
+        for idx, key in enumerate(cache.slide_keys(prs, dpi))
+    ]
+    images = [cache.get(key) if key else None for key in keys]
+    missing = [idx for idx, key in enumerate(keys) if key and images[idx] is None]
+    visible = [idx for idx, key in enumerate(keys) if key]
+
+    if missing:
+        # Slide number fields (also from the layout or master) render the slide's
+        # position, which a partial deck would change
+        inherited = {}
+        partial = len(missing) < len(visible) and not any(
+            cache.has_slide_number(prs.slides[idx], inherited) for idx in missing
+        )
+        if partial:
+            print(f"Rendering {len(missing)} changed slide(s)")
+            render_dir = temp_dir / "changed"
+            render_dir.mkdir()
+            render_path = render_dir / pptx_path.name
+            save_slide_subset(pptx_path, missing, render_path)
+            rendered = render_slides(render_path, render_dir, dpi, pool)
+            targets = missing
+        else:
+            rendered = render_slides(pptx_path, temp_dir, dpi, pool)
+            targets = visible
+
+        if len(rendered) == len(targets):
+            for idx, image_path in zip(targets, rendered):
+                images[idx] = cache.put(keys[idx], image_path)
+            cache.put_deck(deck_key, keys)
+        elif partial:
+            raise RuntimeError(
+                f"Rendered {len(rendered)} images for {len(targets)} changed slides"
+            )
+        else:
+            # Page count doesn't match the visible slides; nothing is cached
+            return add_hidden_slide_placeholders(
+                rendered, total_slides, hidden_slides, temp_dir
+            )
+    else:
+        cache.put_deck(deck_key, keys)
+
+    print(
+        f"Render cache: {len(visible) - len(missing)} slides reused, "
+        f"{len(missing)} rendered"
+    )
+    cache.evict(keep={key for key in keys if key} | {deck_key})
+    return add_hidden_slide_placeholders(
+        [images[idx] for idx in visible], total_slides, hidden_slides, temp_dir
+    )
+
+
+def render_slides(pptx_path, temp_dir, dpi, pool=None):
+    """Render the visible slides of a .pptx to JPEG images in temp_dir, in order."""
     pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
 
     # Convert to PDF
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
+    if pool is not None:
+        try:
+            pool.convert(pptx_path, temp_dir, "pdf", timeout=300)
+        except RuntimeError as e:
+            raise RuntimeError(f"PDF conversion failed: {e}")
+    else:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                str(temp_dir),
+                str(pptx_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError("PDF conversion failed")
+    if not pdf_path.exists():
         raise RuntimeError("PDF conversion failed")
 
     # Convert PDF to images
@@ -242,8 +385,11 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if result.returncode != 0:
         raise RuntimeError("Image conversion failed")
 
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+    return sorted(temp_dir.glob("slide-*.jpg"))
+
 
+def add_hidden_slide_placeholders(visible_images, total_slides, hidden_slides, temp_dir):
+    """List an image per slide, drawing placeholders for the hidden ones (1-based)."""
     # Create full list with placeholders for hidden slides
     all_images = []
     visible_idx = 0
@@ -271,6 +417,209 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     return all_images
 
 
+def save_slide_subset(pptx_path, slide_indices, output_path):
+    """Save a copy of a .pptx holding only the given slides (0-based)."""
+    subset = Presentation(str(pptx_path))
+    keep = set(slide_indices)
+    sldIdLst = subset.slides._sldIdLst  # type: ignore
+    for idx, sldId in reversed(list(enumerate(sldIdLst))):
+        if idx not in keep:
+            sldIdLst.remove(sldId)
+            subset.part.drop_rel(sldId.rId)
+    subset.save(str(output_path))
+
+
+class RenderCache:
+    """Rendered slide images keyed by slide content and DPI, bounded in size.
+
+    Files in cache_dir:
+        slides/<key>.jpg: One rendered slide. The key hashes the DPI, the slide size,
+            and the slide, its layout and its master with every part they reference
+            (images, theme, charts, ...), plus the slide's position if it shows a
+            slide number (its own or its layout's or master's), so a slide is reused
+            wherever its content is unchanged
+        decks/<sha256 of the file>-<dpi>.json: The slide keys of a whole .pptx (null
+            for hidden slides), so an unchanged file is served without parsing it
+
+    Once the files take more than max_bytes together, the least recently used ones
+    are deleted (using a file updates its modification time).
+
+    Attributes:
+        cache_dir: Cache directory
+        max_bytes: Size limit of the cache files
+        stats: Counters for slide images reused ("hits") and not found ("misses")
+    """
+
+    def __init__(self, cache_dir, max_bytes=THUMBNAIL_CACHE_MAX_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def deck_key(pptx_path, dpi):
+        """Hash a .pptx file's bytes with the DPI."""
+        digest = hashlib.sha256()
+        with open(pptx_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return f"{digest.hexdigest()}-{dpi}"
+
+    def get_deck(self, deck_key):
+        """Get the slide images of a whole file (None for hidden slides), or None."""
+        manifest = self.cache_dir / "decks" / f"{deck_key}.json"
+        try:
+            keys = json.loads(manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        paths = [self._slide_path(key) if key else None for key in keys]
+        if not all(path is None or path.exists() for path in paths):
+            return None
+        for path in [manifest] + paths:
+            if path is not None:
+                self._touch(path)
+        self.stats["hits"] += sum(path is not None for path in paths)
+        return paths
+
+    def put_deck(self, deck_key, keys):
+        """Record the slide keys of a whole file (None for hidden slides)."""
+        self._write(
+            self.cache_dir / "decks" / f"{deck_key}.json", json.dumps(keys).encode()
+        )
+
+    def slide_keys(self, prs, dpi):
+        """Compute the cache key of each slide of a presentation."""
+        digests = {}
+        inherited = {}
+        width, height = prs.slide_width, prs.slide_height
+        keys = []
+        for idx, slide in enumerate(prs.slides):
+            layout = slide.slide_layout
+            key = hashlib.sha256(
+                f"{RENDER_CACHE_VERSION}:{dpi}:{width}:{height}:".encode()
+            )
+            if self.has_slide_number(slide, inherited):
+                key.update(f"slide {idx}:".encode())
+            for part in (slide.part, layout.part, layout.slide_master.part):
+                key.update(self._part_digest(part, digests))
+            keys.append(key.hexdigest())
+        return keys
+
+    @staticmethod
+    def has_slide_number(slide, inherited=None):
+        """Check whether a slide shows its slide number (a slidenum field).
+
+        The field may be on the slide, or outside placeholders on its layout or master
+        when their shapes are shown (showMasterSp).
+
+        Args:
+            slide: The slide
+            inherited: Optional dict memoizing the layout and master checks by partname
+        """
+        if b'type="slidenum"' in slide.part.blob:
+            return True
+        if inherited is None:
+            inherited = {}
+        layout = slide.slide_layout
+        # The slide can hide its layout's shapes, and the layout its master's
+        for child, parent in ((slide, layout), (layout, layout.slide_master)):
+            if child.element.get("showMasterSp") in ("0", "false"):
+                break
+            partname = parent.part.partname
+            if partname not in inherited:
+                inherited[partname] = bool(
+                    parent.element.xpath(INHERITED_SLIDE_NUMBER_XPATH)
+                )
+            if inherited[partname]:
+                return True
+        return False
+
+    def get(self, key):
+        """Get the cached image of a slide, or None."""
+        path = self._slide_path(key)
+        if not path.exists():
+            self.stats["misses"] += 1
+            return None
+        self._touch(path)
+        self.stats["hits"] += 1
+        return path
+
+    def put(self, key, image_path):
+        """Store a rendered slide image; returns its path in the cache.
+
+        If the image can't be written to the cache, image_path itself is returned.
+        """
+        path = self._slide_path(key)
+        return path if self._write(path, Path(image_path).read_bytes()) else image_path
+
+    def evict(self, keep=()):
+        """Delete least recently used files until the cache fits in max_bytes.
+
+        Args:
+            keep: Slide and deck keys not to delete (the ones being used)
+        """
+        entries = []
+        for subdir in ("slides", "decks"):
+            try:
+                with os.scandir(self.cache_dir / subdir) as it:
+                    for entry in it:
+                        if entry.is_file() and not entry.name.startswith("."):
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                pass
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if Path(path).stem in keep:
+                continue
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+    def _slide_path(self, key):
+        return self.cache_dir / "slides" / f"{key}.jpg"
+
+    @staticmethod
+    def _part_digest(part, digests):
+        """Hash a part with the parts it references, except RENDER_SKIPPED_RELTYPES."""
+        if part.partname not in digests:
+            digests[part.partname] = b""  # Guards against relationship cycles
+            digest = hashlib.sha256(part.blob)
+            for rel in sorted(part.rels.values(), key=lambda rel: rel.rId):
+                if rel.is_external or rel.reltype in RENDER_SKIPPED_RELTYPES:
+                    continue
+                digest.update(rel.rId.encode())
+                digest.update(RenderCache._part_digest(rel.target_part, digests))
+            digests[part.partname] = digest.digest()
+        return digests[part.partname]
+
+    @staticmethod
+    def _touch(path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _write(path, data):
+        """Write a cache file atomically; returns False if it couldn't be written."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return True
+        except OSError:
+            return False
+
+
 def create_grids(
     image_paths,
     cols,
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Pool of warm headless LibreOffice instances for conversions and macro runs.
+
+Starting soffice costs several seconds per call. OfficePool keeps N instances
+running, each with its own user profile directory and listening on a local UNO
+socket, and dispatches jobs to whichever instance is idle. Jobs queue up when all
+instances are busy, run with a per-job timeout, and an instance that crashes or
+times out is killed and replaced. Instances are recycled after a fixed number of
+jobs to keep LibreOffice memory growth in check.
+
+Requires the LibreOffice Python bindings (the `uno` module, shipped with
+LibreOffice or as python3-uno). Without them, `is_available()` returns False and
+callers should fall back to spawning soffice per call.
+
+Example usage:
+    from office_pool import OfficePool
+
+    with OfficePool(size=2) as pool:
+        pdf_path = pool.convert("deck.pptx", "out", "pdf")
+        html_path = pool.convert("report.docx", "out", "html:HTML", timeout=20)
+        pool.run_macro("model.xlsx", lambda doc: doc.calculateAll())
+
+    # Or share one pool per process
+    pool = get_default_pool()
+"""
+
+import atexit
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+except ImportError:
+    uno = None
+
+# Export filters used when convert_to only names the target extension
+DEFAULT_FILTERS = {
+    ("pdf", ".docx"): "writer_pdf_Export",
+    ("pdf", ".pptx"): "impress_pdf_Export",
+    ("pdf", ".xlsx"): "calc_pdf_Export",
+    ("html", ".docx"): "HTML (StarWriter)",
+    ("html", ".pptx"): "impress_html_Export",
+    ("html", ".xlsx"): "HTML (StarCalc)",
+}
+
+# Store filters used by run_macro when saving a document back in place
+STORE_FILTERS = {
+    ".docx": "MS Word 2007 XML",
+    ".pptx": "Impress MS PowerPoint 2007 XML",
+    ".xlsx": "Calc MS Excel 2007 XML",
+}
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def is_available():
+    """Check whether the UNO bindings and a soffice binary are installed."""
+    return uno is not None and shutil.which("soffice") is not None
+
+
+def get_default_pool(size=None, max_jobs=None):
+    """Get the process-wide shared pool, starting it on first use.
+
+    Args:
+        size: Number of instances (default: OFFICE_POOL_SIZE env var or 2)
+        max_jobs: Jobs per instance before recycling (default: OFFICE_POOL_MAX_JOBS or 50)
+
+    Returns:
+        OfficePool: The shared pool (shut down automatically at interpreter exit)
+
+    Raises:
+        RuntimeError: If the UNO bindings or soffice are not available
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = OfficePool(
+                size=size or int(os.environ.get("OFFICE_POOL_SIZE", 2)),
+                max_jobs=max_jobs or int(os.environ.get("OFFICE_POOL_MAX_JOBS", 50)),
+            )
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
+
+
+class OfficeJobError(RuntimeError):
+    """Raised when a pooled conversion or macro run fails."""
+
+
+class OfficeInstance:
+    """A single headless soffice process with a private profile and UNO socket."""
+
+    def __init__(self, startup_timeout=60):
+        """Start soffice and connect to it over UNO.
+
+        Args:
+            startup_timeout: Seconds to wait for the UNO socket to accept connections
+
+        Raises:
+            OfficeJobError: If soffice does not come up within startup_timeout
+        """
+        self.port = _free_port()
+        self.profile_dir = tempfile.mkdtemp(prefix="soffice_profile_")
+        self.jobs_done = 0
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+                f"--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self.desktop = self._connect(startup_timeout)
+        except BaseException:
+            # Don't leave soffice or its profile behind, whatever stopped the startup
+            self.terminate()
+            raise
+
+    def _connect(self, startup_timeout):
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        url = f"uno:socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext"
+
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if self.process.poll() is not None:
+                raise OfficeJobError("soffice exited during startup")
+            try:
+                context = resolver.resolve(url)
+                return context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", context
+                )
+            except NoConnectException:
+                if time.monotonic() > deadline:
+                    raise OfficeJobError(
+                        f"soffice did not start within {startup_timeout}s"
+                    )
+                time.sleep(0.25)
+
+    def is_alive(self):
+        """Check whether the soffice process is still running."""
+        return self.process.poll() is None
+
+    def load(self, path):
+        """Open a document hidden and return its UNO component."""
+        return self.desktop.loadComponentFromURL(
+            Path(path).absolute().as_uri(), "_blank", 0, _properties(Hidden=True)
+        )
+
+    def terminate(self):
+        """Stop the soffice process and remove its profile directory."""
+        if self.process.poll() is None:
+            self.process.kill()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                pass
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class OfficePool:
+    """Fixed-size pool of warm OfficeInstance workers.
+
+    Attributes:
+        size: Number of soffice instances kept running
+        max_jobs: Jobs an instance runs before it is replaced with a fresh one
+        startup_timeout: Seconds to wait for a new instance to accept connections
+    """
+
+    def __init__(self, size=2, max_jobs=50, startup_timeout=60):
+        """Start `size` soffice instances.
+
+        Args:
+            size: Number of instances (default: 2)
+            max_jobs: Jobs per instance before recycling (default: 50)
+            startup_timeout: Seconds to wait for each instance to start (default: 60)
+
+        Raises:
+            RuntimeError: If the UNO bindings or soffice are not available
+            OfficeJobError: If an instance fails to start (the ones already started
+                            are terminated)
+        """
+        if not is_available():
+            raise RuntimeError(
+                "OfficePool requires soffice and the LibreOffice Python bindings (uno)"
+            )
+        self.size = size
+        self.max_jobs = max_jobs
+        self.startup_timeout = startup_timeout
+        self._idle = queue.Queue()
+        self._closed = False
+        try:
+            for _ in range(size):
+                self._idle.put(OfficeInstance(startup_timeout))
+        except BaseException:
+            # The caller gets no pool to shut down, so stop the instances started so far
+            self.shutdown()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def convert(self, doc_path, outdir, convert_to, timeout=60, queue_timeout=None):
+        """Convert a document, mirroring `soffice --convert-to <convert_to> --outdir <outdir>`.
+
+        Args:
+            doc_path: Document to convert
+            outdir: Directory for the converted file
+            convert_to: Target extension, optionally with an export filter ("pdf", "html:HTML")
+            timeout: Seconds the conversion may take before the instance is killed
+            queue_timeout: Seconds to wait for an idle instance (default: wait forever)
+
+        Returns:
+            Path: Path of the converted file ({outdir}/{stem}.{extension})
+
+        Raises:
+            OfficeJobError: If the conversion fails or times out
+        """
+        doc_path = Path(doc_path)
+        extension, _, filter_name = convert_to.partition(":")
+        if not filter_name:
+            filter_name = DEFAULT_FILTERS.get((extension, doc_path.suffix.lower()), "")
+        output_path = Path(outdir) / f"{doc_path.stem}.{extension}"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        def job(instance):
+            document = instance.load(doc_path)
+            try:
+                document.storeToURL(
+                    output_path.absolute().as_uri(), _properties(FilterName=filter_name)
+                )
+            finally:
+                document.close(True)
+
+        self._run(job, timeout, queue_timeout)
+        if not output_path.exists():
+            raise OfficeJobError(f"Conversion produced no output: {output_path}")
+        return output_path
+
+    def run_macro(self, doc_path, macro, save=True, timeout=60, queue_timeout=None):
+        """Open a document, run a Python callable against it, and optionally save it.
+
+        The callable receives the loaded UNO document component, which plays the role
+        of `ThisComponent` in a Basic macro (e.g. `lambda doc: doc.calculateAll()`).
+
+        Args:
+            doc_path: Document to open
+            macro: Callable taking the UNO document component
+            save: If True, store the document back to doc_path in its original format
+            timeout: Seconds the job may take before the instance is killed
+            queue_timeout: Seconds to wait for an idle instance (default: wait forever)
+
+        Returns:
+            The macro's return value
+
+        Raises:
+            OfficeJobError: If the macro fails or times out
+        """
+        doc_path = Path(doc_path)
+
+        def job(instance):
+            document = instance.load(doc_path)
+            try:
+                result = macro(document)
+                if save:
+                    filter_name = STORE_FILTERS.get(doc_path.suffix.lower())
+                    properties = _properties(FilterName=filter_name) if filter_name else ()
+                    document.storeToURL(doc_path.absolute().as_uri(), properties)
+                return result
+            finally:
+                document.close(True)
+
+        return self._run(job, timeout, queue_timeout)
+
+    def shutdown(self):
+        """Terminate all idle instances. Busy instances are terminated when released."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().terminate()
+            except queue.Empty:
+                break
+
+    def _run(self, job, timeout, queue_timeout):
+        """Run a job on an idle instance, replacing the instance if it fails."""
+        if self._closed:
+            raise OfficeJobError("OfficePool has been shut down")
+        try:
+            instance = self._idle.get(timeout=queue_timeout)
+        except queue.Empty:
+            raise OfficeJobError("Timed out waiting for an idle soffice instance")
+
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = job(instance)
+            except Exception as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+        worker.join(timeout)
+
+        healthy = not worker.is_alive() and instance.is_alive()
+        instance.jobs_done += 1
+        self._release(instance, recycle=not healthy)
+
+        if worker.is_alive():
+            raise OfficeJobError(f"soffice job timed out after {timeout}s")
+        if "error" in outcome:
+            raise OfficeJobError(f"soffice job failed: {outcome['error']}")
+        return outcome.get("result")
+
+    def _release(self, instance, recycle=False):
+        """Return an instance to the pool, replacing it if unhealthy or worn out."""
+        if self._closed:
+            instance.terminate()
+            return
+        if recycle or instance.jobs_done >= self.max_jobs:
+            instance.terminate()
+            try:
+                instance = OfficeInstance(self.startup_timeout)
+            except OfficeJobError:
+                # Keep retrying in the background rather than shrinking the pool for good
+                threading.Thread(target=self._replace_later, daemon=True).start()
+                return
+        self._idle.put(instance)
+
+    def _replace_later(self):
+        while not self._closed:
+            time.sleep(1)
+            try:
+                self._idle.put(OfficeInstance(self.startup_timeout))
+                return
+            except OfficeJobError:
+                continue
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _properties(**kwargs):
+    properties = []
+    for name, value in kwargs.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
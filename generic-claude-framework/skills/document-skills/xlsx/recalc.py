@@ -50,13 +50,15 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+def recalc(filename, timeout=30, pool=None):
     """
     Recalculate formulas in Excel file and report any errors
     
     Args:
         filename: Path to Excel file
         timeout: Maximum time to wait for recalculation (seconds)
+        pool: Optional office_pool.OfficePool to recalculate on a warm LibreOffice
+              instance instead of spawning soffice (no macro setup needed)
     
     Returns:
         dict with error locations and counts
@@ -66,6 +68,13 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
+    if pool is not None:
+        try:
+            pool.run_macro(abs_path, lambda doc: doc.calculateAll(), timeout=timeout)
+        except RuntimeError as e:
+            return {'error': str(e)}
+        return check_formula_errors(filename)
+    
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -98,6 +107,19 @@ def recalc(filename, timeout=30):
         else:
             return {'error': error_msg}
     
+    return check_formula_errors(filename)
+
+
+def check_formula_errors(filename):
+    """
+    Scan a recalculated Excel file for formula errors
+    
+    Args:
+        filename: Path to Excel file
+    
+    Returns:
+        dict with error locations and counts
+    """
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)